@@ -0,0 +1 @@
+"""Benchmarks of MkDocs. See `python -m benchmarks --help`."""
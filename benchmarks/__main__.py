@@ -0,0 +1,200 @@
+"""
+# MkDocs benchmarks
+
+Time the stages of the build of generated projects, and compare the results across commits.
+
+From the root of the MkDocs git repo, use:
+
+    python -m benchmarks run --pages 1000 --pages 10000 --output results.json
+    python -m benchmarks compare baseline.json results.json
+    python -m benchmarks generate --pages 1000 /tmp/project
+    python -m benchmarks memory --pages 50000
+    python -m benchmarks yaml --pages 10000
+
+See `python -m benchmarks --help` for all options.
+"""
+
+import json
+import logging
+import sys
+import tempfile
+
+import click
+
+from benchmarks import memory, parsing, sitegen, suite
+
+log = logging.getLogger('mkdocs')
+
+pages_help = "The number of pages of the generated project. Can be supplied multiple times."
+shape_help = (
+    "The shape of the navigation of the generated project: all pages at the root (flat), "
+    "in one level of sections (wide) or in several levels of sections (deep). "
+    "Can be supplied multiple times."
+)
+links_help = "The number of links from each page to other pages."
+media_help = "The number of images in the project."
+repeat_help = "The number of times each stage is run."
+stage_help = "Only run the given stage. Can be supplied multiple times."
+output_help = "Write the results to this file, as JSON."
+shared_help = "One page in this many has the same front matter as the others of its kind (0: none)."
+threshold_help = "Fail if a stage is slower than in the baseline by more than this ratio."
+
+
+def _site_options(f):
+    f = click.option('--media', default=100, show_default=True, help=media_help)(f)
+    f = click.option('--links', default=5, show_default=True, help=links_help)(f)
+    f = click.option(
+        '--shape',
+        type=click.Choice(sorted(sitegen.SHAPES)),
+        multiple=True,
+        default=['wide'],
+        show_default=True,
+        help=shape_help,
+    )(f)
+    f = click.option(
+        '--pages', type=int, multiple=True, default=[1000], show_default=True, help=pages_help
+    )(f)
+    return f
+
+
+@click.group()
+def cli():
+    """Benchmark MkDocs on generated projects."""
+
+
+@cli.command(name='generate')
+@_site_options
+@click.argument('project_dir', type=click.Path(file_okay=False))
+def generate_command(pages, shape, links, media, project_dir):
+    """Generate a project to benchmark with."""
+    config_file = sitegen.generate_site(
+        project_dir, pages=pages[0], shape=shape[0], links=links, media=media
+    )
+    click.echo(f"Generated {config_file}")
+
+
+@cli.command(name='run')
+@_site_options
+@click.option('--repeat', default=3, show_default=True, help=repeat_help)
+@click.option('--stage', type=click.Choice(suite.STAGES), multiple=True, help=stage_help)
+@click.option('--output', type=click.Path(dir_okay=False), help=output_help)
+def run_command(pages, shape, links, media, repeat, stage, output):
+    """Time the stages of the build of generated projects."""
+    # The builds are benchmarked, not their logs.
+    log.setLevel(logging.ERROR)
+
+    results = {}
+    for page_count in pages:
+        for site_shape in shape:
+            name = f'{page_count}-{site_shape}'
+            with tempfile.TemporaryDirectory(prefix='mkdocs_project_') as project_dir:
+                click.echo(f"Generating the '{name}' project...", err=True)
+                config_file = sitegen.generate_site(
+                    project_dir, pages=page_count, shape=site_shape, links=links, media=media
+                )
+                click.echo(f"Running the benchmarks of the '{name}' project...", err=True)
+                times = suite.run_suite(config_file, repeat, stage or suite.STAGES)
+            results[name] = {
+                'parameters': dict(pages=page_count, shape=site_shape, links=links, media=media),
+                'stages': {key: suite.summarize(runs) for key, runs in times.items()},
+            }
+            _echo_table(
+                name,
+                [
+                    (key, f"{summary['median']:.3f}", f"{summary['min']:.3f}")
+                    for key, summary in results[name]['stages'].items()
+                ],
+                ('Median (s)', 'Min (s)'),
+            )
+
+    report = {'environment': suite.get_environment(), 'results': results}
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"Results written to '{output}'", err=True)
+
+
+@cli.command(name='memory')
+@click.option('--pages', type=int, default=50000, show_default=True, help=pages_help)
+@click.option('--media', type=int, default=10000, show_default=True, help=media_help)
+@click.option('--output', type=click.Path(dir_okay=False), help=output_help)
+def memory_command(pages, media, output):
+    """Measure the memory used by the files, pages and tables of contents of a project."""
+    results = memory.measure_memory(page_count=pages, media=media)
+    _echo_table(
+        f'{pages} pages, {media} media files',
+        [
+            (
+                name,
+                result['count'],
+                f"{result['bytes'] / 2**20:.1f}",
+                result['bytes'] // result['count'],
+                result['bytes_without_slots'] // result['count'],
+                f"{1 - result['bytes'] / result['bytes_without_slots']:.0%}",
+            )
+            for name, result in results.items()
+        ],
+        ('Objects', 'Total (MB)', 'Each (B)', 'No slots (B)', 'Saved'),
+        first_header='Structure',
+    )
+    if output:
+        report = {'environment': suite.get_environment(), 'memory': results}
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"Results written to '{output}'", err=True)
+
+
+@cli.command(name='yaml')
+@click.option('--pages', type=int, default=10000, show_default=True, help=pages_help)
+@click.option('--shared', type=int, default=2, show_default=True, help=shared_help)
+@click.option('--repeat', default=3, show_default=True, help=repeat_help)
+def yaml_command(pages, shared, repeat):
+    """Compare the YAML loaders on the front matter and the config of a project."""
+    results = parsing.time_yaml(page_count=pages, shared=shared, repeat=repeat)
+    _echo_table(
+        f'{pages} pages',
+        [(name, f'{seconds:.3f}') for name, seconds in results.items()],
+        ('Min (s)',),
+        first_header='Parsing',
+    )
+
+
+@cli.command(name='compare')
+@click.option('--threshold', type=float, help=threshold_help)
+@click.argument('baseline', type=click.File('r'))
+@click.argument('current', type=click.File('r'))
+def compare_command(threshold, baseline, current):
+    """Compare the median times of two results files."""
+    baseline = json.load(baseline)
+    current = json.load(current)
+    regressions = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        rows = []
+        for stage, summary in result['stages'].items():
+            before = baseline['results'][name]['stages'].get(stage)
+            if before is None:
+                continue
+            ratio = summary['median'] / before['median'] if before['median'] else float('inf')
+            rows.append(
+                (stage, f"{before['median']:.3f}", f"{summary['median']:.3f}", f'{ratio:.2f}x')
+            )
+            if threshold is not None and ratio > 1 + threshold:
+                regressions.append(f'{name} {stage}')
+        _echo_table(name, rows, ('Baseline (s)', 'Current (s)', 'Ratio'))
+
+    if regressions:
+        click.echo(f"Slower than the baseline: {', '.join(regressions)}", err=True)
+        sys.exit(1)
+
+
+def _echo_table(title, rows, headers, first_header='Stage'):
+    click.echo(f'\n{title}')
+    click.echo(f'{first_header:<22}' + ''.join(f'{header:>14}' for header in headers))
+    for stage, *values in rows:
+        click.echo(f'{stage:<22}' + ''.join(f'{value:>14}' for value in values))
+
+
+if __name__ == '__main__':
+    cli()
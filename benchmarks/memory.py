@@ -0,0 +1,125 @@
+"""
+Measure the memory used by the structures which MkDocs holds for each file of a project.
+
+The `File`, `Page` and table of contents objects of a large project are all kept in memory for
+the whole build, so their size limits the size of the projects which can be built.
+"""
+
+import gc
+import os
+import tracemalloc
+
+from benchmarks import sitegen
+from mkdocs.structure import nav, pages, toc  # noqa: F401 (`nav` is imported before `pages`)
+from mkdocs.structure.files import File, Files
+
+# The config options which are read by `Page`.
+_CONFIG = {
+    'site_url': 'https://example.com/docs/',
+    'repo_url': 'https://github.com/example/docs/',
+    'edit_uri': 'edit/main/docs/',
+}
+
+
+def _get_toc_tokens(page_number, sections=3, subsections=4):
+    """Return the table of contents tokens of a page, as returned by the `toc` extension."""
+    return [
+        {
+            'level': 2,
+            'id': f'section-{page_number}-{i}',
+            'name': f'Section {i}',
+            'children': [
+                {
+                    'level': 3,
+                    'id': f'subsection-{page_number}-{i}-{j}',
+                    'name': f'Subsection {j}',
+                    'children': [],
+                }
+                for j in range(subsections)
+            ],
+        }
+        for i in range(sections)
+    ]
+
+
+def _without_slots(cls):
+    """Return a copy of `cls` which keeps its attributes in a `__dict__` instead of slots."""
+    slots = {
+        f'_{cls.__name__}{name}' if name.startswith('__') and not name.endswith('__') else name
+        for name in cls.__dict__.get('__slots__', ())
+    }
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in slots and key not in ('__slots__', '__dict__', '__weakref__')
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def _measure(func):
+    """Return the result of `func()` and the number of bytes which it allocated and kept."""
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    gc.collect()
+    return result, tracemalloc.get_traced_memory()[0] - before
+
+
+def _measure_structures(paths, docs_dir, site_dir, file_class, page_class):
+    """Return the number of bytes used by the files, pages and tables of contents of `paths`."""
+    files, files_size = _measure(
+        lambda: Files([file_class(path, docs_dir, site_dir, True) for path in paths])
+    )
+    doc_files = files.documentation_pages()
+    _, pages_size = _measure(lambda: [page_class(None, file, _CONFIG) for file in doc_files])
+
+    def add_tocs():
+        for i, file in enumerate(doc_files):
+            file.page.toc = toc.get_toc(_get_toc_tokens(i))
+
+    _, toc_size = _measure(add_tocs)
+    return {
+        'files': {'count': len(paths), 'bytes': files_size},
+        'pages': {'count': len(doc_files), 'bytes': pages_size},
+        'toc': {'count': len(doc_files), 'bytes': toc_size},
+    }
+
+
+def measure_memory(page_count=50000, shape='wide', media=10000):
+    """
+    Return the number of bytes used by the files, pages and tables of contents of a project.
+
+    Each structure is measured twice: with the classes of MkDocs, which use `__slots__`, and
+    with equivalent classes which keep their attributes in a `__dict__`.
+    """
+    docs_dir = os.path.abspath(os.path.join('project', 'docs'))
+    site_dir = os.path.abspath(os.path.join('project', 'site'))
+    paths = sitegen.get_page_paths(page_count, shape) + [f'img/image-{i}.png' for i in range(media)]
+
+    file_class, page_class = _without_slots(File), _without_slots(pages.Page)
+    # `get_toc` looks the table of contents classes up in the `toc` module.
+    toc_classes = toc.TableOfContents, toc.AnchorLink
+    unslotted_toc_classes = tuple(_without_slots(cls) for cls in toc_classes)
+
+    tracemalloc.start()
+    try:
+        # Fill the caches which are shared by all the objects before measuring anything.
+        _measure_structures(paths[:100], docs_dir, site_dir, File, pages.Page)
+        slotted = _measure_structures(paths, docs_dir, site_dir, File, pages.Page)
+        toc.TableOfContents, toc.AnchorLink = unslotted_toc_classes
+        try:
+            _measure_structures(paths[:100], docs_dir, site_dir, file_class, page_class)
+            unslotted = _measure_structures(paths, docs_dir, site_dir, file_class, page_class)
+        finally:
+            toc.TableOfContents, toc.AnchorLink = toc_classes
+    finally:
+        tracemalloc.stop()
+
+    return {
+        name: {
+            'count': result['count'],
+            'bytes': result['bytes'],
+            'bytes_without_slots': unslotted[name]['bytes'],
+        }
+        for name, result in slotted.items()
+    }
@@ -0,0 +1,77 @@
+"""
+Time the parsing of the YAML of a project: the front matter of its pages and its config file.
+
+The pure Python loaders of PyYAML are compared with the libyaml ones which MkDocs uses when
+PyYAML was built with libyaml, and with the front matter cache of `mkdocs.utils.meta`.
+"""
+
+import io
+import time
+
+import yaml
+
+from benchmarks import sitegen
+from mkdocs import utils
+from mkdocs.utils import meta
+
+
+def _get_documents(page_count, shared):
+    """
+    Return the Markdown of the pages of a project, with front matter. One page in `shared`
+    has the same front matter as the other pages generated from the same template.
+    """
+    documents = []
+    for i, path in enumerate(sitegen.get_page_paths(page_count)):
+        if shared and i % shared == 0:
+            front_matter = 'template: reference.html\ntags:\n  - reference\n  - api\n'
+        else:
+            front_matter = (
+                f'title: Page {i}\ndescription: The page {path}.\n'
+                f'tags:\n  - section-{i % 7}\n  - topic-{i % 11}\n'
+            )
+        documents.append(f'---\n{front_matter}---\n\n# Page {i}\n\nSome text.\n')
+    return documents
+
+
+def _get_config(page_count):
+    """Return a config file with all the pages of a project in its `nav`."""
+    nav = ''.join(
+        f'  - "Page {i}": {path}\n' for i, path in enumerate(sitegen.get_page_paths(page_count))
+    )
+    return f'site_name: Benchmark\nnav:\n{nav}'.encode('utf-8')
+
+
+def _time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def time_yaml(page_count=10000, shared=2, repeat=3):
+    """Return the minimum time in seconds to parse the YAML of a project in each way."""
+    documents = _get_documents(page_count, shared)
+    blocks = [meta.YAML_RE.match(doc).group(1) for doc in documents]
+    config = _get_config(page_count)
+
+    def get_data():
+        try:
+            for doc in documents:
+                meta.get_data(doc)
+        finally:
+            meta.clear_cache()
+
+    results = {
+        'front_matter_python': lambda: [yaml.load(b, yaml.SafeLoader) for b in blocks],
+        'front_matter_libyaml': lambda: [yaml.load(b, yaml.CSafeLoader) for b in blocks],
+        'front_matter_cached': get_data,
+        'config_python': lambda: utils.yaml_load(
+            io.BytesIO(config), utils.get_yaml_loader(yaml.Loader)
+        ),
+        'config_libyaml': lambda: utils.yaml_load(io.BytesIO(config)),
+    }
+    if not yaml.__with_libyaml__:  # pragma: no cover
+        results = {name: func for name, func in results.items() if 'libyaml' not in name}
+    return {name: _time(func, repeat) for name, func in results.items()}
@@ -0,0 +1,98 @@
+"""
+Generate synthetic documentation projects to benchmark MkDocs with.
+
+The generated projects are deterministic for a given set of parameters, so that the results
+of different benchmark runs can be compared.
+"""
+
+import os
+import posixpath
+import random
+
+# The shapes of the navigation, as `(depth, fanout)`: the pages are spread evenly across the
+# `fanout ** depth` directories of the deepest level of the tree.
+SHAPES = {
+    'flat': (0, 1),
+    'wide': (1, 50),
+    'deep': (4, 4),
+}
+
+# A valid 1x1 transparent PNG image.
+_PNG = bytes.fromhex(
+    '89504e470d0a1a0a0000000d4948445200000001000000010806000000'
+    '1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082'
+)
+
+_WORDS = (
+    'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor '
+    'incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud '
+    'exercitation ullamco laboris nisi aliquip ex ea commodo consequat duis aute irure'
+).split()
+
+
+def get_page_paths(pages, shape='wide'):
+    """Return the paths of the Markdown files of a project with `pages` pages."""
+    depth, fanout = SHAPES[shape]
+    dirs = ['']
+    for level in range(depth):
+        dirs = [posixpath.join(d, f'section-{level}-{i}') for d in dirs for i in range(fanout)]
+    paths = ['index.md']
+    for i in range(1, pages):
+        paths.append(posixpath.join(dirs[i % len(dirs)], f'page-{i}.md'))
+    return paths
+
+
+def _sentence(rng, words=12):
+    return ' '.join(rng.choice(_WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _page_markdown(rng, path, title, paths, links, media):
+    """Return the Markdown source of a page with headings, code, a table, links and images."""
+    src_dir = posixpath.dirname(path)
+    lines = [f'# {title}', '', _sentence(rng, 30), '']
+    for section in range(3):
+        lines += [f'## Section {section}', '', _sentence(rng, 40), '']
+        for target in rng.sample(paths, min(links, len(paths))):
+            url = posixpath.relpath(target, src_dir or '.')
+            lines.append(f'* See [{_sentence(rng, 3)}]({url}#section-{section}).')
+        lines.append('')
+        if media:
+            image = posixpath.relpath(f'img/image-{rng.randrange(media)}.png', src_dir or '.')
+            lines += [f'![{_sentence(rng, 2)}]({image})', '']
+        lines += ['```python', 'def example():', f'    return {section!r}', '```', '']
+    lines += ['| Name | Value |', '| ---- | ----- |']
+    lines += [f'| {rng.choice(_WORDS)} | {rng.randrange(1000)} |' for _ in range(5)]
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def generate_site(project_dir, pages=1000, shape='wide', links=5, media=100, seed=0):
+    """
+    Write a project with `pages` pages to `project_dir` and return the path of its config file.
+
+    Each page links to about `links` other pages, spread across its sections, and the project
+    contains `media` images which are referenced by the pages.
+    """
+    rng = random.Random(seed)
+    docs_dir = os.path.join(project_dir, 'docs')
+    paths = get_page_paths(pages, shape)
+    links_per_section = max(1, links // 3) if links else 0
+
+    for i, path in enumerate(paths):
+        abs_path = os.path.join(docs_dir, *path.split('/'))
+        os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+        title = 'Home' if i == 0 else f'Page {i}'
+        with open(abs_path, 'w', encoding='utf-8') as f:
+            f.write(_page_markdown(rng, path, title, paths, links_per_section, media))
+
+    if media:
+        os.makedirs(os.path.join(docs_dir, 'img'), exist_ok=True)
+        for i in range(media):
+            with open(os.path.join(docs_dir, 'img', f'image-{i}.png'), 'wb') as f:
+                f.write(_PNG)
+
+    config_file = os.path.join(project_dir, 'mkdocs.yml')
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write(f'site_name: Benchmark ({pages} pages, {shape})\n')
+        f.write('markdown_extensions:\n  - toc:\n      permalink: true\n  - tables\n')
+    return config_file
@@ -0,0 +1,161 @@
+"""
+Time the stages of a build of a generated project.
+
+Each stage is run `repeat` times, on a fresh config each time, and the wall times of all the
+runs are recorded so that the results can be compared across commits.
+"""
+
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import mkdocs
+from mkdocs.commands import build
+from mkdocs.config import load_config
+from mkdocs.contrib.search.search_index import SearchIndex
+from mkdocs.structure.files import get_files
+from mkdocs.structure.nav import get_navigation
+
+# The stages of the suite, in the order in which they run.
+STAGES = (
+    'get_files',
+    'get_navigation',
+    'read_page_heads',
+    'populate_pages',
+    'build_pages',
+    'search_index',
+    'build',
+    'rebuild',
+    'rebuild_incremental',
+)
+
+
+class _Timer:
+    """Record the wall time of blocks of code by stage."""
+
+    def __init__(self):
+        self.times = {}
+
+    def __call__(self, stage):
+        self._stage = stage
+        return self
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.times.setdefault(self._stage, []).append(time.perf_counter() - self._start)
+
+
+def _touch_page(config_file):
+    """Modify a page of the project, as an author would while the development server runs."""
+    path = os.path.join(os.path.dirname(config_file), 'docs', 'index.md')
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('\nEdited.\n')
+
+
+def _run_stages(config_file, site_dir, timer):
+    """Run the stages of a build one by one, like `build.build` does."""
+    config = load_config(config_file=config_file, site_dir=site_dir)
+    config = config['plugins'].run_event('config', config)
+    config['plugins'].run_event('pre_build', config=config)
+
+    with timer('get_files'):
+        files = get_files(config)
+        env = config['theme'].get_env()
+        files.add_files_from_theme(env, config)
+
+    with timer('get_navigation'):
+        nav = get_navigation(files, config)
+
+    with timer('read_page_heads'):
+        build._read_page_heads(files, config)
+
+    with timer('populate_pages'):
+        for file in files.documentation_pages():
+            build._populate_page(file.page, config, files)
+
+    doc_files = files.documentation_pages()
+    with timer('build_pages'):
+        for file in doc_files:
+            build._build_page(file.page, config, doc_files, nav, env)
+
+    with timer('search_index'):
+        index = SearchIndex(**config['plugins']['search'].config)
+        for file in doc_files:
+            index.add_entry_from_context(file.page)
+        index.generate_search_index()
+
+
+def run_suite(config_file, repeat=3, stages=STAGES):
+    """Run the stages of the suite on a project and return the times of each run by stage."""
+    timer = _Timer()
+    with tempfile.TemporaryDirectory(prefix='mkdocs_benchmark_') as tmp:
+        site_dir = os.path.join(tmp, 'site')
+        cache_dir = os.path.join(tmp, 'cache')
+        for _ in range(repeat):
+            _run_stages(config_file, site_dir, timer)
+
+            if 'build' in stages:
+                with timer('build'):
+                    build.build(load_config(config_file=config_file, site_dir=site_dir))
+
+            if 'rebuild' in stages:
+                # What `mkdocs serve` does when a page is edited.
+                _touch_page(config_file)
+                config = load_config(config_file=config_file, site_dir=site_dir)
+                with timer('rebuild'):
+                    build.build(config, live_server=True)
+
+            if 'rebuild_incremental' in stages:
+                # What `mkdocs serve --incrementalreload` does when a page is edited.
+                options = dict(
+                    config_file=config_file,
+                    site_dir=site_dir,
+                    cache_dir=cache_dir,
+                    incremental=True,
+                    use_cache=True,
+                )
+                build.build(load_config(**options), live_server=True)
+                _touch_page(config_file)
+                config = load_config(**options)
+                with timer('rebuild_incremental'):
+                    build.build(config, live_server=True)
+
+    return {stage: timer.times[stage] for stage in STAGES if stage in timer.times}
+
+
+def summarize(times):
+    """Return the statistics of the times of a stage."""
+    return {
+        'min': min(times),
+        'median': statistics.median(times),
+        'max': max(times),
+        'runs': times,
+    }
+
+
+def get_environment():
+    """Return a description of the environment of the benchmark."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'mkdocs_version': mkdocs.__version__,
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    }
@@ -10,7 +10,7 @@ import warnings
 
 import click
 
-from mkdocs import __version__, config, utils
+from mkdocs import __version__
 
 if sys.platform.startswith("win"):
     try:
@@ -90,6 +90,27 @@ class State:
         self.logger.addHandler(self.stream)
 
 
+class ThemeChoice(click.Choice):
+    """The names of the installed themes, which are only looked up when a theme is given."""
+
+    def __init__(self):
+        super().__init__(())
+
+    @property
+    def choices(self):
+        if self._choices is None:
+            from mkdocs.utils import entry_points
+
+            self._choices = tuple(
+                dict.fromkeys(entry_points.get_entry_point_names('mkdocs.themes'))
+            )
+        return self._choices
+
+    @choices.setter
+    def choices(self, value):
+        self._choices = None
+
+
 pass_state = click.make_pass_decorator(State, ensure=True)
 
 clean_help = "Remove old files from the site_dir before building (the default)."
@@ -97,7 +118,6 @@ config_help = "Provide a specific MkDocs config"
 dev_addr_help = "IP address and port to serve documentation locally (default: localhost:8000)"
 strict_help = "Enable strict mode. This will cause MkDocs to abort the build on any warnings."
 theme_help = "The theme to use when building your documentation."
-theme_choices = utils.get_theme_names()
 site_dir_help = "The directory to output the result of the documentation build."
 use_directory_urls_help = "Use directory URLs when building pages (the default)."
 reload_help = "Enable the live reloading in the development server (this is the default)"
@@ -126,7 +146,46 @@ watch_theme_help = (
     "Ignored when live reload is not used."
 )
 shell_help = "Use the shell when invoking Git."
+cache_help = (
+    "Enable or disable the persistent cache of rendered Markdown. "
+    "This overrides the value specified in config"
+)
+incremental_help = (
+    "Only render the pages whose inputs have changed since the previous incremental build. "
+    "This overrides the value specified in config"
+)
+incremental_reload_help = (
+    "Enable the live reloading in the development server, but only re-render the pages "
+    "whose inputs have changed"
+)
+skip_unchanged_help = (
+    "Keep the files of the previous build whose content is unchanged, instead of cleaning "
+    "the site_dir. This overrides the value specified in config"
+)
+atomic_help = (
+    "Build into a staging directory which replaces the site_dir once the build has succeeded. "
+    "This overrides the value specified in config"
+)
+precompress_help = (
+    "Write a compressed .gz companion of each HTML, CSS, JavaScript, JSON and XML file of "
+    "the site. This overrides the value specified in config"
+)
+profile_help = (
+    "Write a report of the time spent in each phase, page and template of the build to "
+    "the given file, as JSON, and print a summary of it"
+)
+jobs_help = (
+    "The number of worker processes used to render the pages. "
+    "Use 0 for one process per CPU core. This overrides the value specified in config"
+)
 watch_help = "A directory or file to watch for live reloading. Can be supplied multiple times."
+daemon_help = (
+    "Send the build to the running MkDocs daemon (see `mkdocs daemon`) instead of building in "
+    "this process. Builds in this process if no daemon is running"
+)
+socket_help = "The path of the Unix socket of the daemon (default: in the temporary directory)."
+daemon_config_help = "Load this config before the first build, to import its plugins and theme."
+stop_help = "Stop the running daemon."
 
 
 def add_options(*opts):
@@ -176,7 +235,7 @@ common_config_options = add_options(
     # Don't override config value if user did not specify --strict flag
     # Conveniently, load_config drops None values
     click.option('-s', '--strict', is_flag=True, default=None, help=strict_help),
-    click.option('-t', '--theme', type=click.Choice(theme_choices), help=theme_help),
+    click.option('-t', '--theme', type=ThemeChoice(), help=theme_help),
     # As with --strict, set the default to None so that this doesn't incorrectly
     # override the config file
     click.option(
@@ -211,6 +270,9 @@ def cli():
 @click.option('--livereload', 'livereload', flag_value='livereload', help=reload_help, default=True)
 @click.option('--no-livereload', 'livereload', flag_value='no-livereload', help=no_reload_help)
 @click.option('--dirtyreload', 'livereload', flag_value='dirty', help=dirty_reload_help)
+@click.option(
+    '--incrementalreload', 'livereload', flag_value='incremental', help=incremental_reload_help
+)
 @click.option('--watch-theme', help=watch_theme_help, is_flag=True)
 @click.option(
     '-w', '--watch', help=watch_help, type=click.Path(exists=True), multiple=True, default=[]
@@ -229,13 +291,54 @@ def serve_command(dev_addr, livereload, watch, **kwargs):
 @click.option('-c', '--clean/--dirty', is_flag=True, default=True, help=clean_help)
 @common_config_options
 @click.option('-d', '--site-dir', type=click.Path(), help=site_dir_help)
+@click.option('-j', '--jobs', type=int, help=jobs_help)
+@click.option('--cache/--no-cache', 'use_cache', default=None, help=cache_help)
+@click.option('--incremental/--no-incremental', default=None, help=incremental_help)
+@click.option('--skip-unchanged/--no-skip-unchanged', default=None, help=skip_unchanged_help)
+@click.option('--atomic/--no-atomic', 'atomic_build', default=None, help=atomic_help)
+@click.option('--precompress/--no-precompress', default=None, help=precompress_help)
+@click.option('--profile', type=click.Path(dir_okay=False), help=profile_help)
+@click.option('--daemon', 'use_daemon', is_flag=True, help=daemon_help)
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), help=socket_help)
 @common_options
-def build_command(clean, **kwargs):
+def build_command(clean, profile, use_daemon, socket_path, **kwargs):
     """Build the MkDocs documentation"""
+    if use_daemon:
+        from mkdocs.commands import daemon
+
+        state = click.get_current_context().ensure_object(State)
+        if daemon.request_build(
+            kwargs,
+            dirty=not clean,
+            profile=profile,
+            socket_path=socket_path,
+            log_level=state.stream.level,
+        ):
+            return
+        log.info("No MkDocs daemon is running. Building in this process.")
+
+    from mkdocs import config
     from mkdocs.commands import build
 
     _enable_warnings()
-    build.build(config.load_config(**kwargs), dirty=not clean)
+    build.build(config.load_config(**kwargs), dirty=not clean, profile=profile)
+
+
+@cli.command(name="daemon")
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), help=socket_help)
+@click.option('-f', '--config-file', type=click.File('rb'), help=daemon_config_help)
+@click.option('--stop', is_flag=True, help=stop_help)
+@common_options
+def daemon_command(socket_path, config_file, stop):
+    """Run a daemon which builds the documentation for `mkdocs build --daemon`"""
+    from mkdocs.commands import daemon
+
+    if stop:
+        if not daemon.stop(socket_path):
+            log.info("No MkDocs daemon is running.")
+        return
+    _enable_warnings()
+    daemon.serve(socket_path=socket_path, config_file=config_file)
 
 
 @cli.command(name="gh-deploy")
@@ -254,6 +357,7 @@ def gh_deploy_command(
     clean, message, remote_branch, remote_name, force, no_history, ignore_version, shell, **kwargs
 ):
     """Deploy your documentation to GitHub Pages"""
+    from mkdocs import config
     from mkdocs.commands import build, gh_deploy
 
     _enable_warnings()
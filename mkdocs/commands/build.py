@@ -1,6 +1,10 @@
-import gzip
+import contextlib
+import functools
 import logging
+import multiprocessing
 import os
+import shutil
+import time
 from urllib.parse import urlsplit
 
 import jinja2
@@ -11,6 +15,11 @@ from mkdocs import utils
 from mkdocs.exceptions import Abort, BuildError
 from mkdocs.structure.files import Files, get_files
 from mkdocs.structure.nav import get_navigation
+from mkdocs.structure.pages import MarkdownEngine, read_page_heads
+from mkdocs.utils import compress, meta, sitemap
+from mkdocs.utils.cache import DiskCache, get_key
+from mkdocs.utils.profiler import BuildProfiler, EventTimings
+from mkdocs.utils.writer import BackgroundWriter
 
 
 class DuplicateFilter:
@@ -28,6 +37,9 @@ class DuplicateFilter:
 log = logging.getLogger(__name__)
 log.addFilter(DuplicateFilter())
 
+# The profiler of the current build. It is only enabled when a profile is requested.
+_profiler = BuildProfiler(enabled=False)
+
 
 def get_context(nav, files, config, page=None, base_url=''):
     """
@@ -57,6 +69,14 @@ def get_context(nav, files, config, page=None, base_url=''):
     }
 
 
+def _write_file(content, output_path, writer=None):
+    """Write content to output_path, in the background if a `writer` is given."""
+    if writer is not None:
+        writer.write_file(content, output_path)
+    else:
+        utils.write_file(content, output_path)
+
+
 def _build_template(name, template, files, config, nav):
     """
     Return rendered output for given template as a string.
@@ -92,7 +112,71 @@ def _build_template(name, template, files, config, nav):
     return output
 
 
-def _build_theme_template(template_name, env, files, config, nav):
+def _stream_template(name, template, files, config, nav, pages=None):
+    """
+    Yield the rendered output of the given template in chunks, as it is rendered, unless
+    `post_template` plugin events need the whole output at once. With `pages`, the template
+    is rendered with those pages instead of all the documentation pages.
+    """
+
+    # Run `pre_template` plugin events.
+    template = config['plugins'].run_event(
+        'pre_template', template, template_name=name, config=config
+    )
+
+    base_url = utils.get_relative_url('.', name)
+    context = get_context(nav, files if pages is None else pages, config, base_url=base_url)
+
+    # Run `template_context` plugin events.
+    context = config['plugins'].run_event(
+        'template_context', context, template_name=name, config=config
+    )
+
+    if not config['plugins'].events['post_template']:
+        yield from template.generate(context)
+        return
+
+    output = template.render(context)
+
+    # Run `post_template` plugin events.
+    yield config['plugins'].run_event('post_template', output, template_name=name, config=config)
+
+
+def _build_sitemap(template, files, config, nav, writer=None):
+    """
+    Build the sitemap, which is written as it is rendered. The sitemap of a site with more than
+    `sitemap.MAX_URLS` pages is split into shards, which are listed by a sitemap index.
+    """
+
+    pages = files.documentation_pages() if isinstance(files, Files) else files
+    output_path = os.path.join(config['site_dir'], 'sitemap.xml')
+    options = dict(
+        compress=not _is_precompressed(config, output_path),
+        skip_unchanged=writer is not None and writer.skip_unchanged,
+    )
+    if options['compress']:
+        log.debug("Gzipping template: sitemap.xml")
+
+    outputs = []
+    shards = sitemap.get_shards(pages)
+    if shards:
+        log.debug(f"Splitting the sitemap into {len(shards)} files.")
+        for name, shard in shards:
+            chunks = _stream_template('sitemap.xml', template, files, config, nav, shard)
+            outputs += sitemap.write(chunks, os.path.join(config['site_dir'], name), **options)
+        chunks = sitemap.get_index(shards, config['site_url'])
+    else:
+        chunks = _stream_template('sitemap.xml', template, files, config, nav)
+    outputs += sitemap.write(chunks, output_path, **options)
+
+    if not outputs:
+        log.info("Template skipped: 'sitemap.xml' generated empty output.")
+    elif writer is not None:
+        for path in outputs:
+            writer.add_output(path)
+
+
+def _build_theme_template(template_name, env, files, config, nav, writer=None):
     """Build a template using the theme environment."""
 
     log.debug(f"Building theme template: {template_name}")
@@ -103,26 +187,29 @@ def _build_theme_template(template_name, env, files, config, nav):
         log.warning(f"Template skipped: '{template_name}' not found in theme directories.")
         return
 
-    output = _build_template(template_name, template, files, config, nav)
+    if template_name == 'sitemap.xml':
+        with _profiler.template(template_name):
+            _build_sitemap(template, files, config, nav, writer)
+        return
+
+    with _profiler.template(template_name):
+        output = _build_template(template_name, template, files, config, nav)
 
     if output.strip():
         output_path = os.path.join(config['site_dir'], template_name)
-        utils.write_file(output.encode('utf-8'), output_path)
-
-        if template_name == 'sitemap.xml':
-            log.debug(f"Gzipping template: {template_name}")
-            gz_filename = f'{output_path}.gz'
-            with open(gz_filename, 'wb') as f:
-                timestamp = utils.get_build_timestamp()
-                with gzip.GzipFile(
-                    fileobj=f, filename=gz_filename, mode='wb', mtime=timestamp
-                ) as gz_buf:
-                    gz_buf.write(output.encode('utf-8'))
+        _write_file(output.encode('utf-8'), output_path, writer)
     else:
         log.info(f"Template skipped: '{template_name}' generated empty output.")
 
 
-def _build_extra_template(template_name, files, config, nav):
+def _is_precompressed(config, path):
+    """Return True if the compressed companion of `path` is written by the compression stage."""
+    return config['precompress'] and compress.is_compressible(
+        path, tuple(ext.lower() for ext in config['precompress_extensions'])
+    )
+
+
+def _build_extra_template(template_name, files, config, nav, writer=None):
     """Build user templates which are not part of the theme."""
 
     log.debug(f"Building extra template: {template_name}")
@@ -139,15 +226,23 @@ def _build_extra_template(template_name, files, config, nav):
         log.warning(f"Error reading template '{template_name}': {e}")
         return
 
-    output = _build_template(template_name, template, files, config, nav)
+    with _profiler.template(template_name):
+        output = _build_template(template_name, template, files, config, nav)
 
     if output.strip():
-        utils.write_file(output.encode('utf-8'), file.abs_dest_path)
+        _write_file(output.encode('utf-8'), file.abs_dest_path, writer)
     else:
         log.info(f"Template skipped: '{template_name}' generated empty output.")
 
 
-def _populate_page(page, config, files, dirty=False):
+def _log_page_error(message, error):
+    # Prevent duplicated the error message because it will be printed immediately afterwards.
+    if not isinstance(error, BuildError):
+        message += f" {error}"
+    log.error(message)
+
+
+def _populate_page(page, config, files, dirty=False, cache=None, engine=None):
     """Read page content from docs_dir and render Markdown."""
 
     try:
@@ -156,85 +251,729 @@ def _populate_page(page, config, files, dirty=False):
         if dirty and not page.file.is_modified():
             return
 
-        # Run the `pre_page` plugin event
-        page = config['plugins'].run_event('pre_page', page, config=config, files=files)
+        src_uri = page.file.src_uri
 
-        page.read_source(config)
+        with _profiler.page_step(src_uri, 'read'):
+            # Run the `pre_page` plugin event
+            page = config['plugins'].run_event('pre_page', page, config=config, files=files)
 
-        # Run `page_markdown` plugin events.
-        page.markdown = config['plugins'].run_event(
-            'page_markdown', page.markdown, page=page, config=config, files=files
-        )
+            page.read_source(config)
 
-        page.render(config, files)
+        with _profiler.page_step(src_uri, 'markdown'):
+            # Run `page_markdown` plugin events.
+            page.markdown = config['plugins'].run_event(
+                'page_markdown', page.markdown, page=page, config=config, files=files
+            )
 
-        # Run `page_content` plugin events.
-        page.content = config['plugins'].run_event(
-            'page_content', page.content, page=page, config=config, files=files
-        )
+        with _profiler.page_step(src_uri, 'render'):
+            page.render(config, files, cache=cache, engine=engine)
+
+            # Run `page_content` plugin events.
+            page.content = config['plugins'].run_event(
+                'page_content', page.content, page=page, config=config, files=files
+            )
     except Exception as e:
-        message = f"Error reading page '{page.file.src_uri}':"
-        # Prevent duplicated the error message because it will be printed immediately afterwards.
-        if not isinstance(e, BuildError):
-            message += f" {e}"
-        log.error(message)
+        _log_page_error(f"Error reading page '{page.file.src_uri}':", e)
         raise
 
 
-def _build_page(page, config, doc_files, nav, env, dirty=False):
-    """Pass a Page to theme template and write output to site_dir."""
+def _read_page_heads(files, config):
+    """
+    Read the meta-data and the titles of all pages from the heads of their files, so that the
+    navigation has its titles before the pages are read in full.
+    """
 
-    try:
-        # When --dirty is used, only build the page if the file has been modified since the
-        # previous build of the output.
-        if dirty and not page.file.is_modified():
-            return
+    if config['plugins'].events['page_read_source']:
+        # Plugins provide the source of some pages, only as a whole.
+        return
+    workers = config['jobs'] if config['jobs'] >= 1 else os.cpu_count() or 1
+    pages = [file.page for file in files.documentation_pages() if file.page is not None]
+    read_page_heads(pages, workers)
 
-        log.debug(f"Building page {page.file.src_uri}")
 
-        # Activate page. Signals to theme that this is the current page.
-        page.active = True
+def _get_page_template(page, env):
+    """Return the theme template of a Page."""
 
-        context = get_context(nav, doc_files, config, page)
+    # Allow 'template:' override in md source files.
+    if 'template' in page.meta:
+        return env.get_template(page.meta['template'])
+    return env.get_template('main.html')
 
-        # Allow 'template:' override in md source files.
-        if 'template' in page.meta:
-            template = env.get_template(page.meta['template'])
-        else:
-            template = env.get_template('main.html')
 
-        # Run `page_context` plugin events.
-        context = config['plugins'].run_event(
-            'page_context', context, page=page, config=config, nav=nav
-        )
+def _get_page_context(page, config, doc_files, nav):
+    """Return the template context of an active Page."""
+
+    context = get_context(nav, doc_files, config, page)
 
-        # Render the template.
-        output = template.render(context)
+    # Run `page_context` plugin events.
+    return config['plugins'].run_event('page_context', context, page=page, config=config, nav=nav)
 
+
+def _write_page(page, config, output, writer=None):
+    """Run `post_page` plugin events on the output of an active Page and write it to site_dir."""
+
+    with _profiler.page_step(page.file.src_uri, 'write'):
         # Run `post_page` plugin events.
         output = config['plugins'].run_event('post_page', output, page=page, config=config)
 
         # Write the output file.
         if output.strip():
-            utils.write_file(
-                output.encode('utf-8', errors='xmlcharrefreplace'), page.file.abs_dest_path
+            _write_file(
+                output.encode('utf-8', errors='xmlcharrefreplace'), page.file.abs_dest_path, writer
             )
         else:
             log.info(f"Page skipped: '{page.file.src_uri}'. Generated empty output.")
 
+
+def _build_page(page, config, doc_files, nav, env, dirty=False, unchanged=False, writer=None):
+    """
+    Pass a Page to theme template and write output to site_dir.
+
+    If `unchanged` is true, the output of the previous build is kept and only the `page_context`
+    plugin events are run for the page.
+    """
+
+    try:
+        # When --dirty is used, only build the page if the file has been modified since the
+        # previous build of the output.
+        if dirty and not page.file.is_modified():
+            return
+
+        if unchanged:
+            log.debug(f"Skipping unchanged page {page.file.src_uri}")
+        else:
+            log.debug(f"Building page {page.file.src_uri}")
+
+        # Activate page. Signals to theme that this is the current page.
+        page.active = True
+
+        with _profiler.page_step(page.file.src_uri, 'template'):
+            if not unchanged:
+                template = _get_page_template(page, env)
+
+            context = _get_page_context(page, config, doc_files, nav)
+
+            if not unchanged:
+                # Render the template.
+                output = template.render(context)
+
+        if not unchanged:
+            _write_page(page, config, output, writer)
+
         # Deactivate page
         page.active = False
     except Exception as e:
-        message = f"Error building page '{page.file.src_uri}':"
-        # Prevent duplicated the error message because it will be printed immediately afterwards.
-        if not isinstance(e, BuildError):
-            message += f" {e}"
-        log.error(message)
+        _log_page_error(f"Error building page '{page.file.src_uri}':", e)
         raise
 
 
-def build(config, live_server=False, dirty=False):
-    """Perform a full site build."""
+# State shared with forked worker processes. Set right before a pool is started.
+_worker_state = None
+# The log record collector of the current worker process.
+_collector = None
+
+
+class _RecordCollector(logging.Handler):
+    """Collect log records in a worker process so that they can be sent to the parent."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        # Make the record picklable: format the message eagerly and drop the traceback.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
+def _init_worker():
+    global _collector
+    _collector = _RecordCollector()
+    logger = logging.getLogger('mkdocs')
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(_collector)
+    logger.propagate = False
+
+
+def _run_task(func, index):
+    """
+    Run a worker task, capturing its log records, any exception and the wall and CPU time it
+    took to send to the parent.
+    """
+    _collector.records = []
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        result, error = func(index), None
+    except Exception as e:
+        result, error = None, e
+    times = (time.perf_counter() - wall, time.process_time() - cpu)
+    return result, error, _collector.records, times
+
+
+def _unwrap(item):
+    """
+    Replay the log records of a worker task in the parent and return its result (or raise)
+    along with the wall and CPU time it took.
+    """
+    result, error, records, times = item
+    for record in records:
+        logging.getLogger(record.name).handle(record)
+    if error is not None:
+        raise error
+    return result, times
+
+
+def _map_in_workers(func, count, jobs, state):
+    """
+    Yield `func(i)` for each `i` in `range(count)`, in order, computed by `jobs` worker processes.
+
+    The workers are forked, so `func` can access `state` through `_worker_state` without it
+    being pickled. Only the return values are sent back to the parent process.
+    """
+    global _worker_state
+    _worker_state = state
+    try:
+        chunksize = max(1, min(32, count // (jobs * 4)))
+        ctx = multiprocessing.get_context('fork')
+        with ctx.Pool(jobs, initializer=_init_worker) as pool:
+            for item in pool.imap(functools.partial(_run_task, func), range(count), chunksize):
+                yield item
+    finally:
+        _worker_state = None
+
+
+def _render_markdown_task(index):
+    pages, config, files, cache, engine = _worker_state
+    page = pages[index]
+    page.render(config, files, cache=cache, engine=engine)
+    return page.content, page.toc, page.links
+
+
+def _populate_pages_parallel(pages, config, files, jobs, dirty=False, cache=None, engine=None):
+    """Like `_populate_page` for each page, but with the Markdown rendered in worker processes."""
+
+    to_render = []
+    for page in pages:
+        try:
+            if dirty and not page.file.is_modified():
+                continue
+
+            src_uri = page.file.src_uri
+
+            with _profiler.page_step(src_uri, 'read'):
+                # Run the `pre_page` plugin event
+                page = config['plugins'].run_event('pre_page', page, config=config, files=files)
+
+                page.read_source(config)
+
+            with _profiler.page_step(src_uri, 'markdown'):
+                # Run `page_markdown` plugin events.
+                page.markdown = config['plugins'].run_event(
+                    'page_markdown', page.markdown, page=page, config=config, files=files
+                )
+        except Exception as e:
+            _log_page_error(f"Error reading page '{page.file.src_uri}':", e)
+            raise
+        to_render.append(page)
+
+    results = _map_in_workers(
+        _render_markdown_task, len(to_render), jobs, (to_render, config, files, cache, engine)
+    )
+    with contextlib.closing(results):
+        for page, item in zip(to_render, results):
+            try:
+                (page.content, page.toc, page.links), times = _unwrap(item)
+                _profiler.add_page_step(page.file.src_uri, 'render', *times)
+
+                with _profiler.page_step(page.file.src_uri, 'render'):
+                    # Run `page_content` plugin events.
+                    page.content = config['plugins'].run_event(
+                        'page_content', page.content, page=page, config=config, files=files
+                    )
+            except Exception as e:
+                _log_page_error(f"Error reading page '{page.file.src_uri}':", e)
+                raise
+
+
+def _render_page_task(index):
+    pages, contexts, env = _worker_state
+    page = pages[index]
+    page.active = True
+    try:
+        return _get_page_template(page, env).render(contexts[index])
+    finally:
+        page.active = False
+
+
+def _build_pages_parallel(
+    pages, config, doc_files, nav, env, jobs, dirty=False, unchanged=(), writer=None
+):
+    """
+    Like `_build_page` for each page, but with the templates rendered in worker processes.
+
+    `unchanged` is a collection of the `src_uri` of the pages whose output is kept. The
+    `page_context` plugin events of all pages run in the main process, in order, before
+    the workers are started.
+    """
+
+    if dirty:
+        pages = [page for page in pages if page.file.is_modified()]
+
+    to_render = []
+    contexts = []
+    for page in pages:
+        try:
+            with _profiler.page_step(page.file.src_uri, 'template'):
+                page.active = True
+                context = _get_page_context(page, config, doc_files, nav)
+                page.active = False
+        except Exception as e:
+            _log_page_error(f"Error building page '{page.file.src_uri}':", e)
+            raise
+        if page.file.src_uri in unchanged:
+            log.debug(f"Skipping unchanged page {page.file.src_uri}")
+        else:
+            to_render.append(page)
+            contexts.append(context)
+
+    results = _map_in_workers(_render_page_task, len(to_render), jobs, (to_render, contexts, env))
+    with contextlib.closing(results):
+        for page, item in zip(to_render, results):
+            try:
+                log.debug(f"Building page {page.file.src_uri}")
+                output, times = _unwrap(item)
+                _profiler.add_page_step(page.file.src_uri, 'template', *times)
+
+                page.active = True
+                _write_page(page, config, output, writer)
+                page.active = False
+            except Exception as e:
+                _log_page_error(f"Error building page '{page.file.src_uri}':", e)
+                raise
+
+
+def _get_jobs(config):
+    """Return the number of worker processes to use for the build, or 1 for a serial build."""
+
+    jobs = config['jobs']
+    if jobs < 1:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+        log.warning(
+            "Parallel builds ('jobs') are not supported on this platform. Building serially."
+        )
+        jobs = 1
+    return jobs
+
+
+def _get_cache(config):
+    """Return the cache of rendered Markdown, or `None` if caching is disabled."""
+
+    if not config['use_cache']:
+        return None
+    return DiskCache(
+        os.path.join(config['cache_dir'], 'markdown'),
+        max_size=config['cache_max_size'] * 1024 * 1024,
+    )
+
+
+def _get_template_cache_dir(config):
+    """Return the directory of the compiled theme templates, or `None` if caching is disabled."""
+
+    if not config['use_cache']:
+        return None
+    return os.path.join(config['cache_dir'], 'jinja')
+
+
+# Config options which don't affect the output of the build.
+_BUILD_OPTIONS = frozenset(('jobs', 'use_cache', 'cache_dir', 'cache_max_size', 'incremental'))
+
+
+def _get_nav_structure(items):
+    """Return the titles and URLs of the navigation items, recursively."""
+
+    return [
+        (
+            type(item).__name__,
+            item.title,
+            getattr(item, 'url', None),
+            _get_nav_structure(item.children or []),
+        )
+        for item in items
+    ]
+
+
+def _get_build_fingerprint(config, files, nav):
+    """
+    Return a hash of the inputs which are shared by the output of all pages: the config,
+    the theme and its templates, the plugins, the documentation files and the navigation.
+    `None` if they can't be identified (see `get_key`).
+    """
+
+    options = {}
+    for key, value in config.items():
+        if key in _BUILD_OPTIONS:
+            continue
+        if key == 'theme':
+            value = {
+                'name': value.name,
+                'dirs': value.dirs,
+                'static_templates': sorted(value.static_templates),
+                'vars': {k: repr(value[k]) for k in value},
+            }
+        elif key == 'plugins':
+            value = [(name, type(plugin), plugin.config) for name, plugin in value.items()]
+        options[key] = value
+
+    templates = []
+    for theme_dir in config['theme'].dirs:
+        for dirpath, dirnames, filenames in os.walk(theme_dir):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(dirpath, filename)
+                st = os.stat(path)
+                templates.append((path, st.st_mtime_ns, st.st_size))
+
+    return get_key(
+        'build',
+        mkdocs.__version__,
+        utils.get_build_date(),
+        options,
+        templates,
+        [(file.src_uri, file.url) for file in files.documentation_pages()],
+        _get_nav_structure(nav.items),
+    )
+
+
+def _get_page_digest(page, config, files):
+    """
+    Return a hash of the inputs of a populated Page which are specific to it, including the
+    titles of the pages it links to and the inputs declared by `page_inputs` plugin events.
+    `None` if they can't be identified (see `get_key`).
+    """
+
+    # Run `page_inputs` plugin events.
+    inputs = config['plugins'].run_event('page_inputs', [], page=page, config=config, files=files)
+
+    links = []
+    for target_uri, url in page.links:
+        target = files.get_file_from_path(target_uri)
+        title = target.page.title if target is not None and target.page is not None else None
+        links.append((target_uri, url, title))
+
+    return get_key(
+        'page',
+        page.file.src_uri,
+        page.file.dest_uri,
+        page.title,
+        page.meta,
+        page.content,
+        str(page.toc),
+        links,
+        inputs,
+    )
+
+
+def _get_manifest_store(config):
+    """Return the cache where the manifests of incremental builds are stored."""
+
+    return DiskCache(os.path.join(config['cache_dir'], 'incremental'))
+
+
+def _get_manifest_key(site_dir):
+    return get_key('manifest', os.path.abspath(site_dir))
+
+
+def _load_previous_outputs(config, site_dir, fingerprint):
+    """
+    Return the outputs recorded by the previous incremental build of site_dir, as a dict of
+    `{dest_uri: digest}`, or `None` if there are none or if they were built from different
+    shared inputs.
+    """
+
+    if fingerprint is None:
+        log.info("The configuration can't be compared with that of the previous build.")
+        return None
+
+    manifest = _get_manifest_store(config).get(_get_manifest_key(site_dir))
+    if manifest is not None and manifest['fingerprint'] == fingerprint:
+        return manifest['outputs']
+
+    if manifest is None:
+        log.info("No previous incremental build found.")
+    else:
+        log.info("The configuration, theme or navigation has changed.")
+    return None
+
+
+def _save_outputs(config, site_dir, fingerprint, outputs):
+    """Record the outputs of an incremental build of site_dir for the next one."""
+
+    _get_manifest_store(config).set(
+        _get_manifest_key(site_dir), {'fingerprint': fingerprint, 'outputs': outputs}
+    )
+
+
+def _discard_outputs(config, site_dir):
+    """
+    Forget the outputs recorded by the previous incremental build of site_dir, before another
+    kind of build overwrites them.
+    """
+
+    _get_manifest_store(config).delete(_get_manifest_key(site_dir))
+
+
+def _copy_static_files_incremental(files, previous, outputs, writer=None):
+    """Copy the static files whose source has changed since the previous build."""
+
+    for file in files:
+        if file.is_documentation_page():
+            continue
+        st = os.stat(file.abs_src_path)
+        digest = f'{file.abs_src_path}:{st.st_mtime_ns}:{st.st_size}'
+        outputs[file.dest_uri] = digest
+        if previous.get(file.dest_uri) == digest and os.path.isfile(file.abs_dest_path):
+            log.debug(f"Skip copying unmodified file: '{file.src_uri}'")
+        else:
+            file.copy_file(writer=writer)
+
+
+def _get_unchanged_pages(pages, config, files, previous, outputs):
+    """Return the `src_uri` of the pages whose inputs have not changed since the previous build."""
+
+    unchanged = set()
+    for page in pages:
+        try:
+            digest = _get_page_digest(page, config, files)
+        except Exception as e:
+            _log_page_error(f"Error building page '{page.file.src_uri}':", e)
+            raise
+        outputs[page.file.dest_uri] = digest
+        if (
+            digest is not None
+            and previous.get(page.file.dest_uri) == digest
+            and os.path.isfile(page.file.abs_dest_path)
+        ):
+            unchanged.add(page.file.src_uri)
+    return unchanged
+
+
+def _remove_stale_outputs(config, previous, outputs):
+    """Remove the outputs of the previous build which are not outputs of the current one."""
+
+    site_dir = os.path.abspath(config['site_dir'])
+    for dest_uri in previous:
+        if dest_uri in outputs:
+            continue
+        path = os.path.join(site_dir, os.path.normpath(dest_uri))
+        if not os.path.isfile(path):
+            continue
+        log.debug(f"Removing stale file: '{dest_uri}'")
+        os.unlink(path)
+        # The compressed companion of the file is stale too.
+        gz_path = compress.get_companion_path(path)
+        if compress.get_companion_path(dest_uri) not in outputs and os.path.isfile(gz_path):
+            os.unlink(gz_path)
+        # Also remove the directories which are now empty.
+        parent = os.path.dirname(path)
+        while parent != site_dir and not os.listdir(parent):
+            os.rmdir(parent)
+            parent = os.path.dirname(parent)
+
+
+def _get_template_outputs(config, files):
+    """Return the `dest_uri` of the outputs of the static and extra templates."""
+
+    outputs = []
+    for template_name in config['theme'].static_templates:
+        outputs.append(template_name)
+        if template_name == 'sitemap.xml':
+            outputs.append(f'{template_name}.gz')
+            for name in sitemap.get_shard_names(len(files.documentation_pages())):
+                outputs += [name, f'{name}.gz']
+    for template_name in config['extra_templates']:
+        file = files.get_file_from_path(template_name)
+        if file is not None:
+            outputs.append(file.dest_uri)
+    return outputs
+
+
+def _clean_site_dir(config, skip_unchanged=False):
+    """
+    Clean site_dir. With `skip_unchanged`, the files are kept instead, and a snapshot of them
+    is returned for `_remove_stale_files`.
+    """
+
+    if skip_unchanged:
+        log.info("Keeping the unchanged files of the site directory")
+        return _get_site_files(config['site_dir'])
+
+    log.info("Cleaning site directory")
+    utils.clean_directory(config['site_dir'])
+    return None
+
+
+def _get_staging_dir(site_dir):
+    """Return the path of the staging directory of an atomic build, a sibling of site_dir."""
+    site_dir = os.path.abspath(site_dir)
+    return os.path.join(os.path.dirname(site_dir), f'.{os.path.basename(site_dir)}.staging')
+
+
+def _prepare_staging_dir(site_dir, staging_dir, link_previous=False):
+    """
+    Create an empty staging directory, replacing the leftovers of a failed build. With
+    `link_previous`, it starts with hard links to the files of site_dir (except hidden ones).
+    """
+
+    if os.path.exists(staging_dir):
+        shutil.rmtree(staging_dir)
+    if link_previous and os.path.isdir(site_dir):
+        log.info("Linking the files of the previous build to the staging directory")
+        shutil.copytree(
+            site_dir,
+            staging_dir,
+            copy_function=_link_file,
+            ignore=lambda path, names: [
+                name for name in names if path == site_dir and name.startswith('.')
+            ],
+        )
+    else:
+        os.makedirs(staging_dir)
+
+
+def _link_file(source_path, output_path):
+    """Link source_path to output_path, or copy it if it can't be linked."""
+    utils.publish_file(source_path, output_path, 'hardlink')
+
+
+def _swap_site_dir(staging_dir, site_dir):
+    """
+    Replace site_dir with the staging directory, keeping the hidden files of site_dir. If that
+    fails, site_dir is left as it was and the staging directory is removed.
+    """
+
+    if not os.path.isdir(site_dir):
+        try:
+            os.makedirs(os.path.dirname(site_dir), exist_ok=True)
+            os.rename(staging_dir, site_dir)
+        except OSError:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        return
+
+    old_dir = f'{staging_dir}.old'
+    moved = []
+    try:
+        # Hidden files are never removed from the site directory. See `utils.clean_directory`.
+        for name in os.listdir(site_dir):
+            if name.startswith('.'):
+                os.rename(os.path.join(site_dir, name), os.path.join(staging_dir, name))
+                moved.append(name)
+
+        if _exchange_paths(staging_dir, site_dir):
+            old_dir = staging_dir
+        else:
+            # The directories are swapped by two renames instead, between which site_dir is
+            # briefly missing.
+            if os.path.exists(old_dir):
+                shutil.rmtree(old_dir)
+            os.rename(site_dir, old_dir)
+            try:
+                os.rename(staging_dir, site_dir)
+            except OSError:
+                os.rename(old_dir, site_dir)
+                raise
+    except OSError:
+        # Move the hidden files back. The staging directory is only removed once it doesn't
+        # hold any of them anymore.
+        try:
+            for name in list(moved):
+                os.rename(os.path.join(staging_dir, name), os.path.join(site_dir, name))
+                moved.remove(name)
+        except OSError:
+            log.error(
+                f"Unable to restore the site directory '{site_dir}'. Its hidden files are in "
+                f"'{staging_dir}' and its other files may be in '{old_dir}'."
+            )
+        else:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def _exchange_paths(path_a, path_b):
+    """Atomically exchange two paths with `renameat2` on Linux. Return False if unsupported."""
+
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (AttributeError, OSError):
+        return False
+    AT_FDCWD, RENAME_EXCHANGE = -100, 2
+    result = renameat2(
+        AT_FDCWD, os.fsencode(path_a), AT_FDCWD, os.fsencode(path_b), RENAME_EXCHANGE
+    )
+    if result != 0:
+        log.debug(f"Unable to exchange the directories: {os.strerror(ctypes.get_errno())}")
+        return False
+    return True
+
+
+def _get_site_files(site_dir):
+    """Return the modification time and size of each file in site_dir, except hidden ones."""
+
+    site_files = {}
+    for dirpath, dirnames, filenames in os.walk(site_dir):
+        if dirpath == site_dir:
+            # Hidden files are never removed from the site directory. See `utils.clean_directory`.
+            dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+            filenames = [name for name in filenames if not name.startswith('.')]
+        for filename in filenames:
+            path = os.path.normpath(os.path.join(dirpath, filename))
+            st = os.stat(path)
+            site_files[path] = (st.st_mtime_ns, st.st_size)
+    return site_files
+
+
+def _remove_stale_files(site_dir, site_files, outputs):
+    """
+    Remove the files of the snapshot `site_files` which are not `outputs` of the build and
+    haven't been written to since the snapshot (by a plugin, for example).
+    """
+
+    for path, (mtime, size) in site_files.items():
+        if path in outputs:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if (st.st_mtime_ns, st.st_size) != (mtime, size):
+            continue
+        log.debug(f"Removing stale file: '{os.path.relpath(path, site_dir)}'")
+        os.unlink(path)
+
+    # Also remove the directories which are now empty.
+    for dirpath, dirnames, filenames in os.walk(site_dir, topdown=False):
+        if dirpath != site_dir and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def build(config, live_server=False, dirty=False, profile=None):
+    """
+    Perform a full site build.
+
+    If `profile` is the path of a file, a report of the time spent in each phase, page and
+    template of the build, and in each event method of each plugin, is written to it.
+    """
+    global _profiler
 
     logger = logging.getLogger('mkdocs')
 
@@ -244,20 +983,58 @@ def build(config, live_server=False, dirty=False):
     if config['strict']:
         logging.getLogger('mkdocs').addHandler(warning_counter)
 
-    try:
-        from time import time
-
-        start = time()
-
-        # Run `config` plugin events.
-        config = config['plugins'].run_event('config', config)
+    # Use the configured date of the build, unless one is set in the environment.
+    set_source_date_epoch = (
+        config['source_date_epoch'] is not None and 'SOURCE_DATE_EPOCH' not in os.environ
+    )
+    if set_source_date_epoch:
+        os.environ['SOURCE_DATE_EPOCH'] = str(config['source_date_epoch'])
 
-        # Run `pre_build` plugin events.
-        config['plugins'].run_event('pre_build', config=config)
+    _profiler = BuildProfiler(enabled=profile is not None)
+    plugins = config['plugins']
+    if profile is not None:
+        plugins.timings = EventTimings()
 
-        if not dirty:
-            log.info("Cleaning site directory")
-            utils.clean_directory(config['site_dir'])
+    site_dir = staging_dir = None
+    try:
+        start = time.time()
+
+        with _profiler.phase('config'):
+            # Run `config` plugin events.
+            config = config['plugins'].run_event('config', config)
+
+            # Run `pre_build` plugin events.
+            config['plugins'].run_event('pre_build', config=config)
+
+        # An atomic build writes to a staging directory, which replaces site_dir at the end.
+        if config['atomic_build'] and not live_server and not dirty:
+            site_dir = config['site_dir']
+            staging_dir = _get_staging_dir(site_dir)
+            with _profiler.phase('staging'):
+                _prepare_staging_dir(
+                    site_dir,
+                    staging_dir,
+                    link_previous=config['skip_unchanged'] or config['incremental'],
+                )
+            config['site_dir'] = staging_dir
+
+        # The compressed companions of the output files aren't needed by the development server.
+        precompress = config['precompress'] and not live_server
+        # An incremental build cleans the site directory later on, only if it must.
+        incremental = config['incremental'] and not dirty
+        skip_unchanged = config['skip_unchanged'] and not dirty
+        # With `skip_unchanged`, the snapshot of site_dir which is taken instead of cleaning it.
+        site_files = None
+
+        if not incremental:
+            # This build may write other outputs, so the next incremental build starts anew.
+            _discard_outputs(config, site_dir or config['site_dir'])
+
+        if incremental:
+            log.info("Performing an incremental build")
+        elif not dirty:
+            with _profiler.phase('clean'):
+                site_files = _clean_site_dir(config, skip_unchanged)
         else:  # pragma: no cover
             # Warn user about problems that may occur with --dirty option
             log.warning(
@@ -266,60 +1043,168 @@ def build(config, live_server=False, dirty=False):
             )
 
         if not live_server:  # pragma: no cover
-            log.info(f"Building documentation to directory: {config['site_dir']}")
+            log.info(f"Building documentation to directory: {site_dir or config['site_dir']}")
             if dirty and site_directory_contains_stale_files(config['site_dir']):
                 log.info("The directory contains stale files. Use --clean to remove them.")
 
         # First gather all data from all files/pages to ensure all data is consistent across all pages.
 
-        files = get_files(config)
-        env = config['theme'].get_env()
-        files.add_files_from_theme(env, config)
+        with _profiler.phase('files'):
+            files = get_files(config)
+            env = config['theme'].get_env(_get_template_cache_dir(config))
+            files.add_files_from_theme(env, config)
 
-        # Run `files` plugin events.
-        files = config['plugins'].run_event('files', files, config=config)
+            # Run `files` plugin events.
+            files = config['plugins'].run_event('files', files, config=config)
 
-        nav = get_navigation(files, config)
+        with _profiler.phase('nav'):
+            nav = get_navigation(files, config)
 
-        # Run `nav` plugin events.
-        nav = config['plugins'].run_event('nav', nav, config=config, files=files)
+        with _profiler.phase('page_heads'):
+            _read_page_heads(files, config)
 
-        log.debug("Reading markdown pages.")
-        for file in files.documentation_pages():
-            log.debug(f"Reading: {file.src_uri}")
-            _populate_page(file.page, config, files, dirty)
+        with _profiler.phase('nav'):
+            # Run `nav` plugin events.
+            nav = config['plugins'].run_event('nav', nav, config=config, files=files)
 
-        # Run `env` plugin events.
-        env = config['plugins'].run_event('env', env, config=config, files=files)
-
-        # Start writing files to site_dir now that all data is gathered. Note that order matters. Files
-        # with lower precedence get written first so that files with higher precedence can overwrite them.
+        jobs = _get_jobs(config)
+        cache = _get_cache(config)
+        # The Markdown instances of the build, which are released with it.
+        engine = MarkdownEngine()
 
-        log.debug("Copying static assets.")
-        files.copy_static_files(dirty=dirty)
+        with _profiler.phase('populate'):
+            log.debug("Reading markdown pages.")
+            if jobs > 1:
+                pages = [file.page for file in files.documentation_pages()]
+                _populate_pages_parallel(pages, config, files, jobs, dirty, cache, engine)
+            else:
+                for file in files.documentation_pages():
+                    log.debug(f"Reading: {file.src_uri}")
+                    _populate_page(file.page, config, files, dirty, cache, engine)
 
-        for template in config['theme'].static_templates:
-            _build_theme_template(template, env, files, config, nav)
+            if cache is not None:
+                cache.prune()
 
-        for template in config['extra_templates']:
-            _build_extra_template(template, files, config, nav)
+        with _profiler.phase('env'):
+            # Run `env` plugin events.
+            env = config['plugins'].run_event('env', env, config=config, files=files)
 
-        log.debug("Building markdown pages.")
         doc_files = files.documentation_pages()
-        for file in doc_files:
-            _build_page(file.page, config, doc_files, nav, env, dirty)
+        pages = [file.page for file in doc_files]
+
+        # The outputs of an incremental build, as `{dest_uri: digest}`.
+        outputs = {}
+        unchanged = set()
+        if incremental:
+            with _profiler.phase('incremental'):
+                fingerprint = _get_build_fingerprint(config, files, nav)
+                previous = _load_previous_outputs(
+                    config, site_dir or config['site_dir'], fingerprint
+                )
+                if previous is None:
+                    previous = {}
+                    site_files = _clean_site_dir(config, skip_unchanged)
+                unchanged = _get_unchanged_pages(pages, config, files, previous, outputs)
+            log.info(f"{len(pages) - len(unchanged)} of {len(pages)} pages have changed.")
 
-        # Run `post_build` plugin events.
-        config['plugins'].run_event('post_build', config=config)
+        # Start writing files to site_dir now that all data is gathered. Note that order matters. Files
+        # with lower precedence get written first so that files with higher precedence can overwrite them.
+
+        # Output files are written by background threads while the next ones are rendered. This
+        # isn't needed in a parallel build, where the pages are rendered by worker processes
+        # (which should not be forked from a multi-threaded process).
+        threads = 4 if jobs == 1 else 0
+        with BackgroundWriter(
+            threads, skip_unchanged=skip_unchanged, copy_mode=config['static_copy_mode']
+        ) as writer:
+            with _profiler.phase('static_files'):
+                log.debug("Copying static assets.")
+                if incremental:
+                    _copy_static_files_incremental(files, previous, outputs, writer)
+                else:
+                    files.copy_static_files(dirty=dirty, writer=writer)
+
+            with _profiler.phase('templates'):
+                for template in config['theme'].static_templates:
+                    _build_theme_template(template, env, files, config, nav, writer)
+
+                for template in config['extra_templates']:
+                    _build_extra_template(template, files, config, nav, writer)
+
+            with _profiler.phase('pages'):
+                log.debug("Building markdown pages.")
+                if jobs > 1:
+                    _build_pages_parallel(
+                        pages, config, doc_files, nav, env, jobs, dirty, unchanged, writer
+                    )
+                else:
+                    for page in pages:
+                        unchanged_page = page.file.src_uri in unchanged
+                        _build_page(
+                            page, config, doc_files, nav, env, dirty, unchanged_page, writer
+                        )
+
+            with _profiler.phase('write'):
+                # Wait for the pending writes to complete.
+                writer.close()
+
+        with _profiler.phase('post_build'):
+            if incremental:
+                outputs.update(dict.fromkeys(_get_template_outputs(config, files)))
+                _remove_stale_outputs(config, previous, outputs)
+
+            # Run `post_build` plugin events.
+            config['plugins'].run_event('post_build', config=config)
+
+            if site_files is not None:
+                site_outputs = writer.outputs
+                if precompress:
+                    # Keep the compressed companions, which are only written again if outdated.
+                    site_outputs = site_outputs | {
+                        compress.get_companion_path(path) for path in site_outputs
+                    }
+                _remove_stale_files(config['site_dir'], site_files, site_outputs)
+
+        if precompress:
+            with _profiler.phase('compress'):
+                log.debug("Compressing the output files.")
+                compress.compress_site(
+                    config['site_dir'],
+                    config['precompress_extensions'],
+                    config['precompress_level'],
+                )
 
         counts = warning_counter.get_counts()
         if counts:
             msg = ', '.join([f'{v} {k.lower()}s' for k, v in counts])
             raise Abort(f'\nAborted with {msg} in strict mode!')
 
-        log.info('Documentation built in %.2f seconds', time() - start)
+        if staging_dir is not None:
+            with _profiler.phase('swap'):
+                log.debug(f"Replacing the site directory with '{staging_dir}'.")
+                # Once the swap has started, the staging directory may hold the hidden files
+                # of site_dir, so `_swap_site_dir` is left to remove it.
+                swapped_dir, staging_dir = staging_dir, None
+                _swap_site_dir(swapped_dir, site_dir)
+
+        if incremental:
+            _save_outputs(config, site_dir or config['site_dir'], fingerprint, outputs)
+
+        log.info('Documentation built in %.2f seconds', time.time() - start)
+
+        if profile is not None:
+            report = _profiler.get_report()
+            report['plugin_events'] = plugins.timings.get_report()
+            _profiler.log_summary(report)
+            plugins.timings.log_summary(report['plugin_events'])
+            _profiler.write_report(profile, report)
+            log.info(f"Build profile written to '{profile}'")
 
     except Exception as e:
+        if staging_dir is not None:
+            # Leave site_dir as it was.
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
         # Run `build_error` plugin events.
         config['plugins'].run_event('build_error', error=e)
         if isinstance(e, BuildError):
@@ -328,7 +1213,15 @@ def build(config, live_server=False, dirty=False):
         raise
 
     finally:
+        if site_dir is not None:
+            config['site_dir'] = site_dir
+        _profiler = BuildProfiler(enabled=False)
+        plugins.timings = None
+        meta.clear_cache()
+        utils.clear_url_cache()
         logger.removeHandler(warning_counter)
+        if set_source_date_epoch:
+            del os.environ['SOURCE_DATE_EPOCH']
 
 
 def site_directory_contains_stale_files(site_directory):
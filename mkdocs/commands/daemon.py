@@ -0,0 +1,267 @@
+"""
+Keep MkDocs loaded in a long-running process which builds sites on request.
+
+`mkdocs daemon` listens on a Unix socket, and `mkdocs build --daemon` sends the options of a
+build to it and logs the messages of the build as they are streamed back. The daemon keeps
+the modules of MkDocs, of its plugins, themes and Markdown extensions, and the compiled theme
+templates in memory, so a build only pays for the work which depends on its files.
+
+The requests and responses are JSON objects, one per line. The builds run one at a time, in
+the working directory and with the environment variables of the client.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import traceback
+
+import mkdocs
+from mkdocs import exceptions
+
+log = logging.getLogger(__name__)
+
+# The exceptions which are passed from the daemon to the client, by name.
+_EXCEPTIONS = {
+    cls.__name__: cls
+    for cls in (
+        exceptions.MkDocsException,
+        exceptions.Abort,
+        exceptions.ConfigurationError,
+        exceptions.BuildError,
+        exceptions.PluginError,
+    )
+}
+
+
+def get_socket_path():
+    """Return the default path of the socket of the daemon, which is specific to the user."""
+    return os.path.join(tempfile.gettempdir(), f'mkdocs-daemon-{os.getuid()}.sock')
+
+
+def serve(socket_path=None, config_file=None):
+    """
+    Build the sites requested on `socket_path` until a stop request is received.
+
+    If a `config_file` is given, it is loaded beforehand so that its plugins, theme and
+    Markdown extensions are loaded and its templates are compiled before the first build.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        raise exceptions.Abort("The MkDocs daemon is not supported on this platform.")
+    socket_path = socket_path or get_socket_path()
+    sock = _connect(socket_path)
+    if sock is not None:
+        sock.close()
+        raise exceptions.Abort(f"An MkDocs daemon is already listening on '{socket_path}'.")
+    if os.path.exists(socket_path):
+        # Left over by a daemon which didn't exit cleanly.
+        os.remove(socket_path)
+
+    _warm_up(config_file)
+
+    # Only the user who started the daemon may connect to it.
+    umask = os.umask(0o177)
+    try:
+        server = _Server(socket_path)
+    finally:
+        os.umask(umask)
+
+    log.info(f"The MkDocs daemon is listening on '{socket_path}'.")
+    try:
+        with server:
+            while not server.stopped:
+                server.handle_request()
+    finally:
+        with contextlib.suppress(OSError):
+            os.remove(socket_path)
+    log.info("The MkDocs daemon has stopped.")
+
+
+def stop(socket_path=None):
+    """Stop the daemon listening on `socket_path`. Return False if there is none."""
+    return _send_request(dict(command='stop'), socket_path)
+
+
+def request_build(options, dirty=False, profile=None, socket_path=None, log_level=logging.INFO):
+    """
+    Ask the daemon listening on `socket_path` to build the site of the config loaded with
+    `options`, and log the messages of the build up to `log_level` as they are received.
+
+    Return False if no daemon is listening, and raise the errors of the build.
+    """
+    config_file = options.get('config_file')
+    if config_file is not None and not isinstance(config_file, str):
+        options = dict(options, config_file=os.path.abspath(config_file.name))
+    request = dict(
+        command='build',
+        cwd=os.getcwd(),
+        env=dict(os.environ),
+        options=options,
+        dirty=dirty,
+        profile=profile and os.path.abspath(profile),
+        log_level=log_level,
+    )
+    return _send_request(request, socket_path)
+
+
+def _connect(socket_path):
+    """Return a socket connected to the daemon on `socket_path`, or None if there is none."""
+    try:
+        if os.stat(socket_path).st_uid != os.getuid():
+            raise exceptions.Abort(f"The socket '{socket_path}' belongs to another user.")
+    except FileNotFoundError:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _send_request(request, socket_path=None):
+    if not hasattr(socket, 'AF_UNIX'):
+        return False
+    sock = _connect(socket_path or get_socket_path())
+    if sock is None:
+        return False
+    request['version'] = mkdocs.__version__
+    with sock, sock.makefile('rb') as f:
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        for line in f:
+            response = json.loads(line)
+            if 'log' in response:
+                record = logging.makeLogRecord(dict(response['log'], from_daemon=True))
+                logging.getLogger(record.name).handle(record)
+            elif 'error' in response:
+                raise _EXCEPTIONS[response['type']](response['error'])
+            else:
+                return True
+    raise exceptions.BuildError("The MkDocs daemon closed the connection unexpectedly.")
+
+
+def _warm_up(config_file):
+    from mkdocs import plugins, utils
+    from mkdocs.commands import build  # noqa: F401
+    from mkdocs.config import load_config
+
+    utils.get_themes()
+    plugins.get_plugins()
+    if config_file is None:
+        return
+    config = load_config(config_file=config_file)
+    env = config['theme'].get_env()
+    for name in env.list_templates(filter_func=lambda name: name.endswith(('.html', '.xml'))):
+        try:
+            env.get_template(name)
+        except Exception as e:
+            log.debug(f"Template '{name}' could not be compiled: {e}")
+
+
+@contextlib.contextmanager
+def _client_context(cwd, env):
+    """Run the block in the working directory and with the environment of the client."""
+    old_cwd, old_env = os.getcwd(), dict(os.environ)
+    os.chdir(cwd)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.chdir(old_cwd)
+        os.environ.clear()
+        os.environ.update(old_env)
+
+
+def _build(request):
+    from mkdocs.commands import build
+    from mkdocs.config import load_config
+
+    # The messages of each build are sent to its own client, so all of them are logged again.
+    for log_filter in build.log.filters:
+        if isinstance(log_filter, build.DuplicateFilter):
+            log_filter.msgs.clear()
+
+    with _client_context(request['cwd'], request['env']):
+        log.debug(f"Building the site of the MkDocs daemon client in '{request['cwd']}'")
+        config = load_config(**request['options'])
+        build.build(config, dirty=request['dirty'], profile=request['profile'])
+
+
+class _ClientLogHandler(logging.Handler):
+    """Send the log records of a build to the client which requested it."""
+
+    def __init__(self, send, level):
+        super().__init__(level)
+        self.send = send
+
+    def emit(self, record):
+        # Don't send back the messages received from a daemon, if the client runs in-process.
+        if getattr(record, 'from_daemon', False):
+            return
+        try:
+            message = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self.send(
+            log=dict(
+                name=record.name, levelno=record.levelno, levelname=record.levelname, msg=message
+            )
+        )
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.connected = True
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if request.get('version') != mkdocs.__version__:
+            self.send(
+                error=f"The MkDocs daemon runs version {mkdocs.__version__}, "
+                f"but the client runs version {request.get('version')}.",
+                type='Abort',
+            )
+        elif request.get('command') == 'stop':
+            self.server.stopped = True
+            self.send(result='stopped')
+        elif request.get('command') == 'build':
+            self.handle_build(request)
+
+    def handle_build(self, request):
+        logger = logging.getLogger('mkdocs')
+        handler = _ClientLogHandler(self.send, request['log_level'])
+        logger.addHandler(handler)
+        try:
+            _build(request)
+        except exceptions.MkDocsException as e:
+            name = next(cls.__name__ for cls in type(e).__mro__ if cls.__name__ in _EXCEPTIONS)
+            self.send(error=e.format_message(), type=name)
+        except Exception:
+            self.send(error=traceback.format_exc(), type='BuildError')
+        else:
+            self.send(result='built')
+        finally:
+            logger.removeHandler(handler)
+
+    def send(self, **response):
+        # The build carries on if the client has disconnected.
+        if not self.connected:
+            return
+        try:
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+        except OSError:
+            self.connected = False
+
+
+class _Server(socketserver.UnixStreamServer):
+    def __init__(self, socket_path):
+        self.stopped = False
+        super().__init__(socket_path, _RequestHandler)
@@ -1,4 +1,6 @@
+import copy
 import logging
+import os
 import shutil
 import tempfile
 from os.path import isdir, isfile, join
@@ -41,17 +43,19 @@ def serve(
     def mount_path(config):
         return urlsplit(config['site_url'] or '/').path
 
+    config_loader = _ConfigLoader(
+        config_file=config_file,
+        dev_addr=dev_addr,
+        strict=strict,
+        theme=theme,
+        theme_dir=theme_dir,
+        site_dir=site_dir,
+        **kwargs,
+    )
+
     def builder():
         log.info("Building documentation...")
-        config = load_config(
-            config_file=config_file,
-            dev_addr=dev_addr,
-            strict=strict,
-            theme=theme,
-            theme_dir=theme_dir,
-            site_dir=site_dir,
-            **kwargs,
-        )
+        config = config_loader.load()
 
         # combine CLI watch arguments with config file values
         if config["watch"] is None:
@@ -62,7 +66,10 @@ def serve(
         # Override a few config settings after validation
         config['site_url'] = 'http://{}{}'.format(config['dev_addr'], mount_path(config))
 
-        live_server = livereload in ['dirty', 'livereload']
+        if livereload == 'incremental':
+            config['incremental'] = True
+
+        live_server = livereload in ['dirty', 'incremental', 'livereload']
         dirty = livereload == 'dirty'
         build(config, live_server=live_server, dirty=dirty)
         return config
@@ -85,7 +92,7 @@ def serve(
 
         server.error_handler = error_handler
 
-        if livereload in ['livereload', 'dirty']:
+        if livereload in ['livereload', 'dirty', 'incremental']:
             # Watch the documentation files, the config file and the theme files.
             server.watch(config['docs_dir'])
             server.watch(config['config_file_path'])
@@ -115,3 +122,70 @@ def serve(
     finally:
         if isdir(site_dir):
             shutil.rmtree(site_dir)
+
+
+class _ConfigLoader:
+    """
+    Load the config of each build of the development server.
+
+    Loading the config parses the config files, validates every option, creates the plugins
+    and checks the Markdown extensions. The validated config and its plugins are reused by the
+    next build if the config files are unchanged and every plugin handles the `reset` event.
+    The values of the config are restored from a copy taken after its validation, as the
+    plugins and the builds alter them.
+    """
+
+    def __init__(self, config_file=None, **options):
+        self.config_file = config_file
+        self.options = options
+        self.config = None
+        self.values = None
+        self.paths = []
+        self.fingerprint = None
+
+    def load(self):
+        fingerprint = _get_fingerprint(self.paths)
+        if self.values is not None and fingerprint == self.fingerprint:
+            log.debug("Reusing the configuration of the previous build.")
+            self.config.data = self._copy_values(self.values)
+            self.config['plugins'].run_event('reset', config=self.config)
+            return self.config
+
+        config = load_config(config_file=self.config_file, **self.options)
+        paths = _get_config_paths(config)
+        if paths != self.paths:
+            fingerprint = _get_fingerprint(paths)
+        self.config, self.paths, self.fingerprint = config, paths, fingerprint
+        self.values = None
+        plugins = config['plugins']
+        if len(plugins.events['reset']) == len(plugins):
+            try:
+                self.values = self._copy_values(config.data)
+            except Exception as e:
+                log.debug(f"The configuration can't be reused by the next build: {e}")
+        return config
+
+    def _copy_values(self, values):
+        # The plugin instances are shared by all the copies.
+        plugins = values['plugins']
+        return copy.deepcopy(values, memo={id(plugins): plugins})
+
+
+def _get_config_paths(config):
+    """Return the paths of the files which the config was loaded from."""
+    paths = [config.config_file_path, *config.inherited_paths]
+    for theme_dir in config['theme'].dirs:
+        paths.append(os.path.join(theme_dir, 'mkdocs_theme.yml'))
+    return paths
+
+
+def _get_fingerprint(paths):
+    fingerprint = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            fingerprint.append((path, None, None))
+        else:
+            fingerprint.append((path, st.st_mtime_ns, st.st_size))
+    return fingerprint
@@ -82,6 +82,8 @@ class Config(UserDict):
         self.data = {}
 
         self.user_configs = []
+        # The paths of the config files inherited by the config file, if any.
+        self.inherited_paths = []
         self.set_defaults()
 
     def set_defaults(self) -> None:
@@ -173,7 +175,9 @@ class Config(UserDict):
     def load_file(self, config_file: IO) -> None:
         """Load config options from the open file descriptor of a YAML file."""
         try:
-            return self.load_dict(utils.yaml_load(config_file))
+            return self.load_dict(
+                utils.yaml_load(config_file, inherited_paths=self.inherited_paths)
+            )
         except YAMLError as e:
             # MkDocs knows and understands ConfigurationErrors
             raise exceptions.ConfigurationError(
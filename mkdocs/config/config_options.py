@@ -140,6 +140,28 @@ class Type(OptionallyRequired):
         raise ValidationError(msg)
 
 
+class ListOfItems(Type):
+    """
+    List of Items Config Option
+
+    Validate a list, each item of which is validated by another config option.
+    """
+
+    def __init__(self, option, **kwargs):
+        super().__init__(list, **kwargs)
+        self.option = option
+
+    def run_validation(self, value):
+        value = super().run_validation(value)
+        items = []
+        for index, item in enumerate(value):
+            try:
+                items.append(self.option.run_validation(item))
+            except ValidationError as e:
+                raise ValidationError(f"Invalid item {index + 1}: {e}")
+        return items
+
+
 class Choice(OptionallyRequired):
     """
     Choice Config Option
@@ -1,3 +1,4 @@
+from mkdocs import utils
 from mkdocs.config import config_options
 
 # NOTE: The order here is important. During validation some config options
@@ -29,6 +30,9 @@ def get_schema():
         'theme': config_options.Theme(default='mkdocs'),
         # The directory containing the documentation markdown.
         'docs_dir': config_options.Dir(default='docs', exists=True),
+        # Gitignore-style patterns of the files and directories of `docs_dir` which are not
+        # part of the site, in addition to hidden files and the `templates` directory.
+        'exclude_docs': config_options.ListOfItems(config_options.Type(str), default=[]),
         # The directory where the site will be built to
         'site_dir': config_options.SiteDir(default='site'),
         # A copyright notice to add to the footer of documentation.
@@ -80,6 +84,38 @@ def get_schema():
         # enabling strict mode causes MkDocs to stop the build when a problem is
         # encountered rather than display an error.
         'strict': config_options.Type(bool, default=False),
+        # The number of worker processes used to render the pages. When set to `0`,
+        # one worker process is used for each CPU core.
+        'jobs': config_options.Type(int, default=1),
+        # Enables the persistent cache of rendered Markdown, which is stored in `cache_dir`.
+        'use_cache': config_options.Type(bool, default=False),
+        # The directory where MkDocs stores data which is reused across builds.
+        'cache_dir': config_options.Dir(default='.cache/mkdocs'),
+        # The maximum size of the cache in megabytes. The least recently used entries are
+        # removed from the cache when it grows beyond this size.
+        'cache_max_size': config_options.Type(int, default=100),
+        # Only render the pages whose inputs have changed since the previous build, as
+        # recorded in `cache_dir`, and keep the output of the other pages in `site_dir`.
+        'incremental': config_options.Type(bool, default=False),
+        # Keep the previous output in `site_dir` and don't touch the files whose content is
+        # unchanged. Files which are no longer part of the site are removed after the build.
+        'skip_unchanged': config_options.Type(bool, default=False),
+        # The date of the build as a number of seconds since the epoch, which is used instead
+        # of the current time unless the SOURCE_DATE_EPOCH environment variable is set.
+        'source_date_epoch': config_options.Type(int),
+        # Build into a staging directory next to `site_dir`, which replaces `site_dir` only
+        # once the build has succeeded.
+        'atomic_build': config_options.Type(bool, default=False),
+        # How the static files are published to `site_dir`: by copying them, as hard links or
+        # reflinks to the source files, or `auto` to pick the fastest of them.
+        'static_copy_mode': config_options.Choice(utils.COPY_MODES, default='copy'),
+        # Write a compressed `.gz` companion of each output file with one of the
+        # `precompress_extensions`, at the compression level `precompress_level`.
+        'precompress': config_options.Type(bool, default=False),
+        'precompress_extensions': config_options.Type(
+            list, default=['.html', '.css', '.js', '.json', '.xml']
+        ),
+        'precompress_level': config_options.Choice(tuple(range(1, 10)), default=9),
         # the remote branch to commit to when using gh-deploy
         'remote_branch': config_options.Type(str, default='gh-pages'),
         # the remote name to push to when using gh-deploy
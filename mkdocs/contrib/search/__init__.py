@@ -72,6 +72,10 @@ class SearchPlugin(BasePlugin):
             )
         return config
 
+    def on_reset(self, config, **kwargs):
+        "Drop the search index of the previous build."
+        self.search_index = None
+
     def on_pre_build(self, config, **kwargs):
         "Create search index instance for later use."
         self.search_index = SearchIndex(**self.config)
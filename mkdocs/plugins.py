@@ -5,17 +5,22 @@ Implements the plugin API for MkDocs.
 
 
 import logging
+import time
 from collections import OrderedDict
-from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
-import importlib_metadata
 import jinja2.environment
 
 from mkdocs.config.base import Config
-from mkdocs.livereload import LiveReloadServer
 from mkdocs.structure.files import Files
 from mkdocs.structure.nav import Navigation
 from mkdocs.structure.pages import Page
+from mkdocs.utils import entry_points
+from mkdocs.utils.profiler import EventTimings
+
+if TYPE_CHECKING:
+    # Only `mkdocs serve` needs the development server and its dependencies.
+    from mkdocs.livereload import LiveReloadServer
 
 log = logging.getLogger('mkdocs.plugins')
 
@@ -23,7 +28,7 @@ log = logging.getLogger('mkdocs.plugins')
 def get_plugins():
     """Return a dict of all installed Plugins as {name: EntryPoint}."""
 
-    plugins = importlib_metadata.entry_points(group='mkdocs.plugins')
+    plugins = entry_points.get_entry_points('mkdocs.plugins')
 
     # Allow third-party plugins to override core plugins
     pluginmap = {}
@@ -62,8 +67,8 @@ class BasePlugin:
 
     @staticmethod
     def on_serve(
-        server: LiveReloadServer, config: Config, builder: Callable
-    ) -> Optional[LiveReloadServer]:
+        server: 'LiveReloadServer', config: Config, builder: Callable
+    ) -> Optional['LiveReloadServer']:
         """
         The `serve` event is only called when the `serve` command is used during
         development. It is passed the `Server` instance which can be modified before
@@ -80,6 +85,22 @@ class BasePlugin:
         """
         return server
 
+    @staticmethod
+    def on_reset(config: Config) -> None:
+        """
+        The `reset` event is only called when the `serve` command is used during
+        development, before a rebuild which reuses the configuration and the plugin
+        instances of the previous build because the configuration files are
+        unchanged. Use this event to clear any state which the plugin keeps from one
+        build to the next.
+
+        The configuration and the plugins are only reused if every plugin defines
+        this event. Otherwise, they are all loaded again for each rebuild.
+
+        Parameters:
+            config: global configuration object, as it was before the `config` event
+        """
+
     @staticmethod
     def on_config(config: Config) -> Optional[Config]:
         """
@@ -127,7 +148,10 @@ class BasePlugin:
     def on_nav(nav: Navigation, config: Config, files: Files) -> Optional[Navigation]:
         """
         The `nav` event is called after the site navigation is created and can
-        be used to alter the site navigation.
+        be used to alter the site navigation. The titles and the `meta` of the
+        pages have been read from the heads of their files, unless a plugin
+        handles the `page_read_source` event. Their `meta` is read again with
+        their Markdown.
 
         Parameters:
             nav: global navigation object
@@ -308,6 +332,28 @@ class BasePlugin:
         """
         return html
 
+    @staticmethod
+    def on_page_inputs(
+        inputs: List[Any], page: Page, config: Config, files: Files
+    ) -> Optional[List[Any]]:
+        """
+        The `page_inputs` event is only called in an incremental build, after the
+        `page_content` event of all pages. It can be used to declare any inputs of
+        the page's output which are not known to MkDocs, such as data used by the
+        plugin in its `page_context` or `post_page` events. The output of the page
+        is only rendered again if its inputs have changed since the previous build.
+
+        Parameters:
+            inputs: list of JSON-serializable values which the page depends on
+            page: `mkdocs.nav.Page` instance
+            config: global configuration object
+            files: global files collection
+
+        Returns:
+            list of JSON-serializable values which the page depends on
+        """
+        return inputs
+
     @staticmethod
     def on_page_context(
         context: Dict[str, Any], page: Page, config: Config, nav: Navigation
@@ -358,11 +404,17 @@ class PluginCollection(OrderedDict):
     In addition to being a dict of Plugin instances, each event method is registered
     upon being added. All registered methods for a given event can then be run in order
     by calling `run_event`.
+
+    When `timings` is set to an `EventTimings` instance, the time spent in each registered
+    method is recorded in it.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.events = {k: [] for k in EVENTS}
+        self.timings: Optional[EventTimings] = None
+        # The name of the plugin of each registered method, for `timings`.
+        self._plugin_names: Dict[Callable, str] = {}
 
     def _register_event(self, event_name, method):
         """Register a method for an event."""
@@ -381,6 +433,7 @@ class PluginCollection(OrderedDict):
             method = getattr(value, event_name)
             if callable(method) and method is not getattr(BasePlugin, event_name):
                 self._register_event(event_name[3:], method)
+                self._plugin_names[method] = key
 
     def run_event(self, name: str, item: T = None, **kwargs) -> T:
         """
@@ -392,6 +445,9 @@ class PluginCollection(OrderedDict):
         be modified by the event method.
         """
 
+        if self.timings is not None:
+            return self._run_event_timed(name, item, **kwargs)
+
         pass_item = item is not None
         for method in self.events[name]:
             if pass_item:
@@ -402,3 +458,27 @@ class PluginCollection(OrderedDict):
             if result is not None:
                 item = result
         return item
+
+    def _run_event_timed(self, name: str, item: T = None, **kwargs) -> T:
+        """Like `run_event`, but record the time spent in each method in `timings`."""
+
+        pass_item = item is not None
+        page = kwargs.get('page', item if isinstance(item, Page) else None)
+        for method in self.events[name]:
+            start = time.perf_counter()
+            if pass_item:
+                result = method(item, **kwargs)
+            else:
+                result = method(**kwargs)
+            self.timings.add(
+                self._plugin_names.get(method, type(getattr(method, '__self__', method)).__name__),
+                name,
+                time.perf_counter() - start,
+                page.file.src_uri if page is not None else None,
+            )
+            # keep item if method returned `None`
+            if result is not None:
+                item = result
+            if isinstance(item, Page):
+                page = item
+        return item
@@ -2,6 +2,8 @@ import fnmatch
 import logging
 import os
 import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePath
 from typing import Dict, Iterable, Iterator, List, Optional
 from urllib.parse import quote as urlquote
@@ -10,20 +12,53 @@ import jinja2.environment
 
 from mkdocs import utils
 from mkdocs.config.base import Config
+from mkdocs.utils.writer import BackgroundWriter
 
 log = logging.getLogger(__name__)
 
+# The number of times that the `src_uri` of a `File` was changed after the file was created.
+_src_uri_changes = 0
+
 
 class Files:
-    """A collection of [File][mkdocs.structure.files.File] objects."""
+    """
+    A collection of [File][mkdocs.structure.files.File] objects.
+
+    The files are indexed by `src_uri` and by category. When the `src_uri` of a file changes
+    after it was added, the indexes are rebuilt before they are used again.
+    """
+
+    # The categories of files which are indexed, with the name of the `File` method which
+    # tells whether a file belongs to each of them.
+    _categories = {
+        'documentation_pages': 'is_documentation_page',
+        'static_pages': 'is_static_page',
+        'media_files': 'is_media_file',
+        'javascript_files': 'is_javascript',
+        'css_files': 'is_css',
+    }
 
     def __init__(self, files: List['File']):
-        self._files = files
-        self._src_uris = None
+        self._index(files)
+
+    def _index(self, files: Iterable['File']) -> None:
+        # The files are indexed by a sequence number, in the order in which they were added.
+        self._files: Dict[int, File] = {}
+        self._next_key = 0
+        # The `src_uri` of each file when it was indexed, the keys of the files of each
+        # `src_uri`, and the files of each category.
+        self._key_uris: Dict[int, str] = {}
+        self._keys_by_uri: Dict[str, Dict[int, None]] = {}
+        self._views: Dict[str, Dict[int, File]] = {name: {} for name in self._categories}
+        self._src_uris: Dict[str, File] = {}
+        self._src_uri_changes = _src_uri_changes
+        for file in files:
+            self._add(file)
 
     def __iter__(self) -> Iterator['File']:
         """Iterate over the files within."""
-        return iter(self._files)
+        # Iterate over a snapshot, so that the collection can be modified meanwhile.
+        return iter(list(self._files.values()))
 
     def __len__(self) -> int:
         """The number of files within."""
@@ -31,60 +66,110 @@ class Files:
 
     def __contains__(self, path: str) -> bool:
         """Whether the file with this `src_uri` is in the collection."""
-        return PurePath(path).as_posix() in self.src_uris
+        self._sync()
+        return PurePath(path).as_posix() in self._src_uris
 
     @property
     def src_paths(self) -> Dict[str, 'File']:
         """Soft-deprecated, prefer `src_uris`."""
-        return {file.src_path: file for file in self._files}
+        return {file.src_path: file for file in self._files.values()}
 
     @property
     def src_uris(self) -> Dict[str, 'File']:
         """A mapping containing every file, with the keys being their
         [`src_uri`][mkdocs.structure.files.File.src_uri]."""
-        if self._src_uris is None:
-            self._src_uris = {file.src_uri: file for file in self._files}
+        self._sync()
         return self._src_uris
 
     def get_file_from_path(self, path: str) -> Optional['File']:
         """Return a File instance with File.src_uri equal to path."""
-        return self.src_uris.get(PurePath(path).as_posix())
+        self._sync()
+        return self._src_uris.get(PurePath(path).as_posix())
+
+    def _sync(self) -> None:
+        """Rebuild the indexes if the `src_uri` of any of the files changed since they were added."""
+        if self._src_uri_changes == _src_uri_changes:
+            return
+        self._src_uri_changes = _src_uri_changes
+        if any(file.src_uri != self._key_uris[key] for key, file in self._files.items()):
+            self._index(list(self._files.values()))
 
     def append(self, file: 'File') -> None:
         """Append file to Files collection."""
-        self._src_uris = None
-        self._files.append(file)
+        self._sync()
+        self._add(file)
+
+    def _add(self, file: 'File') -> None:
+        key = self._next_key
+        self._next_key += 1
+        self._files[key] = file
+        self._key_uris[key] = file.src_uri
+        self._keys_by_uri.setdefault(file.src_uri, {})[key] = None
+        self._src_uris[file.src_uri] = file
+        for name, method in self._categories.items():
+            if getattr(file, method)():
+                self._views[name][key] = file
 
     def remove(self, file: 'File') -> None:
         """Remove file from Files collection."""
-        self._src_uris = None
-        self._files.remove(file)
-
-    def copy_static_files(self, dirty: bool = False) -> None:
-        """Copy static files from source to destination."""
-        for file in self:
-            if not file.is_documentation_page():
-                file.copy_file(dirty)
+        key = self._find(file)
+        if key is None:
+            raise ValueError(f"{file!r} is not in the collection.")
+        del self._files[key]
+        for view in self._views.values():
+            view.pop(key, None)
+        src_uri = self._key_uris.pop(key)
+        keys = self._keys_by_uri[src_uri]
+        del keys[key]
+        # Like a dict of all the files, `src_uris` maps to the last file with the `src_uri`.
+        if keys:
+            self._src_uris[src_uri] = self._files[next(reversed(list(keys)))]
+        else:
+            del self._keys_by_uri[src_uri]
+            del self._src_uris[src_uri]
+
+    def _find(self, file: 'File') -> Optional[int]:
+        """Return the key of the first file of the collection which is equal to `file`."""
+        self._sync()
+        for key in self._keys_by_uri.get(file.src_uri, ()):
+            if self._files[key] == file:
+                return key
+        return None
+
+    def copy_static_files(
+        self, dirty: bool = False, writer: Optional[BackgroundWriter] = None
+    ) -> None:
+        """Copy static files from source to destination, through the `writer` if one is given."""
+        self._sync()
+        pages = self._views['documentation_pages']
+        for key, file in list(self._files.items()):
+            if key not in pages:
+                file.copy_file(dirty, writer)
 
     def documentation_pages(self) -> Iterable['File']:
         """Return iterable of all Markdown page file objects."""
-        return [file for file in self if file.is_documentation_page()]
+        self._sync()
+        return list(self._views['documentation_pages'].values())
 
     def static_pages(self) -> Iterable['File']:
         """Return iterable of all static page file objects."""
-        return [file for file in self if file.is_static_page()]
+        self._sync()
+        return list(self._views['static_pages'].values())
 
     def media_files(self) -> Iterable['File']:
         """Return iterable of all file objects which are not documentation or static pages."""
-        return [file for file in self if file.is_media_file()]
+        self._sync()
+        return list(self._views['media_files'].values())
 
     def javascript_files(self) -> Iterable['File']:
         """Return iterable of all javascript file objects."""
-        return [file for file in self if file.is_javascript()]
+        self._sync()
+        return list(self._views['javascript_files'].values())
 
     def css_files(self) -> Iterable['File']:
         """Return iterable of all CSS file objects."""
-        return [file for file in self if file.is_css()]
+        self._sync()
+        return list(self._views['css_files'].values())
 
     def add_files_from_theme(self, env: jinja2.Environment, config: Config) -> None:
         """Retrieve static files from Jinja environment and add to collection."""
@@ -132,17 +217,62 @@ class File:
     File objects have the following properties, which are Unicode strings:
     """
 
-    src_uri: str
-    """The pure path (always '/'-separated) of the source file relative to the source directory."""
+    # The absolute paths are derived, on first use, from the directories and the paths relative
+    # to them when the file was created, unless they are set explicitly. `__dict__` allows
+    # other attributes.
+    __slots__ = (
+        'page',
+        'name',
+        'dest_uri',
+        'url',
+        '_src_dir',
+        '_src_uri',
+        '_abs_src_path',
+        '_dest_dir',
+        '_dest_uri',
+        '_abs_dest_path',
+        '__dict__',
+        '__weakref__',
+    )
+
+    @property
+    def src_uri(self) -> str:
+        """The pure path (always '/'-separated) of the source file relative to the source directory."""
+        return self._src_uri
+
+    @src_uri.setter
+    def src_uri(self, value):
+        global _src_uri_changes
+        # The absolute path stays the one of the `src_uri` which the file was created with.
+        self._abs_src_path = self.abs_src_path
+        self._src_uri = value
+        # Let the `Files` collections know that their indexes may be outdated.
+        _src_uri_changes += 1
+
+    @property
+    def abs_src_path(self) -> str:
+        """The absolute concrete path of the source file. Will use backslashes on Windows."""
+        if self._abs_src_path is None:
+            self._abs_src_path = os.path.normpath(os.path.join(self._src_dir, self._src_uri))
+        return self._abs_src_path
 
-    abs_src_path: str
-    """The absolute concrete path of the source file. Will use backslashes on Windows."""
+    @abs_src_path.setter
+    def abs_src_path(self, value):
+        self._abs_src_path = value
 
     dest_uri: str
     """The pure path (always '/'-separated) of the destination file relative to the destination directory."""
 
-    abs_dest_path: str
-    """The absolute concrete path of the destination file. Will use backslashes on Windows."""
+    @property
+    def abs_dest_path(self) -> str:
+        """The absolute concrete path of the destination file. Will use backslashes on Windows."""
+        if self._abs_dest_path is None:
+            self._abs_dest_path = os.path.normpath(os.path.join(self._dest_dir, self._dest_uri))
+        return self._abs_dest_path
+
+    @abs_dest_path.setter
+    def abs_dest_path(self, value):
+        self._abs_dest_path = value
 
     url: str
     """The URI of the destination file relative to the destination directory as a string."""
@@ -154,7 +284,7 @@ class File:
 
     @src_path.setter
     def src_path(self, value):
-        self.src_uri = PurePath(value).as_posix()
+        self.src_uri = _as_posix(value)
 
     @property
     def dest_path(self) -> str:
@@ -163,15 +293,18 @@ class File:
 
     @dest_path.setter
     def dest_path(self, value):
-        self.dest_uri = PurePath(value).as_posix()
+        self.dest_uri = _as_posix(value)
 
     def __init__(self, path: str, src_dir: str, dest_dir: str, use_directory_urls: bool):
         self.page = None
-        self.src_path = path
-        self.abs_src_path = os.path.normpath(os.path.join(src_dir, self.src_path))
+        self._src_uri = _as_posix(path)
+        self._src_dir = src_dir
+        self._abs_src_path = None
         self.name = self._get_stem()
         self.dest_uri = self._get_dest_path(use_directory_urls)
-        self.abs_dest_path = os.path.normpath(os.path.join(dest_dir, self.dest_path))
+        self._dest_dir = dest_dir
+        self._dest_uri = self.dest_uri
+        self._abs_dest_path = None
         self.url = self._get_url(use_directory_urls)
 
     def __eq__(self, other):
@@ -190,27 +323,27 @@ class File:
 
     def _get_stem(self) -> str:
         """Return the name of the file without it's extension."""
-        filename = posixpath.basename(self.src_uri)
+        filename = self.src_uri.rpartition('/')[2]
         stem, ext = posixpath.splitext(filename)
         return 'index' if stem in ('index', 'README') else stem
 
     def _get_dest_path(self, use_directory_urls: bool) -> str:
         """Return destination path based on source path."""
         if self.is_documentation_page():
-            parent, filename = posixpath.split(self.src_uri)
+            parent, sep, filename = self.src_uri.rpartition('/')
             if not use_directory_urls or self.name == 'index':
                 # index.md or README.md => index.html
                 # foo.md => foo.html
-                return posixpath.join(parent, self.name + '.html')
+                return f'{parent}{sep}{self.name}.html'
             else:
                 # foo.md => foo/index.html
-                return posixpath.join(parent, self.name, 'index.html')
+                return f'{parent}{sep}{self.name}/index.html'
         return self.src_uri
 
     def _get_url(self, use_directory_urls: bool) -> str:
         """Return url based in destination path."""
         url = self.dest_uri
-        dirname, filename = posixpath.split(url)
+        dirname, _, filename = url.rpartition('/')
         if use_directory_urls and filename == 'index.html':
             if dirname == '':
                 url = '.'
@@ -222,13 +355,20 @@ class File:
         """Return url for file relative to other file."""
         return utils.get_relative_url(self.url, other.url if isinstance(other, File) else other)
 
-    def copy_file(self, dirty: bool = False) -> None:
-        """Copy source file to destination, ensuring parent directories exist."""
+    def copy_file(self, dirty: bool = False, writer: Optional[BackgroundWriter] = None) -> None:
+        """
+        Copy source file to destination, ensuring parent directories exist.
+
+        If a `writer` is given, the file is copied in the background.
+        """
         if dirty and not self.is_modified():
             log.debug(f"Skip copying unmodified file: '{self.src_uri}'")
         else:
             log.debug(f"Copying media file: '{self.src_uri}'")
-            utils.copy_file(self.abs_src_path, self.abs_dest_path)
+            if writer is not None:
+                writer.copy_file(self.abs_src_path, self.abs_dest_path)
+            else:
+                utils.copy_file(self.abs_src_path, self.abs_dest_path)
 
     def is_modified(self) -> bool:
         if os.path.isfile(self.abs_dest_path):
@@ -256,39 +396,101 @@ class File:
         return self.src_uri.endswith('.css')
 
 
+def _as_posix(path: str) -> str:
+    """Return `PurePath(path).as_posix()`, without parsing paths which are already normalized."""
+    if isinstance(path, str):
+        parts = path.split('/')
+        if not ('' in parts or '.' in parts or '\\' in path or ':' in path):
+            return path
+    return PurePath(path).as_posix()
+
+
+# The gitignore-style patterns of the files of the `docs_dir` which are never part of the site.
+_DEFAULT_EXCLUDE = ('.*', '/templates')
+
+
 def get_files(config: Config) -> Files:
     """Walk the `docs_dir` and return a Files collection."""
     files = []
-    exclude = ['.*', '/templates']
-
-    for source_dir, dirnames, filenames in os.walk(config['docs_dir'], followlinks=True):
-        relative_dir = os.path.relpath(source_dir, config['docs_dir'])
-
-        for dirname in list(dirnames):
-            path = os.path.normpath(os.path.join(relative_dir, dirname))
-            # Skip any excluded directories
-            if _filter_paths(basename=dirname, path=path, is_dir=True, exclude=exclude):
-                dirnames.remove(dirname)
-        dirnames.sort()
-
-        for filename in _sort_files(filenames):
-            path = os.path.normpath(os.path.join(relative_dir, filename))
-            # Skip any excluded files
-            if _filter_paths(basename=filename, path=path, is_dir=False, exclude=exclude):
-                continue
-            # Skip README.md if an index file also exists in dir
-            if filename == 'README.md' and 'index.md' in filenames:
-                log.warning(
-                    f"Both index.md and README.md found. Skipping README.md from {source_dir}"
-                )
-                continue
+    exclude = _compile_exclude([*_DEFAULT_EXCLUDE, *config['exclude_docs']])
+    workers = config['jobs'] if config['jobs'] >= 1 else os.cpu_count() or 1
+
+    for relative_dir, filenames in _walk_docs_dir(config['docs_dir'], exclude, workers):
+        # Skip README.md if an index file also exists in dir
+        if 'README.md' in filenames and 'index.md' in filenames:
+            source_dir = os.path.normpath(os.path.join(config['docs_dir'], relative_dir))
+            log.warning(f"Both index.md and README.md found. Skipping README.md from {source_dir}")
+            filenames.remove('README.md')
+        for filename in filenames:
             files.append(
-                File(path, config['docs_dir'], config['site_dir'], config['use_directory_urls'])
+                File(
+                    posixpath.join(relative_dir, filename),
+                    config['docs_dir'],
+                    config['site_dir'],
+                    config['use_directory_urls'],
+                )
             )
 
     return Files(files)
 
 
+def _walk_docs_dir(docs_dir: str, exclude, workers: int = 1) -> Iterator:
+    """
+    Yield `(relative_dir, filenames)` for each directory of `docs_dir` which isn't excluded,
+    in the same order as `os.walk` with sorted directories.
+
+    With more than one worker, the directories are scanned by a pool of threads, ahead of the
+    directories whose files are yielded.
+    """
+    if workers <= 1:
+        stack = ['']
+        while stack:
+            relative_dir = stack.pop()
+            filenames, dirnames = _scan_dir(docs_dir, relative_dir, exclude)
+            yield relative_dir, filenames
+            stack.extend(posixpath.join(relative_dir, name) for name in reversed(dirnames))
+        return
+
+    with ThreadPoolExecutor(workers) as executor:
+
+        def scan(relative_dir):
+            filenames, dirnames = _scan_dir(docs_dir, relative_dir, exclude)
+            paths = [posixpath.join(relative_dir, name) for name in dirnames]
+            return filenames, [(path, executor.submit(scan, path)) for path in paths]
+
+        stack = [('', executor.submit(scan, ''))]
+        while stack:
+            relative_dir, future = stack.pop()
+            filenames, subdirs = future.result()
+            yield relative_dir, filenames
+            stack.extend(reversed(subdirs))
+
+
+def _scan_dir(docs_dir: str, relative_dir: str, exclude):
+    """
+    Return the sorted names of the files and of the subdirectories of a directory of the
+    `docs_dir`, except excluded ones. Like `os.walk`, symlinks to directories are followed and
+    unreadable directories are skipped.
+    """
+    filenames, dirnames = [], []
+    try:
+        with os.scandir(os.path.join(docs_dir, relative_dir)) as entries:
+            for entry in entries:
+                path = posixpath.join(relative_dir, entry.name)
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if not exclude(path + '/'):
+                        dirnames.append(entry.name)
+                elif not exclude(path):
+                    filenames.append(entry.name)
+    except OSError:
+        pass
+    return _sort_files(filenames), sorted(dirnames)
+
+
 def _sort_files(filenames: Iterable[str]) -> List[str]:
     """Always sort `index` or `README` as first filename in list."""
 
@@ -300,15 +502,69 @@ def _sort_files(filenames: Iterable[str]) -> List[str]:
     return sorted(filenames, key=key)
 
 
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a glob to a regular expression, in which `*` and `?` don't match `/` but `**`
+    matches any number of directories.
+    """
+    i, n = 0, len(pattern)
+    res = []
+    while i < n:
+        c = pattern[i]
+        i += 1
+        if c == '*':
+            if pattern.startswith('**/', i - 1):
+                res.append('(?:.*/)?')
+                i += 2
+            elif pattern.startswith('*', i):
+                res.append('.*')
+                i += 1
+            else:
+                res.append('[^/]*')
+        elif c == '?':
+            res.append('[^/]')
+        elif c == '[':
+            j = i + 1 if pattern.startswith(('!', '^'), i) else i
+            j = pattern.find(']', j + 1)
+            if j == -1:
+                res.append('\\[')
+            else:
+                chars = pattern[i:j].replace('\\', '\\\\')
+                if chars.startswith('!'):
+                    chars = '^' + chars[1:]
+                res.append(f'[{chars}]')
+                i = j + 1
+        else:
+            res.append(re.escape(c))
+    return ''.join(res)
+
+
+def _compile_exclude(patterns: Iterable[str]):
+    """
+    Compile gitignore-style patterns to a single regular expression, and return a function
+    which tells whether a path relative to the `docs_dir` is excluded. The paths of
+    directories are passed with a trailing `/`.
+
+    Patterns ending with `/` only match directories. Patterns which contain a `/` are matched
+    against the whole path, others against the name of the file or directory.
+    """
+    regexes = []
+    for pattern in patterns:
+        pattern = pattern.strip()
+        if not pattern.strip('/') or pattern.startswith('#'):
+            continue
+        suffix = '/' if pattern.endswith('/') else '/?'
+        pattern = pattern.rstrip('/')
+        prefix = '' if '/' in pattern else '(?:.*/)?'
+        regexes.append(f'{prefix}{_translate_glob(pattern.lstrip("/"))}{suffix}')
+    if not regexes:
+        return lambda path: False
+    flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+    regex = re.compile('|'.join(f'(?:{r})' for r in regexes), flags)
+    return lambda path: regex.fullmatch(path) is not None
+
+
 def _filter_paths(basename: str, path: str, is_dir: bool, exclude: Iterable[str]) -> bool:
     """.gitignore style file filtering."""
-    for item in exclude:
-        # Items ending in '/' apply only to directories.
-        if item.endswith('/') and not is_dir:
-            continue
-        # Items starting with '/' apply to the whole path.
-        # In any other cases just the basename is used.
-        match = path if item.startswith('/') else basename
-        if fnmatch.fnmatch(match, item.strip('/')):
-            return True
-    return False
+    path = PurePath(path).as_posix()
+    return _compile_exclude(exclude)(path + '/' if is_dir else path)
@@ -38,6 +38,8 @@ class Navigation:
 
 
 class Section:
+    __slots__ = ('title', 'children', 'parent', '__active', '__dict__', '__weakref__')
+
     def __init__(self, title: str, children: List[Union[Page, 'Section', 'Link']]) -> None:
         self.title = title
         self.children = children
@@ -96,6 +98,8 @@ class Section:
 
 
 class Link:
+    __slots__ = ('title', 'url', 'parent', '__dict__', '__weakref__')
+
     def __init__(self, title: str, url: str):
         self.title = title
         self.url = url
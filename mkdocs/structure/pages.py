@@ -1,7 +1,10 @@
 import logging
 import os
 import posixpath
-from typing import Any, Iterable, Mapping, Optional
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Mapping, Optional, Tuple, Union
 from urllib.parse import unquote as urlunquote
 from urllib.parse import urljoin, urlsplit, urlunsplit
 from xml.etree.ElementTree import Element
@@ -11,16 +14,39 @@ from markdown.extensions import Extension
 from markdown.treeprocessors import Treeprocessor
 from markdown.util import AMP_SUBSTITUTE
 
+import mkdocs
 from mkdocs.config.base import Config
 from mkdocs.structure import nav
 from mkdocs.structure.files import File, Files
 from mkdocs.structure.toc import AnchorLink, get_toc
-from mkdocs.utils import get_build_date, get_markdown_title, meta
+from mkdocs.utils import get_build_date, meta
+from mkdocs.utils.cache import DiskCache, get_key
 
 log = logging.getLogger(__name__)
 
 
 class Page:
+    # `__dict__` allows plugins and themes to set other attributes.
+    __slots__ = (
+        'file',
+        'title',
+        'parent',
+        'previous_page',
+        'next_page',
+        '__active',
+        'update_date',
+        'canonical_url',
+        'abs_url',
+        'edit_url',
+        'markdown',
+        'content',
+        'toc',
+        'meta',
+        'links',
+        '__dict__',
+        '__weakref__',
+    )
+
     def __init__(self, title: Optional[str], file: File, config: Config) -> None:
         file.page = self
         self.file = file
@@ -28,12 +54,12 @@ class Page:
 
         # Navigation attributes
         self.parent = None
-        self.children = None
         self.previous_page = None
         self.next_page = None
         self.active = False
 
-        self.update_date = get_build_date()
+        # The date is the same for all the pages, so they share a single string.
+        self.update_date = sys.intern(get_build_date())
 
         self._set_canonical_url(config.get('site_url', None))
         self._set_edit_url(config.get('repo_url', None), config.get('edit_uri', None))
@@ -43,6 +69,8 @@ class Page:
         self.content = None
         self.toc = []
         self.meta = {}
+        # The relative links of the page, as `(target_uri, url)`, with `url` None for missing targets.
+        self.links = []
 
     def __eq__(self, other):
         return (
@@ -202,17 +230,25 @@ class Page:
                 log.error(f'Encoding error reading file: {self.file.src_path}')
                 raise
 
-        self.markdown, self.meta = meta.get_data(source)
-        self._set_title()
+        self.markdown, self.meta, markdown_title = meta.get_data_and_title(source)
+        self._set_title(markdown_title)
 
-    def _set_title(self) -> None:
+    def read_head(self) -> None:
+        """
+        Read the meta-data and the title of the page from the head of its source file, without
+        its Markdown. They are read again with the Markdown by `read_source`.
+        """
+        self.meta, markdown_title = meta.read_head(self.file.abs_src_path)
+        self._set_title(markdown_title)
+
+    def _set_title(self, markdown_title: Optional[str] = None) -> None:
         """
         Set the title for a Markdown document.
 
         Check these in order and use the first that returns a valid title:
         - value provided on init (passed in from config)
         - value of metadata 'title'
-        - content of the first H1 in Markdown content
+        - `markdown_title`, the content of the H1 which the Markdown content starts with
         - convert filename to title
         """
         if self.title is not None:
@@ -222,7 +258,7 @@ class Page:
             self.title = self.meta['title']
             return
 
-        title = get_markdown_title(self.markdown)
+        title = markdown_title
 
         if title is None:
             if self.is_homepage:
@@ -235,25 +271,236 @@ class Page:
 
         self.title = title
 
-    def render(self, config: Config, files: Files) -> None:
+    def render(
+        self,
+        config: Config,
+        files: Files,
+        cache: Optional[DiskCache] = None,
+        engine: Optional['MarkdownEngine'] = None,
+    ) -> None:
         """
         Convert the Markdown source file to HTML as per the config.
+
+        If a `cache` is given, the result is restored from it when neither the Markdown source,
+        the Markdown extensions config nor the targets of the page's relative links have changed
+        since it was stored there. The warnings logged while converting the page are stored
+        with it, and logged again when it is restored. If an `engine` is given, its Markdown
+        instance is reused, otherwise one is created for the page.
         """
 
-        extensions = [_RelativePathExtension(self.file, files)] + config['markdown_extensions']
+        key = None
+        if cache is not None:
+            key = get_key(
+                'markdown',
+                mkdocs.__version__,
+                markdown.__version__,
+                config['markdown_extensions'],
+                config['mdx_configs'],
+                self.file.src_uri,
+                self.file.url,
+                self.markdown,
+                # Warnings which aren't logged can't be stored.
+                log.isEnabledFor(logging.WARNING),
+            )
+        if key is not None:
+            entry = cache.get(key)
+            if entry is not None and self._restore_from_cache(entry, files):
+                return
 
-        md = markdown.Markdown(
-            extensions=extensions,
-            extension_configs=config['mdx_configs'] or {},
-        )
-        self.content = md.convert(self.markdown)
-        self.toc = get_toc(getattr(md, 'toc_tokens', []))
+        if engine is not None:
+            md, relpath = engine.get_markdown(config, self.file, files)
+        else:
+            md, relpath = _create_markdown(config, self.file, files)
+        if key is None:
+            self.content = md.convert(self.markdown)
+        else:
+            with _WarningCollector() as warnings:
+                self.content = md.convert(self.markdown)
+        toc_tokens = getattr(md, 'toc_tokens', [])
+        self.toc = get_toc(toc_tokens)
+        self.links = relpath.links
+
+        if key is not None:
+            entry = {
+                'content': self.content,
+                'toc': toc_tokens,
+                'links': relpath.links,
+                'warnings': warnings.records,
+            }
+            cache.set(key, entry)
+
+    def _restore_from_cache(self, entry: dict, files: Files) -> bool:
+        """Restore the rendered page from a cache entry if its links still resolve the same way."""
+        for target_uri, url in entry['links']:
+            if _resolve_link(self.file, files, target_uri) != url:
+                return False
+        for name, level, message in entry['warnings']:
+            logging.getLogger(name).log(level, message)
+        self.content = entry['content']
+        self.toc = get_toc(entry['toc'])
+        self.links = [tuple(link) for link in entry['links']]
+        return True
+
+
+class _WarningCollector(logging.Handler):
+    """
+    Collect the warnings logged to the `mkdocs` logger by the current thread, within a `with`
+    block, as `[logger name, level, message]`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.thread = threading.get_ident()
+        self.records: List[List[Any]] = []
+
+    def __enter__(self) -> '_WarningCollector':
+        logging.getLogger('mkdocs').addHandler(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        logging.getLogger('mkdocs').removeHandler(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.thread == self.thread:
+            self.records.append([record.name, record.levelno, record.getMessage()])
+
+
+def read_page_heads(pages: Iterable[Page], workers: int = 1) -> None:
+    """
+    Read the meta-data and the title of each page from the head of its source file, so that they
+    are known before, and whether or not, the Markdown of the pages is read and rendered.
+
+    With more than one worker, the files are read by a pool of threads. A page whose file can't
+    be read is left as it is, and the error is reported when its source is read.
+    """
+
+    def read_head(page):
+        try:
+            page.read_head()
+        except (OSError, ValueError) as e:
+            log.debug(f"Unable to read the head of '{page.file.src_path}': {e}")
+
+    if workers <= 1:
+        for page in pages:
+            read_head(page)
+        return
+    with ThreadPoolExecutor(workers) as executor:
+        for _ in executor.map(read_head, pages):
+            pass
+
+
+# The extensions of Python-Markdown which clear all of their state in `Markdown.reset`. Others,
+# such as `abbr`, would apply the definitions of a page to the next pages converted.
+_RESETTABLE_EXTENSIONS = frozenset(
+    {
+        'admonition',
+        'attr_list',
+        'codehilite',
+        'def_list',
+        'fenced_code',
+        'footnotes',
+        'legacy_attrs',
+        'legacy_em',
+        'md_in_html',
+        'meta',
+        'nl2br',
+        'sane_lists',
+        'smarty',
+        'tables',
+        'toc',
+        'wikilinks',
+    }
+)
+
+
+def _is_resettable(extension: Union[str, Extension]) -> bool:
+    """Return whether a Markdown extension, given by name or instance, is known to reset fully."""
+    if isinstance(extension, str):
+        name = extension.partition(':')[0]
+    else:
+        name = type(extension).__module__
+    if name.startswith('markdown.extensions.'):
+        name = name[len('markdown.extensions.') :]
+    return name in _RESETTABLE_EXTENSIONS
+
+
+class MarkdownEngine:
+    """
+    The Markdown instances of a build, which are reused to render all of its pages.
+
+    Creating a Markdown instance loads and sets up all of the extensions, so each thread keeps
+    an instance and only creates another one when the Markdown extensions config differs from
+    that of the previous page it rendered. An instance is only reused when all of the
+    extensions are known to clear their state between pages; otherwise, a new one is created
+    for each page. The instances are released with the engine, which only lives as long as a
+    build.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def get_markdown(
+        self, config: Config, file: File, files: Files
+    ) -> Tuple[markdown.Markdown, '_RelativePathExtension']:
+        """
+        Return a Markdown instance for the config, reset and ready to convert the page of
+        `file`, along with its `_RelativePathExtension`.
+        """
+        extensions = config['markdown_extensions']
+        extension_configs = config['mdx_configs'] or {}
+        if not all(_is_resettable(extension) for extension in extensions):
+            return _create_markdown(config, file, files)
+
+        engine = getattr(self._local, 'engine', None)
+        if (
+            engine is None
+            or engine['extensions'] != extensions
+            or engine['extension_configs'] != extension_configs
+        ):
+            md, relpath = _create_markdown(config, file, files)
+            engine = self._local.engine = {
+                'extensions': list(extensions),
+                'extension_configs': dict(extension_configs),
+                'md': md,
+                'relpath': relpath,
+            }
+        else:
+            engine['md'].reset()
+            engine['relpath'].set_page(file, files)
+        return engine['md'], engine['relpath']
+
+
+def _create_markdown(
+    config: Config, file: File, files: Files
+) -> Tuple[markdown.Markdown, '_RelativePathExtension']:
+    relpath = _RelativePathExtension(file, files)
+    md = markdown.Markdown(
+        extensions=[relpath] + config['markdown_extensions'],
+        extension_configs=config['mdx_configs'] or {},
+    )
+    return md, relpath
+
+
+def _resolve_link(file: File, files: Files, target_uri: str) -> Optional[str]:
+    """Return the URL of the file `target_uri` relative to `file`, or `None` if there is no such file."""
+    target_file = files.get_file_from_path(target_uri)
+    if target_file is None:
+        return None
+    return target_file.url_relative_to(file)
+
+
+def _warn_missing_link(file: File, target_uri: str) -> None:
+    log.warning(
+        f"Documentation file '{file.src_uri}' contains a link to "
+        f"'{target_uri}' which is not found in the documentation files."
+    )
 
 
 class _RelativePathTreeprocessor(Treeprocessor):
-    def __init__(self, file: File, files: Files) -> None:
+    def __init__(self, file: File, files: Files, links: List[Tuple[str, Optional[str]]]) -> None:
         self.file = file
         self.files = files
+        self.links = links
 
     def run(self, root: Element) -> Element:
         """
@@ -298,14 +545,12 @@ class _RelativePathTreeprocessor(Treeprocessor):
         target_uri = posixpath.normpath(target_uri).lstrip('/')
 
         # Validate that the target exists in files collection.
-        if target_uri not in self.files:
-            log.warning(
-                f"Documentation file '{self.file.src_uri}' contains a link to "
-                f"'{target_uri}' which is not found in the documentation files."
-            )
+        path = _resolve_link(self.file, self.files, target_uri)
+        # Record how the link was resolved, so that a cached rendering can be validated.
+        self.links.append((target_uri, path))
+        if path is None:
+            _warn_missing_link(self.file, target_uri)
             return url
-        target_file = self.files.get_file_from_path(target_uri)
-        path = target_file.url_relative_to(self.file)
         components = (scheme, netloc, path, query, fragment)
         return urlunsplit(components)
 
@@ -319,7 +564,14 @@ class _RelativePathExtension(Extension):
     def __init__(self, file: File, files: Files) -> None:
         self.file = file
         self.files = files
+        self.links = []
 
     def extendMarkdown(self, md) -> None:
-        relpath = _RelativePathTreeprocessor(self.file, self.files)
-        md.treeprocessors.register(relpath, "relpath", 0)
+        self.treeprocessor = _RelativePathTreeprocessor(self.file, self.files, self.links)
+        md.treeprocessors.register(self.treeprocessor, "relpath", 0)
+
+    def set_page(self, file: File, files: Files) -> None:
+        """Point the extension to another page, so that its Markdown instance can be reused."""
+        self.file = self.treeprocessor.file = file
+        self.files = self.treeprocessor.files = files
+        self.links = self.treeprocessor.links = []
@@ -21,6 +21,8 @@ class TableOfContents:
     Represents the table of contents for a given page.
     """
 
+    __slots__ = ('items', '__dict__', '__weakref__')
+
     def __init__(self, items):
         self.items = items
 
@@ -39,6 +41,8 @@ class AnchorLink:
     A single entry in the table of contents.
     """
 
+    __slots__ = ('title', 'id', 'level', 'children', 'active', '__dict__', '__weakref__')
+
     def __init__(self, title: str, id: str, level: int):
         self.title, self.id, self.level = title, id, level
         self.children = []
@@ -0,0 +1,4 @@
+import os
+
+# The tests mock the entry points of the installed packages, which must not come from a cache.
+os.environ.setdefault('MKDOCS_NO_ENTRY_POINTS_CACHE', '1')
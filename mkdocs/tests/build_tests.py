@@ -1,16 +1,26 @@
 #!/usr/bin/env python
 
+import errno
+import gzip
+import json
+import os
 import sys
+import tempfile
 import unittest
 from unittest import mock
 
+import markdown
+
+from mkdocs import utils
 from mkdocs.commands import build
 from mkdocs.exceptions import PluginError
+from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import File, Files
 from mkdocs.structure.nav import get_navigation
 from mkdocs.structure.pages import Page
 from mkdocs.tests.base import PathAssertionMixin, load_config, tempdir
 from mkdocs.utils import meta
+from mkdocs.utils.writer import BackgroundWriter
 
 
 def build_page(title, path, config, md_src=''):
@@ -25,6 +35,18 @@ def build_page(title, path, config, md_src=''):
     return page, files
 
 
+# Plugins which are part of the inputs of incremental builds must be identifiable by their
+# import path, so this one isn't defined within a test.
+class InputsPlugin(BasePlugin):
+    def __init__(self, value):
+        self.value = value
+
+    def on_page_inputs(self, inputs, page, **kwargs):
+        if page.file.src_uri == 'index.md':
+            inputs.append(self.value)
+        return inputs
+
+
 class BuildTests(PathAssertionMixin, unittest.TestCase):
     def _get_env_with_null_translations(self, config):
         env = config['theme'].get_env()
@@ -228,16 +250,72 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
         mock_write_file.assert_called_once()
         mock_build_template.assert_called_once()
 
-    @mock.patch('mkdocs.utils.write_file')
-    @mock.patch('mkdocs.commands.build._build_template', return_value='some content')
-    @mock.patch('gzip.GzipFile')
-    def test_build_sitemap_template(self, mock_gzip_gzipfile, mock_build_template, mock_write_file):
-        cfg = load_config()
+    def _get_sitemap_files(self, cfg, count):
+        files = Files(
+            [File(f'page-{i}.md', cfg['docs_dir'], cfg['site_dir'], True) for i in range(count)]
+        )
+        for file in files:
+            Page(None, file, cfg)
+        return files
+
+    @tempdir()
+    def test_build_sitemap_template(self, site_dir):
+        cfg = load_config(site_dir=site_dir, site_url='https://example.com/')
+        files = self._get_sitemap_files(cfg, 3)
         env = cfg['theme'].get_env()
-        build._build_theme_template('sitemap.xml', env, mock.Mock(), cfg, mock.Mock())
-        mock_write_file.assert_called_once()
-        mock_build_template.assert_called_once()
-        mock_gzip_gzipfile.assert_called_once()
+        build._build_theme_template('sitemap.xml', env, files, cfg, mock.Mock())
+        expected = env.get_template('sitemap.xml').render(
+            build.get_context(mock.Mock(), files, cfg, base_url='.')
+        )
+        with open(os.path.join(site_dir, 'sitemap.xml'), encoding='utf-8') as f:
+            self.assertEqual(f.read(), expected)
+        with open(os.path.join(site_dir, 'sitemap.xml.gz'), 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()).decode('utf-8'), expected)
+        self.assertEqual(expected.count('<loc>'), 3)
+        self.assertEqual(sorted(os.listdir(site_dir)), ['sitemap.xml', 'sitemap.xml.gz'])
+
+    @tempdir()
+    def test_build_sitemap_template_shards(self, site_dir):
+        cfg = load_config(site_dir=site_dir, site_url='https://example.com/', precompress=True)
+        files = self._get_sitemap_files(cfg, 5)
+        env = cfg['theme'].get_env()
+        writer = BackgroundWriter(0)
+        with mock.patch('mkdocs.utils.sitemap.MAX_URLS', 2):
+            build._build_theme_template('sitemap.xml', env, files, cfg, mock.Mock(), writer)
+            self.assertEqual(
+                set(build._get_template_outputs(cfg, files)),
+                {
+                    '404.html',
+                    'sitemap.xml',
+                    'sitemap.xml.gz',
+                    'sitemap-1.xml',
+                    'sitemap-1.xml.gz',
+                    'sitemap-2.xml',
+                    'sitemap-2.xml.gz',
+                    'sitemap-3.xml',
+                    'sitemap-3.xml.gz',
+                },
+            )
+        # The compressed copies are left to the compression stage.
+        self.assertEqual(
+            sorted(os.listdir(site_dir)),
+            ['sitemap-1.xml', 'sitemap-2.xml', 'sitemap-3.xml', 'sitemap.xml'],
+        )
+        self.assertEqual(writer.outputs, {os.path.join(site_dir, n) for n in os.listdir(site_dir)})
+        with open(os.path.join(site_dir, 'sitemap.xml'), encoding='utf-8') as f:
+            index = f.read()
+        self.assertIn('<sitemapindex', index)
+        self.assertIn('<loc>https://example.com/sitemap-3.xml</loc>', index)
+        for name, urls in (
+            ('sitemap-1.xml', ['page-0/', 'page-1/']),
+            ('sitemap-3.xml', ['page-4/']),
+        ):
+            with open(os.path.join(site_dir, name), encoding='utf-8') as f:
+                content = f.read()
+            self.assertEqual(
+                [line.strip() for line in content.splitlines() if '<loc>' in line],
+                [f'<loc>https://example.com/{url}</loc>' for url in urls],
+            )
 
     @mock.patch('mkdocs.utils.write_file')
     @mock.patch('mkdocs.commands.build._build_template', return_value='')
@@ -564,6 +642,473 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
         self.assertPathNotExists(site_dir, 'main.html')
         self.assertPathNotExists(site_dir, 'locales')
 
+    @tempdir(
+        files={
+            'index.md': '# Home\n\n[Link](foo/bar.md)',
+            'foo/bar.md': '# Bar\n\n## Section\n\n[Home](../index.md) [Missing](missing.md)',
+            'foo/baz.md': 'baz',
+        }
+    )
+    @mock.patch.dict(os.environ, {'SOURCE_DATE_EPOCH': '123'})
+    def test_parallel_build_matches_serial_build(self, docs_dir):
+        outputs = []
+        for jobs in (1, 2):
+            with tempfile.TemporaryDirectory() as site_dir:
+                cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, jobs=jobs)
+                with self.assertLogs('mkdocs', level='WARNING') as cm:
+                    build.build(cfg)
+                output = {}
+                for path in ('index.html', 'foo/bar/index.html', 'foo/baz/index.html'):
+                    with open(os.path.join(site_dir, path), 'rb') as f:
+                        output[path] = f.read()
+                outputs.append((output, cm.output))
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(
+            outputs[1][1],
+            [
+                "WARNING:mkdocs.structure.pages:Documentation file 'foo/bar.md' contains a link "
+                "to 'foo/missing.md' which is not found in the documentation files."
+            ],
+        )
+
+    @tempdir(files={'index.md': '# Home\n\nhome', 'foo.md': '# Foo\n\nfoo', 'bar.md': 'bar'})
+    @mock.patch.dict(os.environ, {'SOURCE_DATE_EPOCH': '123'})
+    def test_parallel_build_page_context_in_main_process(self, docs_dir):
+        class ContextPlugin(BasePlugin):
+            def on_page_context(self, context, page, **kwargs):
+                self.pages.append(page.file.src_uri)
+                return context
+
+        outputs = []
+        for jobs in (1, 2):
+            with tempfile.TemporaryDirectory() as site_dir:
+                cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, jobs=jobs)
+                cfg['plugins']['context'] = plugin = ContextPlugin()
+                plugin.pages = []
+                build.build(cfg)
+                with open(os.path.join(site_dir, 'search', 'search_index.json'), 'rb') as f:
+                    outputs.append((f.read(), plugin.pages))
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(outputs[1][1], ['index.md', 'bar.md', 'foo.md'])
+        self.assertIn(b'"title":"Foo"', outputs[1][0])
+
+    @tempdir(files={'index.md': '[Foo](foo.md)', 'foo.md': '# Foo'})
+    @tempdir()
+    def test_url_cache_cleared_after_build(self, site_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir)
+        with mock.patch.object(utils, 'clear_url_cache', wraps=utils.clear_url_cache) as clear:
+            build.build(cfg)
+        clear.assert_called_once()
+        self.assertEqual(utils._get_norm_url.cache_info().currsize, 0)
+
+    @tempdir(files={'index.md': '# Home', 'foo.md': '# Foo', 'bar.md': '# Bar'})
+    @tempdir()
+    def test_markdown_instance_per_build(self, site_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir)
+        for _ in range(2):
+            with mock.patch('markdown.Markdown', wraps=markdown.Markdown) as mock_md:
+                build.build(cfg)
+            # The pages of a build share a Markdown instance, which isn't kept for the next one.
+            mock_md.assert_called_once()
+
+    @tempdir(files={'index.md': 'page content'})
+    @tempdir()
+    def test_parallel_build_error(self, site_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, jobs=2)
+        with mock.patch('mkdocs.structure.pages.Page.render', side_effect=ValueError('Error')):
+            with self.assertLogs('mkdocs', level='ERROR') as cm:
+                with self.assertRaises(ValueError):
+                    build.build(cfg)
+        self.assertEqual(
+            cm.output,
+            ["ERROR:mkdocs.commands.build:Error reading page 'index.md': Error"],
+        )
+
+    def _build_incremental(self, site_dir, plugins=None, **kwargs):
+        """Perform an incremental build and return the pages which were written."""
+        cfg = load_config(site_dir=site_dir, incremental=True, **kwargs)
+        for name, plugin in (plugins or {}).items():
+            cfg['plugins'][name] = plugin
+        written = []
+        write_file = BackgroundWriter.write_file
+
+        def record_write_file(writer, content, output_path):
+            written.append(os.path.relpath(output_path, site_dir))
+            write_file(writer, content, output_path)
+
+        with mock.patch.object(BackgroundWriter, 'write_file', record_write_file):
+            build.build(cfg)
+        return sorted(path for path in written if path.endswith('index.html'))
+
+    def _read_site_files(self, site_dir):
+        output = {}
+        for dirpath, dirnames, filenames in os.walk(site_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                with open(path, 'rb') as f:
+                    output[os.path.relpath(path, site_dir)] = f.read()
+        return output
+
+    @tempdir(
+        files={
+            'index.md': '# Home\n\n[Link](foo.md)',
+            'foo.md': '# Foo\n\nfoo',
+            'bar.md': '# Bar\n\nbar',
+            'img.jpg': '',
+        }
+    )
+    @tempdir()
+    @tempdir()
+    @mock.patch.dict(os.environ, {'SOURCE_DATE_EPOCH': '123'})
+    def test_incremental_build(self, cache_dir, site_dir, docs_dir):
+        def build_incremental():
+            return self._build_incremental(
+                site_dir,
+                docs_dir=docs_dir,
+                cache_dir=cache_dir,
+                nav=['index.md', 'foo.md', 'bar.md'],
+            )
+
+        all_pages = ['bar/index.html', 'foo/index.html', 'index.html']
+        self.assertEqual(build_incremental(), all_pages)
+        self.assertEqual(build_incremental(), [])
+
+        # A change to a page which isn't visible to other pages.
+        with open(os.path.join(docs_dir, 'bar.md'), 'w') as f:
+            f.write('# Bar\n\nbaz')
+        self.assertEqual(build_incremental(), ['bar/index.html'])
+
+        # Stale files are removed.
+        os.remove(os.path.join(docs_dir, 'img.jpg'))
+        self.assertEqual(build_incremental(), [])
+        self.assertPathNotExists(site_dir, 'img.jpg')
+
+        # A change to the title of a page in the navigation affects all pages.
+        with open(os.path.join(docs_dir, 'foo.md'), 'w') as f:
+            f.write('# New Foo\n\nfoo')
+        self.assertEqual(build_incremental(), all_pages)
+
+        # The output is the same as the one of a full build.
+        output = self._read_site_files(site_dir)
+        with tempfile.TemporaryDirectory() as clean_site_dir:
+            cfg = load_config(
+                docs_dir=docs_dir, site_dir=clean_site_dir, nav=['index.md', 'foo.md', 'bar.md']
+            )
+            build.build(cfg)
+            self.assertEqual(output, self._read_site_files(clean_site_dir))
+
+    @tempdir(files={'index.md': 'page content', 'other.md': 'other content'})
+    @tempdir()
+    @tempdir()
+    @mock.patch.dict(os.environ, {'SOURCE_DATE_EPOCH': '123'})
+    def test_incremental_build_after_full_build(self, cache_dir, site_dir, docs_dir):
+        kwargs = dict(docs_dir=docs_dir, cache_dir=cache_dir)
+        all_pages = ['index.html', 'other/index.html']
+        self.assertEqual(self._build_incremental(site_dir, **kwargs), all_pages)
+        output = self._read_site_files(site_dir)
+
+        # A build which isn't incremental, with another theme, overwrites the outputs.
+        cfg = load_config(site_dir=site_dir, theme={'name': 'readthedocs'}, **kwargs)
+        build.build(cfg)
+        self.assertNotEqual(self._read_site_files(site_dir), output)
+
+        self.assertEqual(self._build_incremental(site_dir, **kwargs), all_pages)
+        self.assertEqual(self._read_site_files(site_dir), output)
+        self.assertEqual(self._build_incremental(site_dir, **kwargs), [])
+
+    @tempdir(files={'index.md': '[Link](other.md)', 'other.md': 'other content'})
+    @tempdir()
+    @tempdir()
+    def test_incremental_build_linked_page_title(self, cache_dir, site_dir, docs_dir):
+        kwargs = dict(docs_dir=docs_dir, cache_dir=cache_dir, nav=['index.md'])
+        self.assertEqual(
+            self._build_incremental(site_dir, **kwargs), ['index.html', 'other/index.html']
+        )
+        with open(os.path.join(docs_dir, 'other.md'), 'w') as f:
+            f.write('# Another\n\nother content')
+        self.assertEqual(
+            self._build_incremental(site_dir, **kwargs), ['index.html', 'other/index.html']
+        )
+        self.assertEqual(self._build_incremental(site_dir, **kwargs), [])
+
+    @tempdir(files={'index.md': 'page content', 'other.md': 'other content'})
+    @tempdir()
+    @tempdir()
+    def test_incremental_build_page_inputs(self, cache_dir, site_dir, docs_dir):
+        kwargs = dict(docs_dir=docs_dir, cache_dir=cache_dir)
+        self._build_incremental(site_dir, plugins={'inputs': InputsPlugin('a')}, **kwargs)
+        self.assertEqual(
+            self._build_incremental(site_dir, plugins={'inputs': InputsPlugin('a')}, **kwargs),
+            [],
+        )
+        self.assertEqual(
+            self._build_incremental(site_dir, plugins={'inputs': InputsPlugin('b')}, **kwargs),
+            ['index.html'],
+        )
+
+    @tempdir(files={'index.md': 'page content', 'other.md': 'other', 'img.jpg': 'img'})
+    @tempdir()
+    def test_build_skip_unchanged(self, site_dir, docs_dir):
+        class PostBuildPlugin(BasePlugin):
+            def on_post_build(self, config):
+                utils.write_file(b'plugin', os.path.join(config['site_dir'], 'plugin.txt'))
+
+        def build_site():
+            cfg = load_config(
+                docs_dir=docs_dir, site_dir=site_dir, skip_unchanged=True, source_date_epoch=123
+            )
+            cfg['plugins']['post_build'] = PostBuildPlugin()
+            build.build(cfg)
+            return {
+                path: os.stat(os.path.join(site_dir, path)).st_mtime_ns
+                for path in ('index.html', 'other/index.html', 'img.jpg', 'plugin.txt')
+                if os.path.exists(os.path.join(site_dir, path))
+            }
+
+        mtimes = build_site()
+        # Backdate all outputs, so that any new write is noticeable.
+        for path in mtimes:
+            os.utime(os.path.join(site_dir, path), ns=(0, 0))
+        utils.write_file(b'', os.path.join(site_dir, 'stale', 'index.html'))
+        utils.write_file(b'', os.path.join(site_dir, '.hidden', 'index.html'))
+        with open(os.path.join(docs_dir, 'other.md'), 'w') as f:
+            f.write('new content')
+        os.remove(os.path.join(docs_dir, 'img.jpg'))
+
+        mtimes = build_site()
+        self.assertEqual(mtimes['index.html'], 0)
+        self.assertNotEqual(mtimes['other/index.html'], 0)
+        self.assertNotIn('img.jpg', mtimes)
+        self.assertIn('plugin.txt', mtimes)
+        self.assertPathNotExists(site_dir, 'stale')
+        self.assertPathIsFile(site_dir, '.hidden', 'index.html')
+
+    @tempdir(files={'index.md': 'page content', 'other.md': 'other'})
+    @tempdir()
+    def test_build_atomic(self, parent_dir, docs_dir):
+        site_dir = os.path.join(parent_dir, 'site')
+        seen = {}
+
+        class PostBuildPlugin(BasePlugin):
+            def on_post_build(self, config):
+                if os.path.exists(site_dir):
+                    with open(os.path.join(site_dir, 'other', 'index.html')) as f:
+                        seen['live'] = f.read()
+                with open(os.path.join(config['site_dir'], 'other', 'index.html')) as f:
+                    seen['staging'] = f.read()
+                if seen.get('fail'):
+                    raise ValueError()
+
+        def build_site(**kwargs):
+            cfg = load_config(
+                docs_dir=docs_dir, site_dir=site_dir, atomic_build=True, source_date_epoch=123
+            )
+            cfg.update(kwargs)
+            cfg['plugins']['post_build'] = PostBuildPlugin()
+            build.build(cfg)
+            self.assertEqual(cfg['site_dir'], site_dir)
+
+        build_site()
+        self.assertPathIsFile(site_dir, 'other', 'index.html')
+        self.assertEqual(os.listdir(parent_dir), ['site'])
+        utils.write_file(b'', os.path.join(site_dir, 'stale', 'index.html'))
+        utils.write_file(b'', os.path.join(site_dir, '.hidden', 'index.html'))
+
+        # The site directory is only replaced once the build has succeeded.
+        with open(os.path.join(docs_dir, 'other.md'), 'w') as f:
+            f.write('new content')
+        build_site(skip_unchanged=True)
+        self.assertNotIn('new content', seen['live'])
+        self.assertIn('new content', seen['staging'])
+        self.assertPathNotExists(site_dir, 'stale')
+        self.assertPathIsFile(site_dir, '.hidden', 'index.html')
+        self.assertEqual(os.listdir(parent_dir), ['site'])
+
+        # Without `renameat2`, the directories are swapped by two renames.
+        with mock.patch.object(build, '_exchange_paths', return_value=False):
+            build_site(incremental=True, cache_dir=os.path.join(parent_dir, '.cache'))
+        self.assertPathIsFile(site_dir, '.hidden', 'index.html')
+        self.assertEqual(sorted(os.listdir(parent_dir)), ['.cache', 'site'])
+
+        with open(os.path.join(docs_dir, 'other.md'), 'w') as f:
+            f.write('failed content')
+        seen['fail'] = True
+        with self.assertRaises(ValueError):
+            build_site()
+        with open(os.path.join(site_dir, 'other', 'index.html')) as f:
+            self.assertIn('new content', f.read())
+        self.assertEqual(sorted(os.listdir(parent_dir)), ['.cache', 'site'])
+
+    @tempdir(files={'index.md': 'page content'})
+    @tempdir()
+    def test_build_atomic_swap_fails(self, parent_dir, docs_dir):
+        site_dir = os.path.join(parent_dir, 'site')
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, atomic_build=True)
+        build.build(cfg)
+        utils.write_file(b'git', os.path.join(site_dir, '.git', 'HEAD'))
+        utils.write_file(b'previous', os.path.join(site_dir, 'previous.html'))
+        rename = os.rename
+
+        # Each of the two renames which replace `renameat2` fails in turn.
+        for failing in (site_dir, os.path.join(parent_dir, '.site.staging')):
+
+            def failing_rename(source, dest):
+                if source == failing:
+                    raise OSError(errno.EBUSY, 'Device or resource busy')
+                rename(source, dest)
+
+            with mock.patch.object(build, '_exchange_paths', return_value=False):
+                with mock.patch('os.rename', side_effect=failing_rename):
+                    with self.assertRaises(OSError):
+                        build.build(cfg)
+            self.assertEqual(cfg['site_dir'], site_dir)
+            with open(os.path.join(site_dir, '.git', 'HEAD')) as f:
+                self.assertEqual(f.read(), 'git')
+            with open(os.path.join(site_dir, 'previous.html')) as f:
+                self.assertEqual(f.read(), 'previous')
+            self.assertEqual(os.listdir(parent_dir), ['site'])
+
+    @tempdir(files={'index.md': 'page content', 'other.md': 'other', 'img.jpg': 'img'})
+    @tempdir()
+    def test_build_precompress(self, site_dir, docs_dir):
+        def build_site(**kwargs):
+            cfg = load_config(
+                docs_dir=docs_dir,
+                site_dir=site_dir,
+                precompress=True,
+                source_date_epoch=123,
+                **kwargs,
+            )
+            build.build(cfg)
+
+        build_site(precompress_level=1)
+        for path in ('index.html', 'other/index.html', 'sitemap.xml', 'search/search_index.json'):
+            with open(os.path.join(site_dir, path), 'rb') as f:
+                content = f.read()
+            with open(os.path.join(site_dir, f'{path}.gz'), 'rb') as f:
+                self.assertEqual(gzip.decompress(f.read()), content)
+        self.assertPathIsFile(site_dir, 'css', 'base.css.gz')
+        self.assertPathNotExists(site_dir, 'img.jpg.gz')
+
+        # Unchanged files are not compressed again and stale companions are removed.
+        path = os.path.join(site_dir, 'index.html')
+        with open(f'{path}.gz', 'wb') as f:
+            f.write(b'unchanged')
+        for p in (path, f'{path}.gz'):
+            os.utime(p, ns=(0, 0))
+        build_site(skip_unchanged=True)
+        with open(f'{path}.gz', 'rb') as f:
+            self.assertEqual(f.read(), b'unchanged')
+
+        os.remove(os.path.join(docs_dir, 'other.md'))
+        build_site(skip_unchanged=True)
+        self.assertPathNotExists(site_dir, 'other')
+
+    @tempdir(files={'index.md': 'page content'})
+    @tempdir()
+    def test_build_source_date_epoch(self, site_dir, docs_dir):
+        class DatePlugin(BasePlugin):
+            def on_page_context(self, context, page, **kwargs):
+                self.build_date = context['build_date_utc']
+                self.update_date = page.update_date
+
+        plugin = DatePlugin()
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, source_date_epoch=86400)
+        cfg['plugins']['date'] = plugin
+        with mock.patch.dict(os.environ):
+            os.environ.pop('SOURCE_DATE_EPOCH', None)
+            build.build(cfg)
+            self.assertNotIn('SOURCE_DATE_EPOCH', os.environ)
+        self.assertEqual(plugin.build_date.timestamp(), 86400)
+        self.assertEqual(plugin.update_date, '1970-01-02')
+
+    @tempdir(files={'index.md': 'page content'})
+    @tempdir()
+    def test_build_write_error(self, site_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, plugins=[])
+        with mock.patch.object(
+            BackgroundWriter, '_write_file', side_effect=OSError('Error message.')
+        ):
+            with self.assertLogs('mkdocs', level='ERROR') as cm:
+                with self.assertRaises(OSError):
+                    build.build(cfg)
+        path = os.path.join(site_dir, 'index.html')
+        self.assertIn(
+            f"ERROR:mkdocs.utils.writer:Error writing '{path}': Error message.", cm.output
+        )
+
+    @tempdir(files={'index.md': '# Welcome\n', 'foo.md': '---\ntitle: Foo\n---\n# Bar\n'})
+    @tempdir()
+    def test_page_titles_before_nav_event(self, site_dir, docs_dir):
+        class NavPlugin(BasePlugin):
+            def on_nav(self, nav, **kwargs):
+                self.titles = [page.title for page in nav.pages]
+                self.meta = [page.meta for page in nav.pages]
+
+        for jobs in (1, 2):
+            cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, jobs=jobs)
+            cfg['plugins']['nav'] = plugin = NavPlugin()
+            build.build(cfg)
+            self.assertEqual(plugin.titles, ['Welcome', 'Foo'])
+            self.assertEqual(plugin.meta, [{}, {'title': 'Foo'}])
+
+    @tempdir(files={'index.md': '# Welcome\n'})
+    def test_page_heads_with_page_read_source(self, docs_dir):
+        class SourcePlugin(BasePlugin):
+            def on_page_read_source(self, **kwargs):
+                return '# Generated\n'
+
+        cfg = load_config(docs_dir=docs_dir)
+        cfg['plugins']['source'] = SourcePlugin()
+        files = build.get_files(cfg)
+        nav = get_navigation(files, cfg)
+        # The heads of the files aren't read, as a plugin provides the source of the pages.
+        build._read_page_heads(files, cfg)
+        self.assertIsNone(nav.pages[0].title)
+        nav.pages[0].read_source(cfg)
+        self.assertEqual(nav.pages[0].title, 'Generated')
+
+    @tempdir(files={'index.md': '# Home', 'foo.md': 'foo', 'bar.md': 'bar'})
+    def test_build_profile(self, docs_dir):
+        for jobs in (1, 2):
+            with tempfile.TemporaryDirectory() as site_dir:
+                cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, jobs=jobs)
+                profile = os.path.join(site_dir, 'profile.json')
+                with self.assertLogs('mkdocs.utils.profiler', level='INFO') as cm:
+                    build.build(cfg, profile=profile)
+                with open(profile, encoding='utf-8') as f:
+                    report = json.load(f)
+            self.assertEqual(
+                list(report['phases']),
+                [
+                    'config',
+                    'clean',
+                    'files',
+                    'nav',
+                    'page_heads',
+                    'populate',
+                    'env',
+                    'static_files',
+                    'templates',
+                    'pages',
+                    'write',
+                    'post_build',
+                ],
+            )
+            self.assertEqual(set(report['templates']), {'404.html', 'sitemap.xml'})
+            self.assertEqual(set(report['pages']), {'index.md', 'foo.md', 'bar.md'})
+            self.assertEqual(
+                list(report['pages']['index.md']['steps']),
+                ['read', 'markdown', 'render', 'template', 'write'],
+            )
+            self.assertEqual(len(report['slowest_pages']), 3)
+            self.assertEqual(
+                report['plugin_events']['plugins']['search']['page_context']['count'], 3
+            )
+            self.assertTrue(cm.output[0].startswith('INFO:mkdocs.utils.profiler:Build profile:'))
+        self.assertFalse(build._profiler.enabled)
+        self.assertIsNone(cfg['plugins'].timings)
+
     # Test build.site_directory_contains_stale_files
 
     @tempdir(files=['index.html'])
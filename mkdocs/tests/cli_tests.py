@@ -189,6 +189,25 @@ class CLITests(unittest.TestCase):
             watch=(),
         )
 
+    @mock.patch('mkdocs.commands.serve.serve', autospec=True)
+    def test_serve_incrementalreload(self, mock_serve):
+
+        result = self.runner.invoke(
+            cli.cli, ["serve", '--incrementalreload'], catch_exceptions=False
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        mock_serve.assert_called_once_with(
+            dev_addr=None,
+            livereload='incremental',
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            watch_theme=False,
+            watch=(),
+        )
+
     @mock.patch('mkdocs.commands.serve.serve', autospec=True)
     def test_serve_watch_theme(self, mock_serve):
 
@@ -217,12 +236,19 @@ class CLITests(unittest.TestCase):
         args, kwargs = mock_build.call_args
         self.assertTrue('dirty' in kwargs)
         self.assertFalse(kwargs['dirty'])
+        self.assertIsNone(kwargs['profile'])
         mock_load_config.assert_called_once_with(
             config_file=None,
             strict=None,
             theme=None,
             use_directory_urls=None,
             site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
         )
         handler = logging._handlers.get('MkDocsStreamHandler')
         self.assertEqual(handler.level, logging.INFO)
@@ -281,6 +307,12 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=None,
             site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -299,6 +331,12 @@ class CLITests(unittest.TestCase):
             theme='readthedocs',
             use_directory_urls=None,
             site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -317,6 +355,12 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=True,
             site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -335,6 +379,12 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=False,
             site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -353,8 +403,207 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=None,
             site_dir='custom',
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
+        )
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_jobs(self, mock_build, mock_load_config):
+
+        result = self.runner.invoke(cli.cli, ['build', '--jobs', '4'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        mock_load_config.assert_called_once_with(
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            site_dir=None,
+            jobs=4,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
+        )
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_no_cache(self, mock_build, mock_load_config):
+
+        result = self.runner.invoke(cli.cli, ['build', '--no-cache'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        mock_load_config.assert_called_once_with(
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            site_dir=None,
+            jobs=None,
+            use_cache=False,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
+        )
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_incremental(self, mock_build, mock_load_config):
+
+        result = self.runner.invoke(cli.cli, ['build', '--incremental'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        mock_load_config.assert_called_once_with(
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=True,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=None,
         )
 
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_skip_unchanged(self, mock_build, mock_load_config):
+
+        result = self.runner.invoke(cli.cli, ['build', '--skip-unchanged'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        mock_load_config.assert_called_once_with(
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=True,
+            atomic_build=None,
+            precompress=None,
+        )
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_atomic(self, mock_build, mock_load_config):
+
+        result = self.runner.invoke(cli.cli, ['build', '--atomic'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        mock_load_config.assert_called_once_with(
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=True,
+            precompress=None,
+        )
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_precompress(self, mock_build, mock_load_config):
+
+        result = self.runner.invoke(cli.cli, ['build', '--precompress'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        mock_load_config.assert_called_once_with(
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            site_dir=None,
+            jobs=None,
+            use_cache=None,
+            incremental=None,
+            skip_unchanged=None,
+            atomic_build=None,
+            precompress=True,
+        )
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    @mock.patch('mkdocs.commands.daemon.request_build', autospec=True, return_value=True)
+    def test_build_daemon(self, mock_request_build, mock_build, mock_load_config):
+
+        result = self.runner.invoke(
+            cli.cli, ['build', '--daemon', '--socket', 'mkdocs.sock'], catch_exceptions=False
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 0)
+        self.assertEqual(mock_load_config.call_count, 0)
+        args, kwargs = mock_request_build.call_args
+        self.assertEqual(args[0]['site_dir'], None)
+        self.assertEqual(kwargs['dirty'], False)
+        self.assertEqual(kwargs['socket_path'], 'mkdocs.sock')
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    @mock.patch('mkdocs.commands.daemon.request_build', autospec=True, return_value=False)
+    def test_build_daemon_not_running(self, mock_request_build, mock_build, mock_load_config):
+
+        result = self.runner.invoke(cli.cli, ['build', '--daemon'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_request_build.call_count, 1)
+        self.assertEqual(mock_build.call_count, 1)
+
+    @mock.patch('mkdocs.commands.daemon.serve', autospec=True)
+    def test_daemon(self, mock_serve):
+
+        result = self.runner.invoke(cli.cli, ['daemon'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        mock_serve.assert_called_once_with(socket_path=None, config_file=None)
+
+    @mock.patch('mkdocs.commands.daemon.serve', autospec=True)
+    @mock.patch('mkdocs.commands.daemon.stop', autospec=True)
+    def test_daemon_stop(self, mock_stop, mock_serve):
+
+        result = self.runner.invoke(
+            cli.cli, ['daemon', '--stop', '--socket', 'mkdocs.sock'], catch_exceptions=False
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        mock_stop.assert_called_once_with('mkdocs.sock')
+        self.assertEqual(mock_serve.call_count, 0)
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_profile(self, mock_build, mock_load_config):
+
+        result = self.runner.invoke(
+            cli.cli, ['build', '--profile', 'report.json'], catch_exceptions=False
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        args, kwargs = mock_build.call_args
+        self.assertEqual(kwargs['profile'], 'report.json')
+
     @mock.patch('mkdocs.config.load_config', autospec=True)
     @mock.patch('mkdocs.commands.build.build', autospec=True)
     def test_build_verbose(self, mock_build, mock_load_config):
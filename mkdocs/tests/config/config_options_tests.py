@@ -5,7 +5,7 @@ import unittest
 from unittest.mock import patch
 
 import mkdocs
-from mkdocs.config import config_options
+from mkdocs.config import config_options, defaults
 from mkdocs.config.base import Config
 from mkdocs.exceptions import ConfigurationError
 from mkdocs.tests.base import tempdir
@@ -77,6 +77,30 @@ class TypeTest(unittest.TestCase):
             option.validate("Testing Long")
 
 
+class ListOfItemsTest(unittest.TestCase):
+    def test_valid_items(self):
+        option = config_options.ListOfItems(config_options.Type(str))
+        value = option.validate(['*.tmp', 'drafts/'])
+        self.assertEqual(value, ['*.tmp', 'drafts/'])
+
+    def test_invalid_item(self):
+        option = config_options.ListOfItems(config_options.Type(str))
+        with self.assertRaises(config_options.ValidationError) as cm:
+            option.validate(['*.tmp', 1])
+        self.assertIn('Invalid item 2:', str(cm.exception))
+
+    def test_non_list(self):
+        option = config_options.ListOfItems(config_options.Type(str))
+        with self.assertRaises(config_options.ValidationError):
+            option.validate('*.tmp')
+
+    def test_exclude_docs(self):
+        cfg = Config(schema=defaults.get_schema())
+        cfg.load_dict({'exclude_docs': ['*.tmp', 1]})
+        errors, warnings = cfg.validate()
+        self.assertIn('exclude_docs', dict(errors))
+
+
 class ChoiceTest(unittest.TestCase):
     def test_valid_choice(self):
         option = config_options.Choice(('python', 'node'))
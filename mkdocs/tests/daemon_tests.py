@@ -0,0 +1,93 @@
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from mkdocs.commands import daemon
+from mkdocs.exceptions import Abort
+from mkdocs.tests.base import tempdir
+
+
+@unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets are not supported")
+class DaemonTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.mkdtemp(prefix='mkdocs_test-')
+        self.addCleanup(shutil.rmtree, tmp)
+        self.socket_path = os.path.join(tmp, 'daemon.sock')
+
+    def start_daemon(self):
+        socket_path = self.socket_path
+        thread = threading.Thread(target=daemon.serve, kwargs=dict(socket_path=socket_path))
+        thread.start()
+        self.addCleanup(thread.join, 10)
+        self.addCleanup(daemon.stop, socket_path)
+        for _ in range(100):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+        return thread
+
+    @tempdir()
+    @tempdir(files={'mkdocs.yml': 'site_name: Test\n', 'docs/index.md': '# Home\n'})
+    def test_request_build(self, project_dir, tmp):
+        socket_path = self.socket_path
+        thread = self.start_daemon()
+        site_dir = os.path.join(tmp, 'site')
+        cwd = os.getcwd()
+
+        with self.assertLogs('mkdocs', level='INFO') as cm:
+            options = dict(config_file=os.path.join(project_dir, 'mkdocs.yml'), site_dir=site_dir)
+            self.assertTrue(daemon.request_build(options, socket_path=socket_path))
+        self.assertTrue(os.path.isfile(os.path.join(site_dir, 'index.html')))
+        self.assertEqual(os.getcwd(), cwd)
+        # The message is logged by the build in the daemon thread, and again by the client.
+        self.assertEqual(sum('Documentation built' in msg for msg in cm.output), 2)
+
+        # The messages of the next build are logged again.
+        with self.assertLogs('mkdocs', level='INFO') as cm:
+            self.assertTrue(daemon.request_build(options, socket_path=socket_path))
+        self.assertEqual(sum('Documentation built' in msg for msg in cm.output), 2)
+
+        self.assertTrue(daemon.stop(socket_path))
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(socket_path))
+
+    @tempdir()
+    @tempdir(files={'mkdocs.yml': 'site_name: Test\n', 'docs/index.md': '[x](missing.md)\n'})
+    def test_request_build_error(self, project_dir, tmp):
+        socket_path = self.socket_path
+        self.start_daemon()
+        options = dict(
+            config_file=os.path.join(project_dir, 'mkdocs.yml'),
+            site_dir=os.path.join(tmp, 'site'),
+            strict=True,
+        )
+        # The warnings which the client logs are also counted by the daemon thread of the test.
+        with self.assertLogs('mkdocs', level='WARNING'):
+            with self.assertRaisesRegex(Abort, r'Aborted with \d+ warnings in strict mode!'):
+                daemon.request_build(options, socket_path=socket_path)
+
+    def test_no_daemon(self):
+        socket_path = self.socket_path
+        self.assertFalse(daemon.request_build({}, socket_path=socket_path))
+        self.assertFalse(daemon.stop(socket_path))
+
+    def test_already_running(self):
+        socket_path = self.socket_path
+        self.start_daemon()
+        with self.assertRaisesRegex(Abort, 'already listening'):
+            daemon.serve(socket_path=socket_path)
+
+    @tempdir()
+    def test_client_context(self, tmp):
+        cwd = os.getcwd()
+        env = dict(os.environ)
+        with daemon._client_context(tmp, {'MKDOCS_TEST': 'value'}):
+            self.assertEqual(os.path.realpath(os.getcwd()), os.path.realpath(tmp))
+            self.assertEqual(dict(os.environ), {'MKDOCS_TEST': 'value'})
+        self.assertEqual(os.getcwd(), cwd)
+        self.assertEqual(dict(os.environ), env)
@@ -10,6 +10,7 @@ from mkdocs.commands import build
 from mkdocs.config import config_options
 from mkdocs.exceptions import Abort, BuildError, PluginError
 from mkdocs.tests.base import load_config
+from mkdocs.utils.profiler import EventTimings
 
 
 class DummyPlugin(plugins.BasePlugin):
@@ -139,6 +140,32 @@ class TestPluginCollection(unittest.TestCase):
         collection['foo'] = plugin
         self.assertEqual(collection.run_event('pre_build'), None)
 
+    def test_run_event_with_timings(self):
+        collection = plugins.PluginCollection()
+        plugin1 = DummyPlugin()
+        plugin1.load_config({'foo': 'new'})
+        collection['foo'] = plugin1
+        plugin2 = DummyPlugin()
+        plugin2.load_config({'foo': 'second'})
+        collection['bar'] = plugin2
+        collection.timings = EventTimings()
+        page = mock.Mock()
+        page.file.src_uri = 'index.md'
+        self.assertEqual(
+            collection.run_event('pre_page', 'page content', page=page),
+            'second new page content',
+        )
+        self.assertEqual(collection.run_event('pre_build'), None)
+        self.assertEqual(collection.run_event('pre_build'), None)
+        report = collection.timings.get_report()
+        self.assertEqual(list(report['plugins']), ['foo', 'bar'])
+        self.assertEqual(list(report['plugins']['foo']), ['pre_page', 'pre_build'])
+        self.assertEqual(report['plugins']['foo']['pre_page']['count'], 1)
+        self.assertEqual(list(report['plugins']['foo']['pre_page']['pages']), ['index.md'])
+        self.assertEqual(report['plugins']['foo']['pre_build']['count'], 2)
+        self.assertEqual(report['plugins']['foo']['pre_build']['pages'], {})
+        self.assertEqual(report['events']['pre_build']['count'], 4)
+
     def test_run_undefined_event_on_collection(self):
         collection = plugins.PluginCollection()
         self.assertEqual(collection.run_event('pre_page', 'page content'), 'page content')
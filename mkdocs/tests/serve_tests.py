@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+import os
+import unittest
+from unittest import mock
+
+from mkdocs.commands import serve
+from mkdocs.contrib.search import SearchPlugin
+from mkdocs.plugins import BasePlugin
+from mkdocs.tests.base import tempdir
+
+
+class ConfigLoaderTests(unittest.TestCase):
+    def write(self, path, content):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    @tempdir(
+        files={
+            'mkdocs.yml': 'site_name: Test\nINHERIT: base.yml\n',
+            'base.yml': 'extra_css: [base.css]\n',
+            'docs/index.md': '# Home\n',
+        }
+    )
+    def test_reuse_config(self, tmp):
+        loader = serve._ConfigLoader(config_file=os.path.join(tmp, 'mkdocs.yml'))
+        config = loader.load()
+        self.assertEqual(config.inherited_paths, [os.path.join(tmp, 'base.yml')])
+        search = config['plugins']['search']
+
+        # The changes of the plugins and of the build are reverted.
+        config['extra_css'].append('plugin.css')
+        config['theme'].dirs.append('plugin_templates')
+        search.search_index = object()
+        self.assertIs(loader.load(), config)
+        self.assertEqual(config['extra_css'], ['base.css'])
+        self.assertNotIn('plugin_templates', config['theme'].dirs)
+        self.assertIs(config['plugins']['search'], search)
+        self.assertIsNone(search.search_index)
+
+    @tempdir(files={'mkdocs.yml': 'site_name: Test\n', 'docs/index.md': '# Home\n'})
+    def test_config_file_changed(self, tmp):
+        config_file = os.path.join(tmp, 'mkdocs.yml')
+        loader = serve._ConfigLoader(config_file=config_file)
+        config = loader.load()
+        self.write(config_file, 'site_name: Changed\n')
+        new_config = loader.load()
+        self.assertIsNot(new_config, config)
+        self.assertEqual(new_config['site_name'], 'Changed')
+        self.assertIs(loader.load(), new_config)
+
+    @tempdir(
+        files={
+            'mkdocs.yml': 'site_name: Test\nINHERIT: base.yml\n',
+            'base.yml': 'extra_css: [base.css]\n',
+            'docs/index.md': '# Home\n',
+        }
+    )
+    def test_inherited_config_file_changed(self, tmp):
+        loader = serve._ConfigLoader(config_file=os.path.join(tmp, 'mkdocs.yml'))
+        config = loader.load()
+        self.write(os.path.join(tmp, 'base.yml'), 'extra_css: [base.css, other.css]\n')
+        new_config = loader.load()
+        self.assertIsNot(new_config, config)
+        self.assertEqual(new_config['extra_css'], ['base.css', 'other.css'])
+
+    @tempdir(files={'mkdocs.yml': 'site_name: Test\n', 'docs/index.md': '# Home\n'})
+    def test_plugin_without_reset(self, tmp):
+        loader = serve._ConfigLoader(config_file=os.path.join(tmp, 'mkdocs.yml'))
+        with mock.patch.object(SearchPlugin, 'on_reset', staticmethod(BasePlugin.on_reset)):
+            config = loader.load()
+            self.assertIsNot(loader.load(), config)
+
+    @tempdir(files={'mkdocs.yml': 'site_name: Test\n', 'docs/index.md': '# Home\n'})
+    def test_options(self, tmp):
+        loader = serve._ConfigLoader(
+            config_file=os.path.join(tmp, 'mkdocs.yml'), site_dir=os.path.join(tmp, 'out')
+        )
+        self.assertEqual(loader.load()['site_dir'], os.path.join(tmp, 'out'))
+        self.assertEqual(loader.load()['site_dir'], os.path.join(tmp, 'out'))
@@ -3,7 +3,14 @@ import sys
 import unittest
 from unittest import mock
 
-from mkdocs.structure.files import File, Files, _filter_paths, _sort_files, get_files
+from mkdocs.structure.files import (
+    File,
+    Files,
+    _compile_exclude,
+    _filter_paths,
+    _sort_files,
+    get_files,
+)
 from mkdocs.tests.base import PathAssertionMixin, load_config, tempdir
 
 
@@ -339,6 +346,21 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         self.assertEqual(f.url, 'foo%20bar.html')
         self.assertEqual(f.name, 'foo bar')
 
+    def test_file_abs_paths(self):
+        f = File('foo/bar.md', '/path/to/docs', '/path/to/site', use_directory_urls=True)
+        # The absolute paths are derived from the paths when the file was created.
+        f.src_uri = 'other.md'
+        f.dest_uri = 'other.html'
+        self.assertPathsEqual(f.abs_src_path, '/path/to/docs/foo/bar.md')
+        self.assertPathsEqual(f.abs_dest_path, '/path/to/site/foo/bar/index.html')
+        f.abs_src_path = '/elsewhere/bar.md'
+        f.abs_dest_path = '/elsewhere/bar.html'
+        self.assertEqual(f.abs_src_path, '/elsewhere/bar.md')
+        self.assertEqual(f.abs_dest_path, '/elsewhere/bar.html')
+        # Other attributes can still be set.
+        f.custom = 'value'
+        self.assertEqual(f.custom, 'value')
+
     def test_files(self):
         fs = [
             File('index.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
@@ -674,6 +696,60 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         self.assertEqual(len(files), len(expected))
         self.assertEqual([f.src_path for f in files], expected)
 
+    def test_compile_exclude(self):
+        exclude = _compile_exclude(['*.tmp', 'drafts/', '/api/*.md', 'docs/**/secret.md', '# x'])
+        self.assertTrue(exclude('foo.tmp'))
+        self.assertTrue(exclude('foo/bar.tmp'))
+        self.assertTrue(exclude('drafts/'))
+        self.assertTrue(exclude('foo/drafts/'))
+        self.assertFalse(exclude('drafts'))
+        self.assertTrue(exclude('api/foo.md'))
+        self.assertFalse(exclude('api/foo/bar.md'))
+        self.assertFalse(exclude('foo/api/foo.md'))
+        self.assertTrue(exclude('docs/secret.md'))
+        self.assertTrue(exclude('docs/a/b/secret.md'))
+        self.assertFalse(exclude('secret.md'))
+        self.assertFalse(exclude('# x'))
+        self.assertFalse(_compile_exclude([])('foo.md'))
+
+    @tempdir(
+        files=[
+            'index.md',
+            'foo.md',
+            'foo.tmp',
+            'drafts/bar.md',
+            'api/index.md',
+            'api/internal/index.md',
+            'sub/drafts/baz.md',
+            'sub/page.md',
+        ]
+    )
+    def test_get_files_exclude_docs(self, tdir):
+        config = load_config(docs_dir=tdir, exclude_docs=['*.tmp', 'drafts/', '/api/internal'])
+        files = get_files(config)
+        expected = ['index.md', 'foo.md', 'api/index.md', 'sub/page.md']
+        self.assertEqual([f.src_uri for f in files], expected)
+
+    @tempdir(
+        files=[
+            'index.md',
+            'b.md',
+            'a/index.md',
+            'a/z/c.md',
+            'a/y.md',
+            'c/d/e/f.md',
+            'c/b.css',
+            'README.md',
+            '.hidden/foo.md',
+        ]
+    )
+    def test_get_files_workers(self, tdir):
+        serial = get_files(load_config(docs_dir=tdir))
+        parallel = get_files(load_config(docs_dir=tdir, jobs=4))
+        expected = ['index.md', 'b.md', 'a/index.md', 'a/y.md', 'a/z/c.md', 'c/b.css', 'c/d/e/f.md']
+        self.assertEqual([f.src_uri for f in serial], expected)
+        self.assertEqual([f.src_uri for f in parallel], expected)
+
     @tempdir()
     @tempdir(files={'test.txt': 'source content'})
     def test_copy_file(self, src_dir, dest_dir):
@@ -738,3 +814,72 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         self.assertEqual(len(files), 6)
         self.assertEqual(len(files.src_uris), 6)
         self.assertFalse(extra_file.src_uri in files.src_uris)
+
+    def test_files_remove_updates_views(self):
+        fs = [
+            File('index.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+            File('foo/bar.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+            File('foo/bar.css', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+            File('foo/baz.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+        ]
+        files = Files(fs)
+        files.remove(File('foo/bar.md', '/path/to/docs', '/path/to/site', True))
+        files.remove(fs[2])
+        self.assertEqual(list(files), [fs[0], fs[3]])
+        self.assertEqual(files.documentation_pages(), [fs[0], fs[3]])
+        self.assertEqual(files.media_files(), [])
+        self.assertEqual(files.css_files(), [])
+        self.assertNotIn('foo/bar.md', files)
+        files.append(fs[1])
+        self.assertEqual(files.documentation_pages(), [fs[0], fs[3], fs[1]])
+        with self.assertRaises(ValueError):
+            files.remove(fs[2])
+
+    def test_files_duplicate_src_uris(self):
+        first = File('foo.md', '/path/to/docs', '/path/to/site', use_directory_urls=True)
+        second = File('foo.md', '/path/to/theme', '/path/to/site', use_directory_urls=True)
+        files = Files([first, second])
+        self.assertIs(files.get_file_from_path('foo.md'), second)
+        files.remove(second)
+        self.assertIs(files.get_file_from_path('foo.md'), first)
+        files.append(second)
+        files.remove(first)
+        self.assertIs(files.get_file_from_path('foo.md'), second)
+        files.remove(second)
+        self.assertEqual(files.src_uris, {})
+        self.assertEqual(len(files), 0)
+
+    def test_files_src_uri_changed(self):
+        fs = [
+            File('index.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+            File('foo.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+            File('bar.css', '/path/to/docs', '/path/to/site', use_directory_urls=True),
+        ]
+        files = Files(fs)
+        self.assertEqual(files.documentation_pages(), [fs[0], fs[1]])
+        # A plugin renames files after they were added.
+        fs[1].src_uri = 'foo.html'
+        fs[2].src_path = 'sub/bar.md'
+        self.assertIsNone(files.get_file_from_path('foo.md'))
+        self.assertIs(files.get_file_from_path('foo.html'), fs[1])
+        self.assertIs(files.get_file_from_path('sub/bar.md'), fs[2])
+        self.assertNotIn('bar.css', files)
+        self.assertEqual(list(files.src_uris), ['index.md', 'foo.html', 'sub/bar.md'])
+        self.assertEqual(files.documentation_pages(), [fs[0], fs[2]])
+        self.assertEqual(files.static_pages(), [fs[1]])
+        self.assertEqual(files.css_files(), [])
+        # The order of the files is kept.
+        self.assertEqual(list(files), fs)
+        files.remove(fs[1])
+        self.assertEqual(files.static_pages(), [])
+        self.assertEqual(list(files), [fs[0], fs[2]])
+        # The absolute path is still that of the original file.
+        self.assertPathsEqual(fs[2].abs_src_path, '/path/to/docs/bar.css')
+
+    def test_files_modified_during_iteration(self):
+        fs = [File(f'{i}.md', '/path/to/docs', '/path/to/site', True) for i in range(3)]
+        files = Files(fs[:2])
+        for file in files:
+            files.remove(file)
+            files.append(fs[2])
+        self.assertEqual(list(files), [fs[2], fs[2]])
@@ -1,12 +1,31 @@
+import logging
 import os
 import sys
 import unittest
 from tempfile import TemporaryDirectory
 from unittest import mock
 
+import markdown
+from markdown.extensions import Extension
+from markdown.preprocessors import Preprocessor
+
 from mkdocs.structure.files import File, Files
-from mkdocs.structure.pages import Page
+from mkdocs.structure.pages import MarkdownEngine, Page, read_page_heads
 from mkdocs.tests.base import dedent, load_config
+from mkdocs.utils.cache import DiskCache
+
+
+class _WarningPreprocessor(Preprocessor):
+    def run(self, lines):
+        logging.getLogger('mkdocs.tests.extension').warning('A warning from an extension')
+        return lines
+
+
+class _WarningExtension(Extension):
+    """A Markdown extension which logs a warning for each page it converts."""
+
+    def extendMarkdown(self, md):
+        md.preprocessors.register(_WarningPreprocessor(md), 'warning', 0)
 
 
 class PageTests(unittest.TestCase):
@@ -156,6 +175,7 @@ class PageTests(unittest.TestCase):
         self.assertEqual(pg.meta, {})
         self.assertEqual(pg.next_page, None)
         self.assertEqual(pg.parent, None)
+        self.assertEqual(pg.children, None)
         self.assertEqual(pg.previous_page, None)
         self.assertEqual(pg.title, 'Foo')
         self.assertEqual(pg.toc, [])
@@ -324,6 +344,42 @@ class PageTests(unittest.TestCase):
         self.assertEqual(pg.title, 'A Page Title')
         self.assertEqual(pg.toc, [])
 
+    def test_read_head(self):
+        cfg = load_config(docs_dir=self.DOCS_DIR)
+        cases = [
+            ('metadata.md', {'title': 'A Page Title'}, 'A Page Title'),
+            ('page-title.md', {}, 'Page title'),
+            ('index.md', {}, 'Home'),
+        ]
+        for path, meta, title in cases:
+            with self.subTest(path=path):
+                fl = File(path, cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+                pg = Page(None, fl, cfg)
+                pg.read_head()
+                self.assertEqual(pg.meta, meta)
+                self.assertEqual(pg.title, title)
+                self.assertIsNone(pg.markdown)
+                pg.read_source(cfg)
+                self.assertEqual(pg.meta, meta)
+                self.assertEqual(pg.title, title)
+
+    def test_read_page_heads(self):
+        cfg = load_config(docs_dir=self.DOCS_DIR)
+        paths = ['non-index.md', 'metadata.md', 'missing.md']
+        for workers in (1, 3):
+            with self.subTest(workers=workers):
+                files = [
+                    File(path, cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+                    for path in paths
+                ]
+                pages = [Page(None, fl, cfg) for fl in files]
+                # A missing file is reported when its source is read.
+                read_page_heads(pages, workers)
+                self.assertEqual(
+                    [pg.title for pg in pages],
+                    ['Test sub pages and referencing images', 'A Page Title', None],
+                )
+
     def test_page_title_from_filename(self):
         cfg = load_config(docs_dir=self.DOCS_DIR)
         fl = File('page-title.md', cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
@@ -626,6 +682,146 @@ class PageTests(unittest.TestCase):
             ),
         )
 
+    def test_page_render_cache(self):
+        cfg = load_config()
+        files = Files(
+            [
+                File(f, cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+                for f in ('index.md', 'other.md')
+            ]
+        )
+        source = '# Title\n\n[link](other.md) [missing](missing.md)'
+        with TemporaryDirectory() as cache_dir:
+            cache = DiskCache(cache_dir)
+
+            pg = Page('Foo', files.get_file_from_path('index.md'), cfg)
+            pg.markdown = source
+            with self.assertLogs('mkdocs', level='WARNING') as cm:
+                pg.render(cfg, files, cache=cache)
+            content, toc = pg.content, str(pg.toc)
+
+            # The second rendering is restored from the cache, without Markdown.
+            pg = Page('Foo', files.get_file_from_path('index.md'), cfg)
+            pg.markdown = source
+            with mock.patch('markdown.Markdown') as mock_md:
+                with self.assertLogs('mkdocs', level='WARNING') as cm2:
+                    pg.render(cfg, files, cache=cache)
+            mock_md.assert_not_called()
+            self.assertEqual(pg.content, content)
+            self.assertEqual(str(pg.toc), toc)
+            self.assertEqual(cm2.output, cm.output)
+
+            # A link target which now resolves differently invalidates the cached rendering.
+            files.append(File('missing.md', cfg['docs_dir'], cfg['site_dir'], False))
+            pg = Page('Foo', files.get_file_from_path('index.md'), cfg)
+            pg.markdown = source
+            pg.render(cfg, files, cache=cache)
+            self.assertIn('<a href="missing.html">missing</a>', pg.content)
+
+    def test_page_render_cache_extension_warnings(self):
+        cfg = load_config()
+        cfg['markdown_extensions'].append(_WarningExtension())
+        fl = File('index.md', cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+        files = Files([fl])
+        with TemporaryDirectory() as cache_dir:
+            cache = DiskCache(cache_dir)
+            for _ in range(2):
+                pg = Page('Foo', fl, cfg)
+                pg.markdown = '# Title'
+                with self.assertLogs('mkdocs', level='WARNING') as cm:
+                    pg.render(cfg, files, cache=cache)
+                self.assertEqual(
+                    cm.output, ['WARNING:mkdocs.tests.extension:A warning from an extension']
+                )
+
+    def test_page_render_cache_lambda(self):
+        cfg = load_config()
+        cfg['mdx_configs'] = {'toc': {'slugify': lambda value, separator: value}}
+        fl = File('index.md', cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+        with TemporaryDirectory() as cache_dir:
+            pg = Page('Foo', fl, cfg)
+            pg.markdown = '# Title'
+            pg.render(cfg, Files([fl]), cache=DiskCache(cache_dir))
+            self.assertEqual(pg.content, '<h1 id="Title">Title</h1>')
+            # A lambda can't be told apart from another one, so nothing is cached.
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_page_render_reuses_markdown(self):
+        cfg = load_config()
+        files = Files(
+            [
+                File(f, cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+                for f in ('index.md', 'foo/bar.md')
+            ]
+        )
+        engine = MarkdownEngine()
+        with mock.patch('markdown.Markdown', wraps=markdown.Markdown) as mock_md:
+            pg1 = Page('Foo', files.get_file_from_path('index.md'), cfg)
+            pg1.markdown = '# Index\n\n## Section\n\n[link](foo/bar.md)'
+            pg1.render(cfg, files, engine=engine)
+            pg2 = Page('Bar', files.get_file_from_path('foo/bar.md'), cfg)
+            pg2.markdown = '# Bar\n\n[link](../index.md)'
+            pg2.render(cfg, files, engine=engine)
+        mock_md.assert_called_once()
+        self.assertIn('<a href="foo/bar/">link</a>', pg1.content)
+        self.assertIn('<a href="../..">link</a>', pg2.content)
+        self.assertEqual(str(pg2.toc).strip(), 'Bar - #bar')
+        self.assertEqual(pg2.links, [('index.md', '../..')])
+
+        # A change to the Markdown extensions config creates a new Markdown instance.
+        cfg['mdx_configs'] = {'toc': {'permalink': True}}
+        with mock.patch('markdown.Markdown', wraps=markdown.Markdown) as mock_md:
+            pg2.render(cfg, files, engine=engine)
+        mock_md.assert_called_once()
+        self.assertIn('headerlink', pg2.content)
+
+        # Without an engine, each rendering creates a Markdown instance.
+        with mock.patch('markdown.Markdown', wraps=markdown.Markdown) as mock_md:
+            pg1.render(cfg, files)
+            pg2.render(cfg, files)
+        self.assertEqual(mock_md.call_count, 2)
+        self.assertIn('<a href="../..">link</a>', pg2.content)
+
+    def test_page_render_markdown_state_not_shared(self):
+        cfg = load_config(markdown_extensions=['abbr', 'footnotes'])
+        files = Files(
+            [
+                File(f, cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
+                for f in ('a.md', 'b.md')
+            ]
+        )
+        sources = {
+            'a.md': '*[HTML]: Hyper Text\n\nHTML here[^1]\n\n[^1]: Note',
+            'b.md': 'HTML there[^1]',
+        }
+        expected = {}
+        for path, source in sources.items():
+            pg = Page('Foo', files.get_file_from_path(path), cfg)
+            pg.markdown = source
+            pg.render(cfg, files)
+            expected[path] = pg.content
+        self.assertEqual(expected['b.md'], '<p>HTML there[^1]</p>')
+
+        # `abbr` keeps the abbreviations of a page, so the Markdown instance isn't reused.
+        engine = MarkdownEngine()
+        with mock.patch('markdown.Markdown', wraps=markdown.Markdown) as mock_md:
+            for path, source in sources.items():
+                pg = Page('Foo', files.get_file_from_path(path), cfg)
+                pg.markdown = source
+                pg.render(cfg, files, engine=engine)
+                self.assertEqual(pg.content, expected[path])
+        self.assertEqual(mock_md.call_count, 2)
+
+        # The footnotes are cleared when the Markdown instance is reset.
+        cfg = load_config(markdown_extensions=['footnotes'])
+        with mock.patch('markdown.Markdown', wraps=markdown.Markdown) as mock_md:
+            for path, source in sources.items():
+                pg = Page('Foo', files.get_file_from_path(path), cfg)
+                pg.markdown = source
+                pg.render(cfg, files, engine=engine)
+        mock_md.assert_called_once()
+        self.assertEqual(pg.content, '<p>HTML there[^1]</p>')
+
     def test_missing_page(self):
         cfg = load_config()
         fl = File('missing.md', cfg['docs_dir'], cfg['site_dir'], cfg['use_directory_urls'])
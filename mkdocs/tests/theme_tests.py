@@ -3,8 +3,12 @@ import tempfile
 import unittest
 from unittest import mock
 
+import jinja2
+
 import mkdocs
+from mkdocs import theme as theme_module
 from mkdocs.localization import parse_locale
+from mkdocs.tests.base import tempdir
 from mkdocs.theme import Theme
 
 abs_path = os.path.abspath(os.path.dirname(__file__))
@@ -18,6 +22,10 @@ def get_vars(theme):
     return {k: theme[k] for k in iter(theme)}
 
 
+def _finalize(value):
+    return f'[{value}]'
+
+
 class ThemeTests(unittest.TestCase):
     def test_simple_theme(self):
         theme = Theme(name='mkdocs')
@@ -105,3 +113,81 @@ class ThemeTests(unittest.TestCase):
                 ],
             )
             self.assertEqual(theme.static_templates, {'sitemap.xml', 'child.html', 'parent.html'})
+
+    @tempdir(files={'main.html': '{{ page }}'})
+    @tempdir()
+    def test_get_env_template_cache(self, cache_dir, custom_dir):
+        theme = Theme(name=None, custom_dir=custom_dir)
+
+        def render(**kwargs):
+            with mock.patch.object(
+                jinja2.Environment, 'compile', autospec=True, side_effect=jinja2.Environment.compile
+            ) as mock_compile:
+                output = theme.get_env(**kwargs).get_template('main.html').render(page='foo')
+            self.assertEqual(output, 'foo')
+            return mock_compile.call_count
+
+        with mock.patch.dict('mkdocs.theme._compiled_templates', clear=True):
+            self.assertEqual(render(cache_dir=cache_dir), 1)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            # The compiled template is kept in memory...
+            self.assertEqual(render(), 0)
+            theme_module._compiled_templates.clear()
+            # ...and on disk.
+            self.assertEqual(render(cache_dir=cache_dir), 0)
+            self.assertEqual(render(), 0)
+
+            # An edited template is compiled again.
+            with open(os.path.join(custom_dir, 'main.html'), 'w') as f:
+                f.write('{{ page }}!')
+            with mock.patch.object(
+                jinja2.Environment, 'compile', autospec=True, side_effect=jinja2.Environment.compile
+            ) as mock_compile:
+                output = theme.get_env(cache_dir).get_template('main.html').render(page='foo')
+            self.assertEqual(output, 'foo!')
+            self.assertEqual(mock_compile.call_count, 1)
+
+    @tempdir(files={'main.html': '{{ page }}'})
+    def test_get_env_template_cache_extensions(self, custom_dir):
+        theme = Theme(name=None, custom_dir=custom_dir)
+        with mock.patch.dict('mkdocs.theme._compiled_templates', clear=True):
+            theme.get_env().get_template('main.html')
+            env = theme.get_env()
+            env.add_extension('jinja2.ext.debug')
+            env.get_template('main.html')
+            self.assertEqual(len(theme_module._compiled_templates), 2)
+
+    @tempdir(files={'main.html': '{{ "<b>" }}'})
+    def test_get_env_template_cache_settings(self, custom_dir):
+        theme = Theme(name=None, custom_dir=custom_dir)
+
+        def render(**settings):
+            env = theme.get_env()
+            for name, value in settings.items():
+                setattr(env, name, value)
+            return env.get_template('main.html').render()
+
+        with mock.patch.dict('mkdocs.theme._compiled_templates', clear=True):
+            self.assertEqual(render(), '<b>')
+            self.assertEqual(render(autoescape=True), '&lt;b&gt;')
+            self.assertEqual(render(autoescape=jinja2.select_autoescape(['html'])), '&lt;b&gt;')
+            self.assertEqual(render(finalize=_finalize), '[<b>]')
+            self.assertEqual(render(optimized=False), '<b>')
+            self.assertEqual(len(theme_module._compiled_templates), 4)
+            # A lambda can't be identified, so the code compiled with it isn't kept.
+            self.assertEqual(render(finalize=lambda value: f'({value})'), '(<b>)')
+            self.assertEqual(len(theme_module._compiled_templates), 4)
+
+    @tempdir(files={'main.html': '{{ page }}'})
+    def test_get_env_template_cache_size(self, custom_dir):
+        theme = Theme(name=None, custom_dir=custom_dir)
+        with mock.patch.dict('mkdocs.theme._compiled_templates', clear=True):
+            with mock.patch.object(theme_module, '_MAX_COMPILED_TEMPLATES', 2):
+                theme.get_env().get_template('main.html')
+                key = next(iter(theme_module._compiled_templates))
+                for extension in ('jinja2.ext.debug', 'jinja2.ext.loopcontrols'):
+                    env = theme.get_env()
+                    env.add_extension(extension)
+                    env.get_template('main.html')
+                self.assertEqual(len(theme_module._compiled_templates), 2)
+                self.assertNotIn(key, theme_module._compiled_templates)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+import os
+import unittest
+
+from markdown.extensions.toc import TocExtension
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils.cache import DiskCache, get_key
+
+
+def _slugify(value, separator):
+    return value
+
+
+class DiskCacheTests(unittest.TestCase):
+    def test_get_key(self):
+        self.assertEqual(get_key('a', [1, {'b': 2}]), get_key('a', [1, {'b': 2}]))
+        self.assertNotEqual(get_key('a', [1, {'b': 2}]), get_key('a', [1, {'b': 3}]))
+
+    def test_get_key_callable(self):
+        # Functions are identified by their import path rather than their memory address.
+        key = get_key({'toc': {'slugify': _slugify}})
+        self.assertEqual(key, get_key({'toc': {'slugify': _slugify}}))
+        self.assertNotEqual(key, get_key({'toc': {'slugify': get_key}}))
+
+    def test_get_key_unidentifiable_callable(self):
+        # Lambdas and nested functions can't be told apart, so there is no key for them.
+        def slugify(value, separator):
+            return value
+
+        self.assertIsNone(get_key({'toc': {'slugify': lambda value, separator: value}}))
+        self.assertIsNone(get_key({'toc': {'slugify': slugify}}))
+        self.assertIsNone(get_key([TocExtension(slugify=slugify)]))
+
+    def test_get_key_extension_instance(self):
+        # Extension instances are identified by their class and config rather than their address.
+        key = get_key([TocExtension(permalink=True, slugify=_slugify)])
+        self.assertEqual(key, get_key([TocExtension(permalink=True, slugify=_slugify)]))
+        self.assertNotEqual(key, get_key([TocExtension(permalink=False, slugify=_slugify)]))
+        self.assertNotEqual(key, get_key([TocExtension(permalink=True)]))
+
+    @tempdir()
+    def test_get_set(self, cache_dir):
+        cache = DiskCache(cache_dir)
+        key = get_key('foo')
+        self.assertIsNone(cache.get(key))
+        cache.set(key, {'content': '<p>foo</p>', 'toc': []})
+        self.assertEqual(cache.get(key), {'content': '<p>foo</p>', 'toc': []})
+        self.assertEqual(os.listdir(os.path.join(cache_dir, key[:2])), [f'{key}.json'])
+
+    @tempdir()
+    def test_delete(self, cache_dir):
+        cache = DiskCache(cache_dir)
+        key = get_key('foo')
+        cache.delete(key)
+        cache.set(key, 'foo')
+        cache.delete(key)
+        self.assertIsNone(cache.get(key))
+
+    @tempdir()
+    def test_get_corrupt_entry(self, cache_dir):
+        cache = DiskCache(cache_dir)
+        key = get_key('foo')
+        os.makedirs(os.path.join(cache_dir, key[:2]))
+        with open(os.path.join(cache_dir, key[:2], f'{key}.json'), 'w') as f:
+            f.write('{"content": ')
+        self.assertIsNone(cache.get(key))
+
+    @tempdir()
+    def test_set_unserializable(self, cache_dir):
+        cache = DiskCache(cache_dir)
+        key = get_key('foo')
+        cache.set(key, {'content': object()})
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(os.listdir(os.path.join(cache_dir, key[:2])), [])
+
+    @tempdir()
+    def test_prune_least_recently_used(self, cache_dir):
+        cache = DiskCache(cache_dir, max_size=60)
+        keys = [get_key(i) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.set(key, 'x' * 20)
+            path = os.path.join(cache_dir, key[:2], f'{key}.json')
+            os.utime(path, (1000 + i, 1000 + i))
+        # Using the oldest entry makes it the most recently used one.
+        self.assertEqual(cache.get(keys[0]), 'x' * 20)
+        cache.prune()
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+
+    @tempdir()
+    def test_prune_within_max_size(self, cache_dir):
+        cache = DiskCache(cache_dir, max_size=1000)
+        key = get_key('foo')
+        cache.set(key, 'foo')
+        cache.prune()
+        self.assertEqual(cache.get(key), 'foo')
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+import gzip
+import os
+import unittest
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils import compress
+
+
+class CompressTests(unittest.TestCase):
+    def _read_companion(self, path):
+        with open(f'{path}.gz', 'rb') as f:
+            content = f.read()
+        return content, gzip.decompress(content)
+
+    @tempdir(files={'index.html': 'page', 'css/base.css': 'css', 'img.png': 'png'})
+    def test_compress_site(self, site_dir):
+        companions = compress.compress_site(site_dir, ['.html', '.CSS'], level=6, threads=2)
+        self.assertEqual(
+            companions,
+            {
+                os.path.join(site_dir, 'index.html.gz'),
+                os.path.join(site_dir, 'css', 'base.css.gz'),
+            },
+        )
+        self.assertEqual(self._read_companion(os.path.join(site_dir, 'index.html'))[1], b'page')
+        self.assertEqual(self._read_companion(os.path.join(site_dir, 'css', 'base.css'))[1], b'css')
+        self.assertFalse(os.path.exists(os.path.join(site_dir, 'img.png.gz')))
+
+    @tempdir(files={'index.html': 'page', '.hidden/index.html': 'hidden'})
+    def test_compress_site_skips_hidden_files(self, site_dir):
+        compress.compress_site(site_dir, ['.html'])
+        self.assertTrue(os.path.exists(os.path.join(site_dir, 'index.html.gz')))
+        self.assertFalse(os.path.exists(os.path.join(site_dir, '.hidden', 'index.html.gz')))
+
+    @tempdir(files={'index.html': 'page'})
+    def test_compress_file_deterministic(self, site_dir):
+        path = os.path.join(site_dir, 'index.html')
+        self.assertTrue(compress.compress_file(path, mtime=86400))
+        first, _ = self._read_companion(path)
+        os.remove(f'{path}.gz')
+        self.assertTrue(compress.compress_file(path, mtime=86400))
+        self.assertEqual(self._read_companion(path)[0], first)
+        # The modification time of the content is recorded in the header.
+        self.assertEqual(int.from_bytes(first[4:8], 'little'), 86400)
+
+    @tempdir(files={'index.html': 'page'})
+    def test_compress_file_up_to_date(self, site_dir):
+        path = os.path.join(site_dir, 'index.html')
+        self.assertTrue(compress.compress_file(path))
+        self.assertEqual(os.stat(f'{path}.gz').st_mtime_ns, os.stat(path).st_mtime_ns)
+        self.assertFalse(compress.compress_file(path))
+
+        with open(path, 'w') as f:
+            f.write('new page')
+        os.utime(path, ns=(0, 0))
+        self.assertTrue(compress.compress_file(path))
+        self.assertEqual(self._read_companion(path)[1], b'new page')
+        self.assertFalse(os.path.exists(f'{path}.gz.tmp'))
+
+    def test_is_compressible(self):
+        self.assertTrue(compress.is_compressible('foo/index.html', ('.html', '.css')))
+        self.assertTrue(compress.is_compressible('foo/INDEX.HTML', ('.html',)))
+        self.assertFalse(compress.is_compressible('foo/index.html.gz', ('.html',)))
+        self.assertFalse(compress.is_compressible('foo/html', ('.html',)))
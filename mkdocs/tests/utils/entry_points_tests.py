@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+import json
+import os
+import time
+import unittest
+from unittest import mock
+
+import importlib_metadata
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils import entry_points
+
+
+def _mock_entry_point(name, value, dist_name):
+    ep = mock.Mock(value=value, dist=mock.Mock(_path=None))
+    ep.name = name
+    ep.dist.name = dist_name
+    return ep
+
+
+class EntryPointsTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop('MKDOCS_NO_ENTRY_POINTS_CACHE', None)
+
+    def patch_entry_points(self):
+        entry_point = _mock_entry_point('search', 'mkdocs.contrib.search:SearchPlugin', 'mkdocs')
+        return mock.patch(
+            'importlib_metadata.entry_points',
+            side_effect=lambda group: [entry_point] if group == 'mkdocs.plugins' else [],
+        )
+
+    @tempdir()
+    def test_cache(self, tmp):
+        with mock.patch.object(entry_points, 'get_cache_dir', return_value=tmp):
+            with self.patch_entry_points() as mock_entry_points:
+                eps = entry_points.get_entry_points('mkdocs.plugins')
+                self.assertEqual(mock_entry_points.call_count, len(entry_points.GROUPS))
+                self.assertEqual(entry_points.get_entry_points('mkdocs.plugins'), eps)
+                self.assertEqual(entry_points.get_entry_points('mkdocs.themes'), [])
+                # The second lookups are read from the cache.
+                self.assertEqual(mock_entry_points.call_count, len(entry_points.GROUPS))
+            self.assertEqual(len(os.listdir(tmp)), 1)
+
+        self.assertEqual(
+            eps,
+            [
+                importlib_metadata.EntryPoint(
+                    'search', 'mkdocs.contrib.search:SearchPlugin', 'mkdocs.plugins'
+                )
+            ],
+        )
+        self.assertIsInstance(eps[0], importlib_metadata.EntryPoint)
+        self.assertEqual(eps[0].dist.name, 'mkdocs')
+
+    @tempdir()
+    def test_cache_invalidated(self, tmp):
+        with mock.patch.object(entry_points, 'get_cache_dir', return_value=tmp):
+            with self.patch_entry_points() as mock_entry_points:
+                entry_points.get_entry_points('mkdocs.plugins')
+                # A package was installed or removed.
+                with mock.patch.object(entry_points, '_get_fingerprint', return_value=[]):
+                    entry_points.get_entry_points('mkdocs.plugins')
+                self.assertEqual(mock_entry_points.call_count, 2 * len(entry_points.GROUPS))
+
+    @tempdir()
+    def test_corrupt_cache(self, tmp):
+        with mock.patch.object(entry_points, 'get_cache_dir', return_value=tmp):
+            os.makedirs(tmp, exist_ok=True)
+            with open(entry_points._get_cache_path(), 'w') as f:
+                f.write('{')
+            with self.patch_entry_points():
+                self.assertEqual(len(entry_points.get_entry_points('mkdocs.plugins')), 1)
+            with open(entry_points._get_cache_path()) as f:
+                self.assertIn('groups', json.load(f))
+
+    @tempdir()
+    def test_entry_point_names(self, tmp):
+        with mock.patch.object(entry_points, 'get_cache_dir', return_value=tmp):
+            with self.patch_entry_points():
+                self.assertEqual(entry_points.get_entry_point_names('mkdocs.plugins'), ['search'])
+            with mock.patch.object(entry_points, '_make_entry_point') as mock_make_entry_point:
+                self.assertEqual(entry_points.get_entry_point_names('mkdocs.plugins'), ['search'])
+            mock_make_entry_point.assert_not_called()
+
+    def test_cache_disabled(self):
+        os.environ['MKDOCS_NO_ENTRY_POINTS_CACHE'] = '1'
+        with mock.patch.object(entry_points, '_read_cache') as mock_read_cache:
+            with self.patch_entry_points():
+                eps = entry_points.get_entry_points('mkdocs.plugins')
+        self.assertEqual([ep.name for ep in eps], ['search'])
+        mock_read_cache.assert_not_called()
+
+    @tempdir(
+        files={'foo-1.0.dist-info/METADATA': 'Metadata-Version: 2.1\nName: foo\nVersion: 1.0\n'}
+    )
+    @tempdir()
+    def test_entry_point_attributes(self, tmp, site_dir):
+        dist = importlib_metadata.Distribution.at(os.path.join(site_dir, 'foo-1.0.dist-info'))
+        ep = importlib_metadata.EntryPoint(
+            'foo', 'foo.plugin:Plugin.factory [extra]', 'mkdocs.plugins'
+        )._for(dist)
+        with mock.patch.object(entry_points, 'get_cache_dir', return_value=tmp):
+            with mock.patch(
+                'importlib_metadata.entry_points',
+                side_effect=lambda group: [ep] if group == 'mkdocs.plugins' else [],
+            ):
+                entry_points.get_entry_points('mkdocs.plugins')
+            # Read from the cache.
+            (cached,) = entry_points.get_entry_points('mkdocs.plugins')
+        self.assertEqual(cached, ep)
+        self.assertEqual(cached.module, 'foo.plugin')
+        self.assertEqual(cached.attr, 'Plugin.factory')
+        self.assertEqual(cached.extras, ['extra'])
+        self.assertTrue(cached.matches(group='mkdocs.plugins', name='foo'))
+        self.assertEqual(cached.dist.name, 'foo')
+        self.assertEqual(cached.dist.version, '1.0')
+
+    def test_cache_path(self):
+        site_packages = os.path.join(os.sep, 'env', 'lib', 'site-packages')
+        with mock.patch('sys.path', [os.getcwd(), site_packages]):
+            path = entry_points._get_cache_path()
+        # The current directory and the other entries of `PYTHONPATH` are left out of the key.
+        with mock.patch('sys.path', [os.path.join(os.sep, 'other'), site_packages]):
+            self.assertEqual(entry_points._get_cache_path(), path)
+        with mock.patch('sys.path', [os.path.join(os.sep, 'env2', 'lib', 'site-packages')]):
+            self.assertNotEqual(entry_points._get_cache_path(), path)
+
+    @tempdir()
+    def test_prune_cache(self, tmp):
+        old = time.time() - entry_points.MAX_CACHE_AGE - 60
+        for name in ('entry_points-old.json', 'entry_points-recent.json', 'other.json'):
+            with open(os.path.join(tmp, name), 'w') as f:
+                f.write('{}')
+            if name != 'entry_points-recent.json':
+                os.utime(os.path.join(tmp, name), (old, old))
+        with mock.patch.object(entry_points, 'get_cache_dir', return_value=tmp):
+            with self.patch_entry_points():
+                entry_points.get_entry_points('mkdocs.plugins')
+        self.assertEqual(
+            sorted(os.listdir(tmp)),
+            sorted(
+                [
+                    os.path.basename(entry_points._get_cache_path()),
+                    'entry_points-recent.json',
+                    'other.json',
+                ]
+            ),
+        )
+
+    @tempdir()
+    def test_load(self, tmp):
+        from mkdocs.contrib.search import SearchPlugin
+        from mkdocs.themes import mkdocs as mkdocs_theme
+
+        with mock.patch.object(entry_points, 'get_cache_dir', return_value=tmp):
+            entry_points.get_entry_points('mkdocs.plugins')
+            # Read from the cache.
+            plugins = {ep.name: ep for ep in entry_points.get_entry_points('mkdocs.plugins')}
+            themes = {ep.name: ep for ep in entry_points.get_entry_points('mkdocs.themes')}
+        self.assertIs(plugins['search'].load(), SearchPlugin)
+        self.assertIs(themes['mkdocs'].load(), mkdocs_theme)
+        self.assertEqual(themes['mkdocs'].dist.name, 'mkdocs')
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+
+import unittest
+
+import jinja2
+
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.nav import get_navigation
+from mkdocs.tests.base import load_config
+from mkdocs.utils import filters
+from mkdocs.utils.navcache import NavCacheExtension
+
+NAV_TEMPLATE = (
+    "{% for item in nav %}"
+    "[{{ item.title }}{{ nav_active(item, '*') }}"
+    "{% if item.children %}"
+    "{% for child in item.children %}"
+    "({{ child.url|url }}{{ nav_active(child, '*', '-') }})"
+    "{% endfor %}"
+    "{% else %}|{{ item.url|url }}{% endif %}]"
+    "{% endfor %}"
+)
+
+
+class NavCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.config = load_config(
+            nav=[{'Home': 'index.md'}, {'A': ['a/one.md', 'a/two.md']}, {'B': 'b.md'}],
+            site_url='http://example.com/',
+        )
+        paths = ['index.md', 'a/one.md', 'a/two.md', 'b.md']
+        files = Files(
+            [File(path, self.config['docs_dir'], self.config['site_dir'], True) for path in paths]
+        )
+        self.nav = get_navigation(files, self.config)
+        self.renders = []
+
+    def get_env(self, templates):
+        env = jinja2.Environment(loader=jinja2.DictLoader(templates))
+        env.filters['url'] = filters.url_filter
+        env.add_extension(NavCacheExtension)
+        env.globals['count'] = lambda: self.renders.append(1) or ''
+        return env
+
+    def render(self, env, nav, page=None, base_url=''):
+        if page is not None:
+            page.active = True
+        try:
+            return env.get_template('main.html').render(nav=nav, page=page, base_url=base_url)
+        finally:
+            if page is not None:
+                page.active = False
+
+    def test_output_matches_uncached(self):
+        env = self.get_env(
+            {
+                'main.html': '<{% navcache %}{{ count() }}' + NAV_TEMPLATE + '{% endnavcache %}>',
+                'uncached.html': '<' + NAV_TEMPLATE + '>',
+            }
+        )
+        uncached = env.get_template('uncached.html')
+        for page in self.nav.pages:
+            page.active = True
+            expected = uncached.render(nav=self.nav, page=page, base_url='')
+            page.active = False
+            self.assertEqual(self.render(env, self.nav, page), expected)
+        self.assertEqual(
+            self.render(env, self.nav, self.nav.pages[1]),
+            '<[Home|../..][A*(./*)(../two/-)][B|../../b/]>',
+        )
+        self.assertEqual(
+            self.render(env, self.nav, base_url='/'), '<[Home|/.][A(/a/one/-)(/a/two/-)][B|/b/]>'
+        )
+        self.assertEqual(len(self.renders), 1)
+
+    def test_included_templates(self):
+        env = self.get_env(
+            {
+                'main.html': '{% navcache %}{{ count() }}{% include "nav.html" %}{% endnavcache %}',
+                'nav.html': NAV_TEMPLATE,
+            }
+        )
+        self.assertEqual(
+            self.render(env, self.nav, self.nav.pages[3]),
+            '[Home|..][A(../a/one/-)(../a/two/-)][B*|./]',
+        )
+        self.assertEqual(
+            self.render(env, self.nav, self.nav.pages[0]),
+            '[Home*|.][A(a/one/-)(a/two/-)][B|b/]',
+        )
+        self.assertEqual(len(self.renders), 1)
+
+    def test_rendered_again_for_other_nav(self):
+        env = self.get_env(
+            {'main.html': '{% navcache %}{{ count() }}{{ nav|length }}{% endnavcache %}'}
+        )
+        self.assertEqual(self.render(env, self.nav), '3')
+        self.assertEqual(self.render(env, self.nav), '3')
+        other_nav = get_navigation(Files([]), load_config(nav=[]))
+        self.assertEqual(self.render(env, other_nav), '0')
+        self.assertEqual(len(self.renders), 2)
+
+    def test_blocks_are_cached_separately(self):
+        env = self.get_env(
+            {'main.html': '{% navcache %}a{% endnavcache %}-{% navcache %}b{% endnavcache %}'}
+        )
+        self.assertEqual(self.render(env, self.nav), 'a-b')
+        self.assertEqual(self.render(env, self.nav), 'a-b')
+
+    def test_nested_blocks(self):
+        env = self.get_env(
+            {
+                'main.html': '{% navcache %}{{ count() }}['
+                '{% navcache %}{{ nav_active(nav.pages[0], "*") }}{% endnavcache %}'
+                ']{% endnavcache %}'
+            }
+        )
+        self.assertEqual(self.render(env, self.nav, self.nav.pages[0]), '[*]')
+        self.assertEqual(self.render(env, self.nav, self.nav.pages[1]), '[]')
+        self.assertEqual(len(self.renders), 1)
+
+    def test_without_nav(self):
+        env = self.get_env({'main.html': '{% navcache %}{{ count() }}{% endnavcache %}'})
+        self.render(env, None)
+        self.render(env, None)
+        self.assertEqual(len(self.renders), 2)
+
+    def test_error_in_block(self):
+        env = self.get_env({'main.html': '{% navcache %}{{ fail() }}{% endnavcache %}'})
+        with self.assertRaises(jinja2.UndefinedError):
+            self.render(env, self.nav)
+        env.globals['fail'] = lambda: 'ok'
+        self.assertEqual(self.render(env, self.nav), 'ok')
+
+    def test_nav_active_outside_block(self):
+        env = self.get_env({'main.html': '{{ nav_active(page, "yes", "no") }} {{ page.url|url }}'})
+        self.assertEqual(self.render(env, self.nav, self.nav.pages[1]), 'yes ./')
+
+    def test_autoescape(self):
+        env = self.get_env({'main.html': '{% navcache %}<{{ "&" }}>{% endnavcache %}'})
+        env.autoescape = True
+        self.assertEqual(self.render(env, self.nav), '<&amp;>')
+
+    def test_url_filter_replaced(self):
+        env = self.get_env(
+            {'main.html': '{% navcache %}{{ count() }}{{ "b.md"|url }}{% endnavcache %}'}
+        )
+        # A plugin replaces the filter after the extension was added.
+        env.filters['url'] = filters.url_filter
+        self.assertEqual(self.render(env, self.nav, self.nav.pages[0]), 'b.md')
+        self.assertEqual(self.render(env, self.nav, self.nav.pages[1]), '../../b.md')
+        self.assertEqual(len(self.renders), 2)
+
+    def test_active_attribute_in_block(self):
+        nav_template = (
+            "{% for item in nav %}[{{ item.url|url }}{% if item.active %}*{% endif %}]{% endfor %}"
+        )
+        env = self.get_env(
+            {
+                'main.html': '{% navcache %}{{ count() }}{% include "nav.html" %}{% endnavcache %}',
+                'nav.html': nav_template,
+                'uncached.html': nav_template,
+            }
+        )
+        uncached = env.get_template('uncached.html')
+        for page in self.nav.pages:
+            page.active = True
+            expected = uncached.render(nav=self.nav, page=page, base_url='')
+            page.active = False
+            self.assertEqual(self.render(env, self.nav, page), expected)
+        self.assertEqual(self.render(env, self.nav, self.nav.pages[3]), '[..][..][./*]')
+        self.assertEqual(len(self.renders), 5)
+
+    def test_page_variable_in_block(self):
+        for body in ('{{ page.url }}', '{% for item in nav %}{{ item == page }}{% endfor %}'):
+            env = self.get_env({'main.html': '{% navcache %}' + body + '{% endnavcache %}'})
+            with self.assertRaises(jinja2.TemplateSyntaxError) as cm:
+                env.get_template('main.html')
+            self.assertIn("uses the 'page' variable", str(cm.exception))
+
+    def test_page_variable_in_included_template(self):
+        nav_template = (
+            "{% for item in nav %}[{{ item.url|url }}{% if item == page %}*{% endif %}]"
+            "{% endfor %}"
+        )
+        env = self.get_env(
+            {
+                'main.html': '{% navcache %}{{ count() }}{% include "nav.html" %}{% endnavcache %}',
+                'nav.html': '{% include ["missing.html", "sub.html"] %}',
+                'sub.html': nav_template,
+                'uncached.html': nav_template,
+            }
+        )
+        uncached = env.get_template('uncached.html')
+        for page in self.nav.pages:
+            expected = uncached.render(nav=self.nav, page=page, base_url='')
+            self.assertEqual(self.render(env, self.nav, page), expected)
+        self.assertEqual(self.render(env, self.nav, self.nav.pages[3]), '[..][..][./*]')
+        self.assertEqual(len(self.renders), 5)
+
+    def test_dynamic_include_in_block(self):
+        env = self.get_env(
+            {
+                'main.html': '{% navcache %}{{ count() }}{% include name %}{% endnavcache %}',
+                'nav.html': '{{ nav|length }}',
+            }
+        )
+        for _ in range(2):
+            self.assertEqual(
+                env.get_template('main.html').render(nav=self.nav, page=None, name='nav.html'),
+                '3',
+            )
+        self.assertEqual(len(self.renders), 2)
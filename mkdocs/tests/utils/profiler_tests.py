@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+import json
+import os
+import unittest
+from unittest import mock
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils.profiler import BuildProfiler, EventTimings
+
+
+class BuildProfilerTests(unittest.TestCase):
+    def _get_profiler(self, **kwargs):
+        # Each call of the clocks advances them by one second.
+        clock = iter(range(1000))
+        with mock.patch('time.perf_counter', side_effect=lambda: next(clock)):
+            with mock.patch('time.process_time', return_value=0):
+                profiler = BuildProfiler(**kwargs)
+                with profiler.phase('files'):
+                    pass
+                for src_uri in ('a.md', 'b.md', 'c.md'):
+                    with profiler.page_step(src_uri, 'write'):
+                        pass
+                    with profiler.page_step(src_uri, 'read'):
+                        pass
+                profiler.add_page_step('b.md', 'render', 5.0, 4.0)
+                with profiler.template('sitemap.xml'):
+                    pass
+                with profiler.phase('files'):
+                    pass
+                return profiler, profiler.get_report()
+
+    def test_report(self):
+        profiler, report = self._get_profiler(slowest=2)
+        self.assertEqual(report['total'], {'wall': 19, 'cpu': 0})
+        self.assertEqual(report['phases'], {'files': {'wall': 2, 'cpu': 0}})
+        self.assertEqual(report['templates'], {'sitemap.xml': {'wall': 1, 'cpu': 0}})
+        self.assertEqual(
+            report['pages']['b.md'],
+            {
+                'steps': {
+                    'read': {'wall': 1, 'cpu': 0},
+                    'render': {'wall': 5.0, 'cpu': 4.0},
+                    'write': {'wall': 1, 'cpu': 0},
+                },
+                'total': {'wall': 7.0, 'cpu': 4.0},
+            },
+        )
+        self.assertEqual(
+            report['slowest_pages'],
+            [
+                {'src_uri': 'b.md', 'wall': 7.0, 'cpu': 4.0},
+                {'src_uri': 'a.md', 'wall': 2, 'cpu': 0},
+            ],
+        )
+
+    def test_disabled(self):
+        profiler, report = self._get_profiler(enabled=False)
+        self.assertEqual(report['phases'], {})
+        self.assertEqual(report['pages'], {})
+        self.assertEqual(report['templates'], {})
+        self.assertEqual(report['slowest_pages'], [])
+
+    def test_error_in_phase(self):
+        profiler = BuildProfiler()
+        with self.assertRaises(ValueError):
+            with profiler.phase('files'):
+                raise ValueError()
+        self.assertIn('files', profiler.phases)
+
+    @tempdir()
+    def test_write_report(self, output_dir):
+        profiler, report = self._get_profiler()
+        path = os.path.join(output_dir, 'report.json')
+        profiler.write_report(path, report)
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), report)
+
+    def test_log_summary(self):
+        profiler, report = self._get_profiler(slowest=1)
+        with self.assertLogs('mkdocs.utils.profiler', level='INFO') as cm:
+            profiler.log_summary(report)
+        self.assertEqual(
+            cm.output[0].splitlines()[1:],
+            [
+                'Build phase                Wall (s)    CPU (s)  Wall %',
+                'files                         2.000      0.000   10.5%',
+                'total                        19.000      0.000',
+                '',
+                'Slowest pages              Wall (s)    CPU (s)',
+                'b.md                          7.000      4.000',
+            ],
+        )
+
+
+class EventTimingsTests(unittest.TestCase):
+    def _get_timings(self):
+        timings = EventTimings()
+        timings.add('search', 'page_content', 1.0, 'a.md')
+        timings.add('search', 'page_content', 3.0, 'b.md')
+        timings.add('search', 'post_build', 2.0)
+        timings.add('macros', 'page_content', 0.5, 'a.md')
+        timings.add('macros', 'page_content', 0.25, 'a.md')
+        return timings
+
+    def test_report(self):
+        report = self._get_timings().get_report()
+        self.assertEqual(
+            report['plugins']['search']['page_content'],
+            {'count': 2, 'total': 4.0, 'max': 3.0, 'pages': {'a.md': 1.0, 'b.md': 3.0}},
+        )
+        self.assertEqual(
+            report['plugins']['macros']['page_content'],
+            {'count': 2, 'total': 0.75, 'max': 0.5, 'pages': {'a.md': 0.75}},
+        )
+        self.assertEqual(
+            report['events'],
+            {
+                'page_content': {'count': 4, 'total': 4.75, 'max': 3.0},
+                'post_build': {'count': 1, 'total': 2.0, 'max': 2.0},
+            },
+        )
+
+    def test_log_summary(self):
+        with self.assertLogs('mkdocs.utils.profiler', level='INFO') as cm:
+            self._get_timings().log_summary(limit=2)
+        self.assertEqual(
+            cm.output[0].splitlines()[1:],
+            [
+                'Plugin event                               Calls  Total (s)    Max (s) Slowest page',
+                'search on_page_content                         2      4.000      3.000 b.md',
+                'search on_post_build                           1      2.000      2.000',
+            ],
+        )
+
+    def test_log_summary_empty(self):
+        with mock.patch('mkdocs.utils.profiler.log') as mock_log:
+            EventTimings().log_summary()
+        mock_log.info.assert_not_called()
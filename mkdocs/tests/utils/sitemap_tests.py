@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+import gzip
+import os
+import unittest
+from unittest import mock
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils import sitemap
+
+
+class SitemapTests(unittest.TestCase):
+    def test_get_shard_names(self):
+        self.assertEqual(sitemap.get_shard_names(50000), [])
+        self.assertEqual(sitemap.get_shard_names(50001), ['sitemap-1.xml', 'sitemap-2.xml'])
+        self.assertEqual(sitemap.get_shard_names(4, max_urls=2), ['sitemap-1.xml', 'sitemap-2.xml'])
+        self.assertEqual(sitemap.get_shard_names(0), [])
+
+    def test_get_shards(self):
+        self.assertEqual(sitemap.get_shards(list(range(3))), [])
+        self.assertEqual(
+            sitemap.get_shards(list(range(5)), max_urls=2),
+            [('sitemap-1.xml', [0, 1]), ('sitemap-2.xml', [2, 3]), ('sitemap-3.xml', [4])],
+        )
+
+    def test_get_index(self):
+        def page(update_date):
+            return mock.Mock(page=mock.Mock(update_date=update_date))
+
+        shards = [
+            ('sitemap-1.xml', [page('2022-01-01'), page('2022-03-01')]),
+            ('sitemap-2.xml', [page(None)]),
+        ]
+        self.assertEqual(
+            ''.join(sitemap.get_index(shards, 'https://example.com/docs?a&b')),
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            '    <sitemap>\n'
+            '         <loc>https://example.com/docs?a&amp;b/sitemap-1.xml</loc>\n'
+            '         <lastmod>2022-03-01</lastmod>\n'
+            '    </sitemap>\n'
+            '    <sitemap>\n'
+            '         <loc>https://example.com/docs?a&amp;b/sitemap-2.xml</loc>\n'
+            '    </sitemap>\n'
+            '</sitemapindex>\n',
+        )
+        self.assertIn('<loc>/sitemap-1.xml</loc>', ''.join(sitemap.get_index(shards, None)))
+
+    @tempdir()
+    def test_write(self, site_dir):
+        path = os.path.join(site_dir, 'sitemap.xml')
+        self.assertEqual(sitemap.write(iter(['<a>', 'é', '</a>']), path), [path, f'{path}.gz'])
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), '<a>é</a>'.encode())
+        with open(f'{path}.gz', 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()), '<a>é</a>'.encode())
+        self.assertEqual(sorted(os.listdir(site_dir)), ['sitemap.xml', 'sitemap.xml.gz'])
+
+    @tempdir()
+    def test_write_blank(self, site_dir):
+        path = os.path.join(site_dir, 'sitemap.xml')
+        self.assertEqual(sitemap.write(iter([' ', '\n']), path), [])
+        self.assertEqual(os.listdir(site_dir), [])
+
+    @tempdir()
+    def test_write_error(self, site_dir):
+        def chunks():
+            yield '<a>'
+            raise ValueError()
+
+        path = os.path.join(site_dir, 'sitemap.xml')
+        with self.assertRaises(ValueError):
+            sitemap.write(chunks(), path)
+        self.assertEqual(os.listdir(site_dir), [])
+
+    @tempdir(files={'sitemap.xml': '<a></a>'})
+    def test_write_skip_unchanged(self, site_dir):
+        path = os.path.join(site_dir, 'sitemap.xml')
+        os.utime(path, ns=(0, 0))
+        self.assertEqual(
+            sitemap.write(iter(['<a></a>']), path, compress=False, skip_unchanged=True), [path]
+        )
+        self.assertEqual(os.stat(path).st_mtime_ns, 0)
+        sitemap.write(iter(['<b></b>']), path, compress=False, skip_unchanged=True)
+        self.assertNotEqual(os.stat(path).st_mtime_ns, 0)
+        self.assertEqual(os.listdir(site_dir), ['sitemap.xml'])
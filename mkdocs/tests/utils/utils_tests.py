@@ -11,6 +11,8 @@ import tempfile
 import unittest
 from unittest import mock
 
+import yaml
+
 from mkdocs import exceptions, utils
 from mkdocs.structure.files import File
 from mkdocs.structure.pages import Page
@@ -93,6 +95,8 @@ class UtilsTests(unittest.TestCase):
             dict(url='a/..../b', other='a/../b', expected='../a/..../b'),
             dict(url='a/я/b', other='a/я/c', expected='../b'),
             dict(url='a/я/b', other='a/яя/c', expected='../../я/b'),
+            dict(url='foo/bar', other='fo', expected='../foo/bar'),
+            dict(url='foobar/baz', other='foo/bar', expected='../../foobar/baz'),
         ]:
             url, other, expected = case['url'], case['other'], case['expected']
             with self.subTest(url=url, other=other):
@@ -102,6 +106,18 @@ class UtilsTests(unittest.TestCase):
                 self.assertEqual(utils.get_relative_url(url, '/' + other), expected)
                 self.assertEqual(utils.get_relative_url('/' + url, '/' + other), expected)
 
+    def test_clear_url_cache(self):
+        self.assertEqual(utils.get_relative_url('foo/bar/', 'foo/baz/'), '../bar/')
+        self.assertEqual(utils.normalize_url('foo/', base='/'), '/foo/')
+        utils.clear_url_cache()
+        for func in (
+            utils._norm_parts,
+            utils._get_norm_path,
+            utils._get_dir_prefixes,
+            utils._get_norm_url,
+        ):
+            self.assertEqual(func.cache_info().currsize, 0)
+
     def test_get_relative_url_empty(self):
         for url in ['', '.', '/.']:
             for other in ['', '.', '/', '/.']:
@@ -433,6 +449,14 @@ class UtilsTests(unittest.TestCase):
         self.assertEqual(config['key4'], 'Hello, World!')
         self.assertIs(config['key5'], False)
 
+    @unittest.skipUnless(yaml.__with_libyaml__, "PyYAML was built without libyaml")
+    @mock.patch.dict(os.environ, {'VARNAME': 'Hello, World!'})
+    def test_yaml_loader_libyaml(self):
+        Loader = utils.get_yaml_loader()
+        self.assertTrue(issubclass(Loader, yaml.CLoader))
+        config = utils.yaml_load('key: !ENV VARNAME\nfunc: !!python/name:os.path.join\n', Loader)
+        self.assertEqual(config, {'key': 'Hello, World!', 'func': os.path.join})
+
     @tempdir(files={'base.yml': BASEYML, 'parent.yml': PARENTYML})
     def test_yaml_inheritance(self, tdir):
         expected = {
@@ -531,6 +555,48 @@ class UtilsTests(unittest.TestCase):
             shutil.rmtree(src_dir)
             shutil.rmtree(dst_dir)
 
+    @tempdir(files={'foo.txt': 'content'})
+    @tempdir()
+    def test_copy_file_modes(self, dst_dir, src_dir):
+        src = os.path.join(src_dir, 'foo.txt')
+        for mode in utils.COPY_MODES:
+            with self.subTest(mode):
+                dst = os.path.join(dst_dir, mode, 'foo.txt')
+                utils.copy_file(src, dst, mode)
+                with open(dst) as f:
+                    self.assertEqual(f.read(), 'content')
+                # Publishing again replaces the file.
+                utils.copy_file(src, dst, mode)
+                self.assertEqual(os.path.samefile(src, dst), mode in ('hardlink', 'auto'))
+
+    @tempdir(files={'foo.txt': 'content'})
+    @tempdir()
+    def test_copy_file_over_hardlink(self, dst_dir, src_dir):
+        src = os.path.join(src_dir, 'foo.txt')
+        dst = os.path.join(dst_dir, 'foo.txt')
+        utils.copy_file(src, dst, 'hardlink')
+        utils.copy_file(src, dst, 'copy')
+        self.assertFalse(os.path.samefile(src, dst))
+        with open(dst, 'w') as f:
+            f.write('changed')
+        with open(src) as f:
+            self.assertEqual(f.read(), 'content')
+
+    @tempdir(files={'foo.txt': 'content'})
+    @tempdir()
+    def test_copy_file_fallbacks(self, dst_dir, src_dir):
+        src = os.path.join(src_dir, 'foo.txt')
+        dst = os.path.join(dst_dir, 'foo.txt')
+        with mock.patch('os.link', side_effect=OSError('Cross-device link')):
+            utils.copy_file(src, dst, 'hardlink')
+        self.assertFalse(os.path.samefile(src, dst))
+        with mock.patch('fcntl.ioctl', side_effect=OSError('Not supported')), mock.patch(
+            'os.copy_file_range', side_effect=OSError('Not supported'), create=True
+        ):
+            utils.copy_file(src, dst, 'reflink')
+        with open(dst) as f:
+            self.assertEqual(f.read(), 'content')
+
     def test_mm_meta_data(self):
         doc = dedent(
             """
@@ -589,6 +655,20 @@ class UtilsTests(unittest.TestCase):
             ),
         )
 
+    def test_yaml_meta_data_cache(self):
+        doc = '---\nTags:\n    - foo\n---\nDoc body'
+        utils.meta.clear_cache()
+        try:
+            for _ in range(3):
+                body, data = utils.meta.get_data(doc)
+                self.assertEqual((body, data), ('Doc body', {'Tags': ['foo']}))
+                # The data of each page is its own.
+                data['Tags'].append('bar')
+            self.assertEqual(utils.meta._cache, {'Tags:\n    - foo\n': {'Tags': ['foo']}})
+        finally:
+            utils.meta.clear_cache()
+        self.assertEqual(utils.meta._cache, {})
+
     def test_yaml_meta_data_not_dict(self):
         doc = dedent(
             """
@@ -619,6 +699,54 @@ class UtilsTests(unittest.TestCase):
         )
         self.assertEqual(utils.meta.get_data(doc), (doc, {}))
 
+    def test_mm_meta_data_line_endings(self):
+        doc = 'Title: Foo\r\nSummary: Line one\r    Line two\r\n\r\n\r\nDoc\r\nbody'
+        self.assertEqual(
+            utils.meta.get_data(doc),
+            ('Doc\nbody', {'title': 'Foo', 'summary': 'Line one Line two'}),
+        )
+
+    def test_meta_data_and_title(self):
+        cases = [
+            ('---\ntitle: Foo\n---\n\n# Bar\nDoc body', ({'title': 'Foo'}, 'Bar')),
+            ('Title: Foo\n\n  \n# Bar  \r\nDoc body', ({'title': 'Foo'}, 'Bar')),
+            ('\n\n# Bar', ({}, 'Bar')),
+            ('Doc body\n# Bar', ({}, None)),
+            ('## Bar', ({}, None)),
+            ('---\n- List item\n---\n# Bar', ({}, None)),
+            ('', ({}, None)),
+        ]
+        for doc, (data, title) in cases:
+            with self.subTest(doc=doc):
+                body, _ = utils.meta.get_data(doc)
+                self.assertEqual(utils.meta.get_data_and_title(doc), (body, data, title))
+                self.assertEqual(utils.get_markdown_title(body), title)
+
+    @tempdir()
+    def test_read_head(self, tdir):
+        path = os.path.join(tdir, 'page.md')
+        cases = [
+            ('---\ntitle: Foo\ntags: [a, b]\n---\n\n# Bar\nDoc body\n', {'title': 'Foo'}),
+            ('Title: Foo\n    Baz\n\n# Bar\n' + 'Doc body\n' * 100, {'title': 'Foo Baz'}),
+            ('\n' * 50 + '# Bar', {}),
+            ('---\n\n# Bar\n' + 'Doc body\n' * 100, {}),
+        ]
+        for doc, data in cases:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(doc)
+            expected = utils.meta.get_data_and_title(doc)[1:]
+            for size in (1, 5, 4096):
+                with self.subTest(doc=doc, size=size):
+                    self.assertEqual(utils.meta.read_head(path, size), expected)
+            self.assertEqual(expected[0].get('title'), data.get('title'))
+
+        # Only the head of the file is read.
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('# Bar\n' + 'Doc body\n' * 10000)
+        with mock.patch('builtins.open', mock.mock_open(read_data='# Bar\n' + 'x' * 10000)) as m:
+            self.assertEqual(utils.meta.read_head(path, 16), ({}, 'Bar'))
+        m.return_value.read.assert_called_once_with(16)
+
 
 class LogCounterTests(unittest.TestCase):
     def setUp(self):
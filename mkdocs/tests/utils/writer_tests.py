@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+import os
+import unittest
+from unittest import mock
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils.writer import BackgroundWriter
+
+
+class BackgroundWriterTests(unittest.TestCase):
+    @tempdir()
+    def test_write_file(self, output_dir):
+        with BackgroundWriter() as writer:
+            for i in range(50):
+                writer.write_file(f'{i}'.encode(), os.path.join(output_dir, f'{i}', 'index.html'))
+        for i in range(50):
+            with open(os.path.join(output_dir, f'{i}', 'index.html'), 'rb') as f:
+                self.assertEqual(f.read(), f'{i}'.encode())
+
+    @tempdir(files={'foo.css': 'foo'})
+    @tempdir()
+    def test_copy_file(self, output_dir, src_dir):
+        with BackgroundWriter() as writer:
+            writer.copy_file(
+                os.path.join(src_dir, 'foo.css'), os.path.join(output_dir, 'css/a.css')
+            )
+            os.makedirs(os.path.join(output_dir, 'js'))
+            writer.copy_file(os.path.join(src_dir, 'foo.css'), os.path.join(output_dir, 'js'))
+        with open(os.path.join(output_dir, 'css', 'a.css')) as f:
+            self.assertEqual(f.read(), 'foo')
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, 'js', 'foo.css')))
+
+    @tempdir(files={'foo.html': 'copied'})
+    @tempdir()
+    def test_same_path_in_order(self, output_dir, src_dir):
+        path = os.path.join(output_dir, 'foo.html')
+        with BackgroundWriter(threads=4, max_pending=1) as writer:
+            for i in range(20):
+                writer.copy_file(os.path.join(src_dir, 'foo.html'), path)
+                writer.write_file(f'{i}'.encode(), path)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b'19')
+
+    @tempdir()
+    def test_makedirs_once_per_directory(self, output_dir):
+        with mock.patch('os.makedirs', wraps=os.makedirs) as mock_makedirs:
+            with BackgroundWriter(threads=1) as writer:
+                for name in ('a.html', 'b.html', 'c.html'):
+                    writer.write_file(b'', os.path.join(output_dir, 'sub', name))
+        mock_makedirs.assert_called_once_with(os.path.join(output_dir, 'sub'), exist_ok=True)
+
+    @tempdir(files={'same.css': 'same', 'other.css': 'new'})
+    @tempdir(
+        files={'same.html': 'same', 'other.html': 'old', 'same.css': 'same', 'other.css': 'old'}
+    )
+    def test_skip_unchanged(self, output_dir, src_dir):
+        for name in os.listdir(output_dir):
+            os.utime(os.path.join(output_dir, name), ns=(0, 0))
+        with BackgroundWriter(skip_unchanged=True) as writer:
+            writer.write_file(b'same', os.path.join(output_dir, 'same.html'))
+            writer.write_file(b'new', os.path.join(output_dir, 'other.html'))
+            for name in ('same.css', 'other.css'):
+                writer.copy_file(os.path.join(src_dir, name), os.path.join(output_dir, name))
+        mtimes = {
+            name: os.stat(os.path.join(output_dir, name)).st_mtime_ns
+            for name in os.listdir(output_dir)
+        }
+        self.assertEqual(mtimes['same.html'], 0)
+        self.assertEqual(mtimes['same.css'], 0)
+        self.assertNotEqual(mtimes['other.html'], 0)
+        self.assertNotEqual(mtimes['other.css'], 0)
+        with open(os.path.join(output_dir, 'other.css')) as f:
+            self.assertEqual(f.read(), 'new')
+        self.assertEqual(
+            writer.outputs,
+            {
+                os.path.join(output_dir, name)
+                for name in ('same.html', 'other.html', 'same.css', 'other.css')
+            },
+        )
+
+    @tempdir(files={'foo.css': 'foo'})
+    @tempdir()
+    def test_copy_mode(self, output_dir, src_dir):
+        with BackgroundWriter(copy_mode='hardlink') as writer:
+            writer.copy_file(
+                os.path.join(src_dir, 'foo.css'), os.path.join(output_dir, 'css', 'foo.css')
+            )
+        self.assertTrue(
+            os.path.samefile(
+                os.path.join(src_dir, 'foo.css'), os.path.join(output_dir, 'css', 'foo.css')
+            )
+        )
+
+    @tempdir()
+    def test_synchronous(self, output_dir):
+        writer = BackgroundWriter(threads=0)
+        writer.write_file(b'foo', os.path.join(output_dir, 'foo'))
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, 'foo')))
+        writer.close()
+
+    @tempdir()
+    def test_error_raised_on_close(self, output_dir):
+        writer = BackgroundWriter()
+        # A directory can't be overwritten by a file.
+        os.makedirs(os.path.join(output_dir, 'foo'))
+        writer.write_file(b'foo', os.path.join(output_dir, 'foo'))
+        writer.write_file(b'bar', os.path.join(output_dir, 'bar'))
+        with self.assertLogs('mkdocs', level='ERROR') as cm:
+            with self.assertRaises(OSError):
+                writer.close()
+        self.assertEqual(len(cm.output), 1)
+        self.assertTrue(
+            cm.output[0].startswith(
+                f"ERROR:mkdocs.utils.writer:Error writing '{os.path.join(output_dir, 'foo')}':"
+            )
+        )
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, 'bar')))
+
+    @tempdir()
+    def test_error_not_raised_on_exit_with_exception(self, output_dir):
+        os.makedirs(os.path.join(output_dir, 'foo'))
+        with self.assertLogs('mkdocs', level='ERROR'):
+            with self.assertRaises(ValueError):
+                with BackgroundWriter() as writer:
+                    writer.write_file(b'foo', os.path.join(output_dir, 'foo'))
+                    raise ValueError()
+
+    @tempdir()
+    def test_write_after_close(self, output_dir):
+        writer = BackgroundWriter()
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write_file(b'foo', os.path.join(output_dir, 'foo'))
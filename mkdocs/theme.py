@@ -1,11 +1,15 @@
 import logging
 import os
+import tempfile
 
 import jinja2
+from jinja2.bccache import Bucket
 
+import mkdocs
 from mkdocs import localization, utils
 from mkdocs.config.base import ValidationError
-from mkdocs.utils import filters
+from mkdocs.utils import filters, navcache
+from mkdocs.utils.cache import get_key
 
 log = logging.getLogger(__name__)
 
@@ -109,12 +113,134 @@ class Theme:
         self.static_templates.update(theme_config.pop('static_templates', []))
         self._vars.update(theme_config)
 
-    def get_env(self):
-        """Return a Jinja environment for the theme."""
+    def get_env(self, cache_dir=None):
+        """
+        Return a Jinja environment for the theme.
+
+        The compiled templates are kept in memory for the following builds, and also stored
+        in `cache_dir` if it is given.
+        """
 
         loader = jinja2.FileSystemLoader(self.dirs)
         # No autoreload because editing a template in the middle of a build is not useful.
-        env = jinja2.Environment(loader=loader, auto_reload=False)
+        env = jinja2.Environment(
+            loader=loader, auto_reload=False, bytecode_cache=_BytecodeCache(cache_dir)
+        )
         env.filters['url'] = filters.url_filter
+        env.add_extension(navcache.NavCacheExtension)
         localization.install_translations(env, self._vars['locale'], self.dirs)
         return env
+
+
+# The compiled templates of all the environments of the process, by `_BytecodeCache` key, from
+# the least to the most recently used.
+_compiled_templates = {}
+# The number of compiled templates kept in memory.
+_MAX_COMPILED_TEMPLATES = 256
+
+
+def _remember_compiled_template(key, data):
+    _compiled_templates.pop(key, None)
+    _compiled_templates[key] = data
+    while len(_compiled_templates) > _MAX_COMPILED_TEMPLATES:
+        del _compiled_templates[next(iter(_compiled_templates))]
+
+
+class _BytecodeCache(jinja2.BytecodeCache):
+    """
+    Keep the compiled templates in memory and, if a `directory` is given, on disk.
+
+    Jinja checks that the source of a template is the same as the one it was compiled from.
+    The compiled code also depends on the versions of Python, Jinja and MkDocs, and on the
+    extensions, syntax and code generation settings of the environment, which are all part
+    of the key.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+
+    def get_bucket(self, environment, name, filename, source):
+        bucket = Bucket(
+            environment, self.get_cache_key(name, filename), self.get_source_checksum(source)
+        )
+        # The autoescape setting may depend on the name of the template.
+        autoescape = environment.autoescape
+        bucket.autoescape = autoescape(name) if callable(autoescape) else autoescape
+        self.load_bytecode(bucket)
+        return bucket
+
+    def _get_key(self, bucket):
+        env = bucket.environment
+        return get_key(
+            'jinja',
+            jinja2.__version__,
+            mkdocs.__version__,
+            bucket.key,
+            sorted(env.extensions),
+            getattr(env, 'newstyle_gettext', None),
+            bool(bucket.autoescape),
+            # Functions are identified by their import path.
+            env.finalize,
+            [
+                getattr(env, name, None)
+                for name in (
+                    'block_start_string',
+                    'block_end_string',
+                    'variable_start_string',
+                    'variable_end_string',
+                    'comment_start_string',
+                    'comment_end_string',
+                    'line_statement_prefix',
+                    'line_comment_prefix',
+                    'trim_blocks',
+                    'lstrip_blocks',
+                    'newline_sequence',
+                    'keep_trailing_newline',
+                    'is_async',
+                    'optimized',
+                )
+            ],
+        )
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, f'{key}.cache')
+
+    def load_bytecode(self, bucket):
+        key = self._get_key(bucket)
+        if key is None:
+            return
+        data = _compiled_templates.get(key)
+        if data is None and self.directory is not None:
+            try:
+                with open(self._get_path(key), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                return
+        if data is not None:
+            # Jinja ignores the code if it is outdated or was compiled by another Python version.
+            bucket.bytecode_from_string(data)
+            if bucket.code is not None:
+                _remember_compiled_template(key, data)
+
+    def dump_bytecode(self, bucket):
+        key = self._get_key(bucket)
+        if key is None:
+            return
+        data = bucket.bytecode_to_string()
+        _remember_compiled_template(key, data)
+        if self.directory is None:
+            return
+        path = self._get_path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write to a temporary file first so that a concurrent reader never sees a partial entry.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            log.debug(f"Unable to write to the template cache in '{self.directory}': {e}")
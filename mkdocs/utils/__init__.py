@@ -18,13 +18,17 @@ from datetime import datetime, timezone
 from pathlib import PurePath
 from urllib.parse import urlsplit
 
-import importlib_metadata
 import yaml
 from mergedeep import merge
 from yaml_env_tag import construct_env_tag
 
 from mkdocs import exceptions
 
+try:
+    from yaml import CLoader as _Loader
+except ImportError:  # pragma: no cover
+    from yaml import Loader as _Loader
+
 log = logging.getLogger(__name__)
 
 markdown_extensions = (
@@ -36,8 +40,13 @@ markdown_extensions = (
 )
 
 
-def get_yaml_loader(loader=yaml.Loader):
-    """Wrap PyYaml's loader so we can extend it to suit our needs."""
+def get_yaml_loader(loader=_Loader):
+    """
+    Wrap PyYaml's loader so we can extend it to suit our needs.
+
+    The default loader is the one of libyaml if PyYaml was built with it, which is several
+    times faster than the pure Python one.
+    """
 
     class Loader(loader):
         """
@@ -52,8 +61,12 @@ def get_yaml_loader(loader=yaml.Loader):
     return Loader
 
 
-def yaml_load(source, loader=None):
-    """Return dict of source YAML file using loader, recursively deep merging inherited parent."""
+def yaml_load(source, loader=None, inherited_paths=None):
+    """
+    Return dict of source YAML file using loader, recursively deep merging inherited parent.
+
+    If a list is given as `inherited_paths`, the paths of the inherited files are appended to it.
+    """
     Loader = loader or get_yaml_loader()
     result = yaml.load(source, Loader=Loader)
     if result is not None and 'INHERIT' in result:
@@ -64,8 +77,10 @@ def yaml_load(source, loader=None):
                 f"Inherited config file '{relpath}' does not exist at '{abspath}'."
             )
         log.debug(f"Loading inherited configuration file: {abspath}")
+        if inherited_paths is not None:
+            inherited_paths.append(abspath)
         with open(abspath, 'rb') as fd:
-            parent = yaml_load(fd, Loader)
+            parent = yaml_load(fd, Loader, inherited_paths)
         result = merge(parent, result)
     return result
 
@@ -123,25 +138,106 @@ def reduce_list(data_set):
     return list(dict.fromkeys(data_set))
 
 
-def copy_file(source_path, output_path):
+# The ways in which `copy_file` can publish a file.
+COPY_MODES = ('copy', 'hardlink', 'reflink', 'auto')
+
+# The `ioctl` request which clones a file on Linux filesystems which support it (Btrfs, XFS...).
+_FICLONE = 0x40049409
+
+
+def copy_file(source_path, output_path, mode='copy'):
     """
     Copy source_path to output_path, making sure any parent directories exist.
 
     The output_path may be a directory.
+
+    The `mode` is one of `COPY_MODES`. With `hardlink`, the output is a hard link to the
+    source. With `reflink`, the output shares the data of the source on filesystems which
+    support it, through the `FICLONE` ioctl or `os.copy_file_range`. With `auto`, a hard link
+    is used if both paths are on the same filesystem, and a reflink otherwise. The file is
+    copied when the requested mode isn't possible.
     """
     output_dir = os.path.dirname(output_path)
     os.makedirs(output_dir, exist_ok=True)
     if os.path.isdir(output_path):
         output_path = os.path.join(output_path, os.path.basename(source_path))
+    publish_file(source_path, output_path, mode)
+
+
+def publish_file(source_path, output_path, mode='copy'):
+    """
+    Copy source_path to output_path, in one of the `COPY_MODES`, whose directory must exist.
+    See `copy_file`.
+    """
+    if mode == 'copy':
+        # Writing to a file which is a hard link (from a previous build) would modify the
+        # source as well.
+        unlink_hardlink(output_path)
+    elif os.path.lexists(output_path):
+        # A link can't replace an existing file.
+        os.unlink(output_path)
+
+    if mode == 'auto':
+        same_device = os.stat(source_path).st_dev == os.stat(os.path.dirname(output_path)).st_dev
+        mode = 'hardlink' if same_device else 'reflink'
+    if mode == 'hardlink':
+        try:
+            os.link(source_path, output_path)
+            return
+        except OSError as e:
+            log.debug(f"Copying '{source_path}' instead of linking it: {e}")
+    if mode == 'reflink' and _reflink_file(source_path, output_path):
+        return
     shutil.copyfile(source_path, output_path)
 
 
+def _reflink_file(source_path, output_path):
+    """Clone source_path to output_path if the filesystem supports it. Return True on success."""
+    with open(source_path, 'rb') as src, open(output_path, 'wb') as dst:
+        try:
+            import fcntl
+
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            return True
+        except (ImportError, OSError):
+            pass
+        if not hasattr(os, 'copy_file_range'):
+            return False
+        # The kernel may share the data or copy it without going through user space.
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), size - offset)
+                if not copied:
+                    break
+                offset += copied
+        except OSError as e:
+            log.debug(f"Copying '{source_path}' instead of cloning it: {e}")
+            dst.truncate(0)
+            return False
+        return offset == size
+
+
+def unlink_hardlink(path):
+    """
+    Remove the file at `path` if it is a hard link, so that writing to `path` creates a new
+    file instead of modifying the file which is linked.
+    """
+    try:
+        if os.stat(path).st_nlink > 1:
+            os.unlink(path)
+    except OSError:
+        pass
+
+
 def write_file(content, output_path):
     """
     Write content to output_path, making sure any parent directories exist.
     """
     output_dir = os.path.dirname(output_path)
     os.makedirs(output_dir, exist_ok=True)
+    unlink_hardlink(output_path)
     with open(output_path, 'wb') as f:
         f.write(content)
 
@@ -229,6 +325,36 @@ def _norm_parts(path):
     return path.split('/') if path else []
 
 
+# Relative URLs are computed for every link of every page, and for every item of the navigation
+# of every page (through the `url` template filter). To make that cheap, the normalized form of
+# each target URL and the parent directories of each source URL are computed only once.
+
+
+@functools.lru_cache(maxsize=None)
+def _get_norm_path(url):
+    """Return the normalized path of url, with a trailing slash unless it is the root."""
+    parts = _norm_parts(url)
+    return '/'.join(parts) + '/' if parts else ''
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dir_prefixes(other):
+    """
+    Return the normalized paths of the directory of other and of all its parents, from the
+    innermost to the root, each with the relative URL of that directory from other's directory.
+    """
+    # Remove filename from other url if it has one.
+    dirname, _, basename = other.rpartition('/')
+    if '.' in basename:
+        other = dirname
+
+    parts = _norm_parts(other)
+    return [
+        ('/'.join(parts[:i]) + '/' if i else '', '../' * (len(parts) - i))
+        for i in range(len(parts), -1, -1)
+    ]
+
+
 def get_relative_url(url, other):
     """
     Return given url relative to other.
@@ -239,21 +365,12 @@ def get_relative_url(url, other):
     Paths are normalized ('..' works as parent directory), but going higher than the
     root has no effect ('foo/../../bar' ends up just as 'bar').
     """
-    # Remove filename from other url if it has one.
-    dirname, _, basename = other.rpartition('/')
-    if '.' in basename:
-        other = dirname
-
-    other_parts = _norm_parts(other)
-    dest_parts = _norm_parts(url)
-    common = 0
-    for a, b in zip(other_parts, dest_parts):
-        if a != b:
+    dest = _get_norm_path(url)
+    # Find the innermost common directory. The root always matches.
+    for prefix, up in _get_dir_prefixes(other):
+        if dest.startswith(prefix):
+            relurl = (up + dest[len(prefix) :])[:-1] or '.'
             break
-        common += 1
-
-    rel_parts = ['..'] * (len(other_parts) - common) + dest_parts[common:]
-    relurl = '/'.join(rel_parts) or '.'
     return relurl + '/' if url.endswith('/') else relurl
 
 
@@ -284,6 +401,12 @@ def _get_norm_url(path):
     return path, False
 
 
+def clear_url_cache():
+    """Forget the URLs normalized so far. This is done at the end of each build."""
+    for func in (_norm_parts, _get_norm_path, _get_dir_prefixes, _get_norm_url):
+        func.cache_clear()
+
+
 def create_media_urls(path_list, page=None, base=''):
     """
     Return a list of URLs relative to the given page or using the base.
@@ -306,8 +429,10 @@ def get_theme_dir(name):
 def get_themes():
     """Return a dict of all installed themes as {name: EntryPoint}."""
 
+    from mkdocs.utils import entry_points
+
     themes = {}
-    eps = set(importlib_metadata.entry_points(group='mkdocs.themes'))
+    eps = set(entry_points.get_entry_points('mkdocs.themes'))
     builtins = {ep.name for ep in eps if ep.dist.name == 'mkdocs'}
 
     for theme in eps:
@@ -354,14 +479,9 @@ def get_markdown_title(markdown_src):
     None.
     """
 
-    lines = markdown_src.replace('\r\n', '\n').replace('\r', '\n').split('\n')
-    while lines:
-        line = lines.pop(0).strip()
-        if not line.strip():
-            continue
-        if not line.startswith('# '):
-            return
-        return line.lstrip('# ')
+    from mkdocs.utils import meta
+
+    return meta.get_title(markdown_src)
 
 
 def find_or_create_node(branch, key):
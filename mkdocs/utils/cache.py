@@ -0,0 +1,131 @@
+"""
+A persistent, content-addressed cache of JSON-serializable values.
+
+Entries are stored as individual files named after the hash of their key, so that several
+processes can safely read and write the same cache concurrently. The modification time of
+an entry is updated whenever it is used, which allows the least recently used entries to
+be evicted when the cache grows beyond its maximum size.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+log = logging.getLogger(__name__)
+
+
+class _UnknownIdentity(TypeError):
+    """Raised for a value which can't be told apart from others in a key."""
+
+
+def _json_default(obj):
+    # Functions and classes (e.g. a custom `slugify` for the `toc` extension) are identified by
+    # their import path, as their `repr` contains a memory address which differs on each run.
+    qualname = getattr(obj, '__qualname__', None)
+    if qualname is not None:
+        # Lambdas and nested functions don't have a unique import path.
+        if '<lambda>' in qualname or '<locals>' in qualname:
+            raise _UnknownIdentity(qualname)
+        return f'{getattr(obj, "__module__", "")}.{qualname}'
+    # Instances of Markdown extensions are identified by their class and their config.
+    get_configs = getattr(obj, 'getConfigs', None)
+    if callable(get_configs):
+        return [_json_default(type(obj)), get_configs()]
+    return repr(obj)
+
+
+def get_key(*parts):
+    """
+    Return a hash of the given parts, which may be any (nested) JSON-like values, or `None` if
+    they contain a lambda or a nested function, which can't be identified by their import path.
+    """
+    try:
+        data = json.dumps(parts, sort_keys=True, default=_json_default)
+    except _UnknownIdentity:
+        return None
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class DiskCache:
+    """
+    A cache which stores JSON-serializable values in files within `directory`.
+
+    When `max_size` (in bytes) is set, `prune` removes the least recently used entries until
+    the total size of the cache fits within it.
+    """
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key[:2], f'{key}.json')
+
+    def get(self, key):
+        """Return the value stored for `key`, or `None` if there is none."""
+        path = self._get_path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            # Mark the entry as recently used.
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass
+        return value
+
+    def set(self, key, value):
+        """Store `value` for `key`. Failures to write to the cache are logged and ignored."""
+        path = self._get_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so that a concurrent reader never sees a partial entry.
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(value, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            log.debug(f"Unable to write to the cache in '{self.directory}': {e}")
+
+    def delete(self, key):
+        """Remove the value stored for `key`, if any."""
+        try:
+            os.unlink(self._get_path(key))
+        except OSError:
+            pass
+
+    def prune(self):
+        """Remove the least recently used entries until the cache fits within `max_size`."""
+        if self.max_size is None:
+            return
+        entries = []
+        total = 0
+        for dirpath, dirnames, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:  # pragma: no cover
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        if total <= self.max_size:
+            return
+        entries.sort()
+        for mtime, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:  # pragma: no cover
+                continue
+            total -= size
+        log.debug(f"Pruned the cache in '{self.directory}' to {total} bytes.")
@@ -0,0 +1,105 @@
+"""
+Write precompressed `.gz` companions of the output files of a build.
+
+Web servers such as nginx (with `gzip_static`) serve the `.gz` companion of a file instead of
+compressing the file on each request.
+"""
+
+import gzip
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from mkdocs import utils
+
+log = logging.getLogger(__name__)
+
+
+def get_companion_path(path):
+    """Return the path of the compressed companion of the file at `path`."""
+    return f'{path}.gz'
+
+
+def gzip_bytes(content, filename, level=9, mtime=None):
+    """
+    Return `content` compressed in the gzip format.
+
+    The name (without `.gz`) and modification time which are recorded in the header are
+    `filename` and `mtime`, which defaults to `utils.get_build_timestamp()`, so that the
+    output of a reproducible build is identical.
+    """
+    if mtime is None:
+        mtime = utils.get_build_timestamp()
+    f = io.BytesIO()
+    with gzip.GzipFile(
+        fileobj=f, filename=filename, mode='wb', compresslevel=level, mtime=mtime
+    ) as gz_buf:
+        gz_buf.write(content)
+    return f.getvalue()
+
+
+def is_compressible(path, extensions):
+    """Return True if the file extension of `path` is one of `extensions`."""
+    return os.path.splitext(path)[1].lower() in extensions
+
+
+def compress_file(path, level=9, mtime=None):
+    """
+    Write the compressed companion of the file at `path`, unless it is already up to date.
+
+    The modification time of the companion is set to that of the file: the companion is up
+    to date when the two match. Return True if the companion was written.
+    """
+    gz_path = get_companion_path(path)
+    st = os.stat(path)
+    try:
+        if os.stat(gz_path).st_mtime_ns == st.st_mtime_ns:
+            return False
+    except OSError:
+        pass
+
+    with open(path, 'rb') as f:
+        content = f.read()
+    output = gzip_bytes(content, gz_path, level, mtime)
+    # Write to a temporary file first, so that a web server never serves a partial companion.
+    tmp_path = f'{gz_path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(output)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp_path, gz_path)
+    return True
+
+
+def get_compressible_files(site_dir, extensions):
+    """Return the paths of the files of `site_dir` with one of `extensions`, except hidden ones."""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(site_dir):
+        if dirpath == site_dir:
+            # Hidden files are never written to the site directory. See `utils.clean_directory`.
+            dirnames[:] = [name for name in dirnames if not name.startswith('.')]
+            filenames = [name for name in filenames if not name.startswith('.')]
+        for filename in filenames:
+            if is_compressible(filename, extensions):
+                paths.append(os.path.normpath(os.path.join(dirpath, filename)))
+    return paths
+
+
+def compress_site(site_dir, extensions, level=9, threads=None):
+    """
+    Write the compressed companions of the files of `site_dir` with one of `extensions`.
+
+    The files are compressed by `threads` threads (one for each CPU core by default): the
+    compression runs without holding the GIL, so it is spread across the cores. Return the
+    paths of all the companions, including those which were already up to date.
+    """
+    extensions = tuple(ext.lower() for ext in extensions)
+    paths = get_compressible_files(site_dir, extensions)
+    mtime = utils.get_build_timestamp()
+    threads = threads or os.cpu_count() or 1
+
+    with ThreadPoolExecutor(threads) as executor:
+        written = list(executor.map(lambda path: compress_file(path, level, mtime), paths))
+
+    log.debug(f"Compressed {sum(written)} files, {len(paths) - sum(written)} were up to date.")
+    return {get_companion_path(path) for path in paths}
@@ -0,0 +1,198 @@
+"""
+Look up the entry points of the installed packages, with a cache on disk.
+
+Scanning the metadata of all the installed distributions for the themes and plugins takes
+longer than starting MkDocs itself. The entry points of `GROUPS` are stored in the cache
+directory of the user, with a file for each Python environment, along with a fingerprint of
+the metadata of the distributions in `sys.path`, which changes when a package is installed,
+upgraded or removed. The cache files which haven't been used for `MAX_CACHE_AGE` seconds,
+such as the ones of deleted environments, are removed.
+
+Set the `MKDOCS_NO_ENTRY_POINTS_CACHE` environment variable to disable the cache.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+log = logging.getLogger(__name__)
+
+# The entry point groups which are cached.
+GROUPS = ('mkdocs.plugins', 'mkdocs.themes')
+
+# The entries of the directories of `sys.path` which hold the metadata of distributions.
+_METADATA_SUFFIXES = ('.dist-info', '.egg-info', '.egg-link', '.pth')
+
+# The cache files of the environments which were not used for 30 days are removed.
+MAX_CACHE_AGE = 30 * 24 * 60 * 60
+
+
+def get_cache_dir():
+    """Return the directory of the cache of MkDocs for the current user."""
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'mkdocs')
+
+
+def get_entry_points(group):
+    """Return the entry points of `group`, like `importlib_metadata.entry_points(group=group)`."""
+    if group not in GROUPS or os.environ.get('MKDOCS_NO_ENTRY_POINTS_CACHE'):
+        import importlib_metadata
+
+        return list(importlib_metadata.entry_points(group=group))
+
+    return [_make_entry_point(group, *item) for item in _get_cached_items(group)]
+
+
+def get_entry_point_names(group):
+    """
+    Return the names of the entry points of `group`.
+
+    Unlike `get_entry_points`, this doesn't import `importlib_metadata` when the names are
+    cached, which is enough for the help of the command line.
+    """
+    if group not in GROUPS or os.environ.get('MKDOCS_NO_ENTRY_POINTS_CACHE'):
+        return [ep.name for ep in get_entry_points(group)]
+
+    return [item[0] for item in _get_cached_items(group)]
+
+
+def _get_cached_items(group):
+    """Return the `[name, value, dist_name, dist_path]` of each entry point of `group`."""
+    path = _get_cache_path()
+    fingerprint = _get_fingerprint()
+    data = _read_cache(path)
+    if data is None or data.get('fingerprint') != fingerprint:
+        data = dict(fingerprint=fingerprint, groups=_scan_entry_points())
+        _write_cache(path, data)
+    else:
+        # Mark the file as used, so that it isn't pruned.
+        _touch(path)
+    return data['groups'][group]
+
+
+def _make_entry_point(group, name, value, dist_name, dist_path):
+    """Return an `importlib_metadata.EntryPoint`, with its distribution, from a cached item."""
+    import importlib_metadata
+
+    if dist_path is not None:
+        dist = importlib_metadata.Distribution.at(dist_path)
+    else:
+        dist = importlib_metadata.distribution(dist_name)
+    # This is how `importlib_metadata` attaches the distribution to its entry points.
+    return importlib_metadata.EntryPoint(name, value, group)._for(dist)
+
+
+def _get_cache_path():
+    # A file for each environment, so that environments don't invalidate each other's cache.
+    # The other entries of `sys.path`, like the current directory, are left out so that they
+    # don't multiply the files; they are covered by the fingerprint.
+    site_dirs = [
+        path
+        for path in sys.path
+        if os.path.basename(os.path.normpath(path)) in ('site-packages', 'dist-packages')
+    ]
+    key = hashlib.sha256(json.dumps([sys.prefix, site_dirs]).encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir(), f'entry_points-{key[:16]}.json')
+
+
+def _get_fingerprint():
+    """
+    Return the names and modification times of the metadata of the distributions which are
+    installed in each directory of `sys.path`, or the modification time of other entries.
+
+    The directories without any distributions, like the current directory usually is, are
+    left out, so that they don't change the fingerprint.
+    """
+    fingerprint = []
+    for path in sys.path:
+        try:
+            with os.scandir(path or '.') as entries:
+                metadata = sorted(
+                    [entry.name, entry.stat().st_mtime_ns]
+                    for entry in entries
+                    if entry.name.endswith(_METADATA_SUFFIXES)
+                )
+        except NotADirectoryError:
+            fingerprint.append([os.path.abspath(path), os.stat(path).st_mtime_ns])
+        except OSError:
+            pass
+        else:
+            if metadata:
+                fingerprint.append([os.path.abspath(path or '.'), metadata])
+    return fingerprint
+
+
+def _scan_entry_points():
+    import importlib_metadata
+
+    return {
+        group: [
+            [ep.name, ep.value, ep.dist.name, _get_dist_path(ep.dist)]
+            for ep in importlib_metadata.entry_points(group=group)
+        ]
+        for group in GROUPS
+    }
+
+
+def _get_dist_path(dist):
+    """Return the absolute path of the metadata of a distribution, if it is in a directory."""
+    # `importlib_metadata` doesn't expose the path of a `PathDistribution` publicly.
+    path = getattr(dist, '_path', None)
+    if isinstance(path, os.PathLike):
+        return os.path.abspath(path)
+    return None
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path, data):
+    # The cache is an optimization: failing to write it must not fail the command.
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    except OSError as e:
+        log.debug(f"The entry points could not be cached in '{path}': {e}")
+        return
+    _prune_cache(os.path.dirname(path))
+
+
+def _touch(path):
+    try:
+        if os.stat(path).st_mtime < time.time() - MAX_CACHE_AGE / 2:
+            os.utime(path)
+    except OSError:
+        pass
+
+
+def _prune_cache(directory):
+    """Remove the cache files which were not used for `MAX_CACHE_AGE` seconds."""
+    limit = time.time() - MAX_CACHE_AGE
+    for path in glob.glob(os.path.join(glob.escape(directory), 'entry_points-*.json')):
+        try:
+            if os.stat(path).st_mtime < limit:
+                os.remove(path)
+        except OSError:
+            pass
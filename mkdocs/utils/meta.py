@@ -34,6 +34,7 @@ Extracts, parses and transforms MultiMarkdown style data from documents.
 """
 
 
+import copy
 import re
 
 import yaml
@@ -50,6 +51,33 @@ except ImportError:  # pragma: no cover
 YAML_RE = re.compile(r'^-{3}[ \t]*\n(.*?\n)(?:\.{3}|-{3})[ \t]*\n', re.UNICODE | re.DOTALL)
 META_RE = re.compile(r'^[ ]{0,3}(?P<key>[A-Za-z0-9_-]+):\s*(?P<value>.*)')
 META_MORE_RE = re.compile(r'^([ ]{4}|\t)(\s*)(?P<value>.*)')
+_NEWLINES_RE = re.compile(r'\n*')
+_BLANK_RE = re.compile(r'\s*')
+_LINE_END_RE = re.compile(r'[\r\n]')
+
+# The number of characters which `read_head` reads at first.
+HEAD_SIZE = 4096
+
+# The data of the YAML blocks parsed so far, by block. The front matter of each page is read
+# twice by a build, with the head of the page and then with its source, and the pages generated
+# from a template often share the same front matter, which is then only parsed once. Each page
+# gets a copy of the data, which it may alter.
+_cache = {}
+
+
+def clear_cache():
+    """Forget the YAML blocks parsed so far. This is done at the end of each build."""
+    _cache.clear()
+
+
+def _load_yaml(block):
+    try:
+        return copy.deepcopy(_cache[block])
+    except KeyError:
+        pass
+    data = yaml.load(block, SafeLoader)
+    _cache[block] = copy.deepcopy(data)
+    return data
 
 
 def get_data(doc):
@@ -58,29 +86,83 @@ def get_data(doc):
 
     Returns a tuple of document and a data dict.
     """
-    data = {}
+    doc, start, data, _ = _scan_data(doc)
+    return doc[start:], data
+
+
+def get_data_and_title(doc):
+    """
+    Extract meta-data and the title of a leading H1 from a text document, in one pass.
+
+    Returns a tuple of document, data dict and title, which is None if the document
+    doesn't start with an H1.
+    """
+    doc, start, data, _ = _scan_data(doc)
+    title, _ = _scan_title(doc, start)
+    return doc[start:], data, title
+
+
+def get_title(doc):
+    """Return the title of the H1 which a Markdown document starts with, or None."""
+    return _scan_title(doc, 0)[0]
+
 
+def read_head(path, size=HEAD_SIZE):
+    """
+    Extract meta-data and the title of a leading H1 from the text document at `path`,
+    reading only as much of the file as they take: `size` characters at first, then
+    twice as many as read so far each time that isn't enough.
+
+    Returns a tuple of data dict and title.
+    """
+    with open(path, encoding='utf-8-sig', errors='strict') as f:
+        head = ''
+        while True:
+            chunk = f.read(size)
+            head += chunk
+            doc, start, data, data_end = _scan_data(head)
+            title, title_end = _scan_title(doc, start)
+            # The head holds all of it if something follows the last character scanned.
+            if len(chunk) < size or max(data_end, title_end) < len(doc):
+                return data, title
+            size = len(head)
+
+
+def _scan_data(doc):
+    """
+    Return a tuple of the document, the offset at which its body starts, its data dict and
+    the offset up to which it had to be scanned. The line endings of the document are
+    normalized if it has no YAML meta-data.
+    """
     # First try YAML
     m = YAML_RE.match(doc)
     if m:
         try:
-            data = yaml.load(m.group(1), SafeLoader)
-            if isinstance(data, dict):
-                doc = doc[m.end() :].lstrip('\n')
-            else:
-                data = {}
+            data = _load_yaml(m.group(1))
         except Exception:
-            pass
-        return doc, data
+            return doc, 0, {}, m.end()
+        if not isinstance(data, dict):
+            return doc, 0, {}, m.end()
+        start = _NEWLINES_RE.match(doc, m.end()).end()
+        return doc, start, data, start
 
-    # No YAML delimiters. Try MultiMarkdown style
-    lines = doc.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    # A block of YAML could end further down the document.
+    yaml_end = len(doc) if doc.startswith('---') else 0
 
+    # No YAML delimiters. Try MultiMarkdown style
+    if '\r' in doc:
+        doc = doc.replace('\r\n', '\n').replace('\r', '\n')
+    data = {}
     key = None
-    while lines:
-        line = lines.pop(0)
+    pos = eol = 0
+    while pos <= len(doc):
+        eol = doc.find('\n', pos)
+        if eol == -1:
+            eol = len(doc)
+        line = doc[pos:eol]
 
         if line.strip() == '':
+            pos = eol + 1
             break  # blank line - done
         m1 = META_RE.match(line)
         if m1:
@@ -96,6 +178,23 @@ def get_data(doc):
                 # Add another line to existing key
                 data[key] += ' {}'.format(m2.group('value').strip())
             else:
-                lines.insert(0, line)
                 break  # no meta data - done
-    return '\n'.join(lines).lstrip('\n'), data
+        pos = eol + 1
+    start = _NEWLINES_RE.match(doc, min(pos, len(doc))).end()
+    return doc, start, data, max(yaml_end, eol, start)
+
+
+def _scan_title(doc, pos):
+    """
+    Return a tuple of the title of the H1 which the document starts with from `pos`, or
+    None, and the offset up to which the document had to be scanned.
+
+    The title is the content of the first line which isn't blank, if it is an H1.
+    """
+    first = _BLANK_RE.match(doc, pos).end()
+    m = _LINE_END_RE.search(doc, first)
+    eol = m.start() if m else len(doc)
+    line = doc[first:eol].rstrip()
+    if not line.startswith('# '):
+        return None, eol
+    return line.lstrip('# '), eol
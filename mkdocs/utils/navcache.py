@@ -0,0 +1,234 @@
+"""
+Render the navigation of a site once per build instead of once per page.
+
+The `{% navcache %}...{% endnavcache %}` tag of the `NavCacheExtension` renders its body the
+first time it is used with a given `nav`, and reuses the output for every other page. The
+parts of the output which depend on the page being rendered must be produced by the `url`
+filter and the `nav_active` template function, which leave placeholders in the cached output
+that are filled in for each page:
+
+    {% navcache %}
+    {%- for nav_item in nav %}
+        <a href="{{ nav_item.url|url }}" class="nav-link{{ nav_active(nav_item, ' active') }}">
+    {%- endfor %}
+    {% endnavcache %}
+
+Outside of a `navcache` block, `nav_active(nav_item, text)` returns `text` if the item is
+active. Anything else in the block must not depend on the page, as it is rendered only once.
+
+A block which uses the `page` or `base_url` variables is a syntax error. A block is rendered
+again for each page, without caching, if a template it includes uses them, if the `url` filter
+was replaced after the extension was added (by a plugin, for example), or if the block, or a
+template it includes, reads the `active` attribute of an item directly.
+"""
+
+import threading
+import weakref
+
+from jinja2 import TemplateNotFound, nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+try:
+    from jinja2 import pass_context
+except ImportError:
+    from jinja2 import contextfunction as pass_context
+
+from mkdocs.utils import filters, normalize_url
+
+# Separates the placeholders from the text in the recorded output of a block.
+_MARKER = '\x00'
+
+# The variables of the template context which differ from one page to the other.
+_PAGE_VARIABLES = frozenset(('page', 'base_url'))
+
+
+def _inspect(node):
+    """
+    Return the page variables which the template `node` uses, and the names of the templates
+    it includes, or `None` instead of the names if one of them is only known when rendering.
+    """
+    stored = {name.name for name in node.find_all(nodes.Name) if name.ctx != 'load'}
+    used = {
+        name.name
+        for name in node.find_all(nodes.Name)
+        if name.ctx == 'load' and name.name in _PAGE_VARIABLES and name.name not in stored
+    }
+    includes = []
+    for include in node.find_all(nodes.Include):
+        template = include.template
+        if not isinstance(template, nodes.Const):
+            return used, None
+        if isinstance(template.value, str):
+            includes.append(template.value)
+        else:
+            includes.extend(template.value)
+    return used, includes
+
+
+class NavCacheExtension(Extension):
+    """
+    A Jinja extension which adds the `navcache` tag and the `nav_active` template function,
+    and makes the `url` filter of the environment aware of the tag.
+    """
+
+    tags = {'navcache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        # The recorded output of each block, for each `nav`, as a list which alternates text
+        # and placeholders.
+        self._fragments = weakref.WeakKeyDictionary()
+        # The placeholders of the block which is being recorded by the current thread.
+        self._local = threading.local()
+        # The page variables used by each template, and the templates which it includes.
+        self._templates = {}
+        self._url_filter = environment.filters.get('url', filters.url_filter)
+        environment.filters['url'] = self._url
+        environment.globals['nav_active'] = self._nav_active
+        # Watch the reads of `active` attributes in the templates, which make a block uncacheable.
+        self._getattr = environment.getattr
+        self._getitem = environment.getitem
+        environment.getattr = self._watch_getattr
+        environment.getitem = self._watch_getitem
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        # Identify the block by its template and its position among the blocks of the template.
+        index = parser.navcache_blocks = getattr(parser, 'navcache_blocks', 0) + 1
+        body = parser.parse_statements(['name:endnavcache'], drop_needle=True)
+        used, includes = _inspect(nodes.Template(body))
+        if used:
+            parser.fail(
+                f"The 'navcache' block uses the '{sorted(used)[0]}' variable, which differs "
+                f"from one page to the other, but it is rendered only once. Use the 'url' "
+                f"filter and the 'nav_active' function instead.",
+                lineno,
+            )
+        key = nodes.Const(f'{parser.name}:{index}')
+        args = [
+            nodes.ContextReference(),
+            key,
+            nodes.Const(None if includes is None else tuple(includes)),
+        ]
+        call = self.call_method('_render', args)
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render(self, context, key, includes, caller):
+        nav = context.get('nav')
+        if (
+            nav is None
+            or self._recording is not None
+            # A `url` filter replaced by a plugin doesn't leave placeholders.
+            or self.environment.filters.get('url') != self._url
+        ):
+            return caller()
+
+        fragments = self._fragments.setdefault(nav, {})
+        parts = fragments.get(key)
+        if parts is False:
+            # The block depends on the page in a way that can't be cached.
+            return caller()
+        if parts is None:
+            if self._includes_page(includes):
+                fragments[key] = False
+                return caller()
+            self._recording = []
+            self._local.uncacheable = False
+            try:
+                output = caller()
+            finally:
+                placeholders, self._recording = self._recording, None
+            parts = output.split(_MARKER)
+            for i in range(1, len(parts), 2):
+                parts[i] = placeholders[int(parts[i])]
+            fragments[key] = False if self._local.uncacheable else parts
+
+        resolve = self._get_resolver(context)
+        output = ''.join(part if i % 2 == 0 else resolve(*part) for i, part in enumerate(parts))
+        if context.eval_ctx.autoescape:
+            return Markup(output)
+        return output
+
+    def _includes_page(self, names, seen=None):
+        """
+        Return whether one of the templates `names`, or a template which it includes, uses the
+        page variables. `names` is `None` if the included templates aren't known.
+        """
+        if names is None:
+            return True
+        seen = set() if seen is None else seen
+        for name in names:
+            if name in seen:
+                continue
+            seen.add(name)
+            if name not in self._templates:
+                try:
+                    source, filename, _ = self.environment.loader.get_source(self.environment, name)
+                except TemplateNotFound:
+                    # Jinja reports the missing template when the block is rendered.
+                    self._templates[name] = (set(), [])
+                    continue
+                self._templates[name] = _inspect(self.environment.parse(source, name, filename))
+            used, includes = self._templates[name]
+            if used or self._includes_page(includes, seen):
+                return True
+        return False
+
+    @property
+    def _recording(self):
+        return getattr(self._local, 'recording', None)
+
+    @_recording.setter
+    def _recording(self, value):
+        self._local.recording = value
+
+    def _watch_getattr(self, obj, attribute):
+        if attribute == 'active' and self._recording is not None:
+            self._local.uncacheable = True
+        return self._getattr(obj, attribute)
+
+    def _watch_getitem(self, obj, argument):
+        if argument == 'active' and self._recording is not None:
+            self._local.uncacheable = True
+        return self._getitem(obj, argument)
+
+    def _placeholder(self, *placeholder):
+        self._recording.append(placeholder)
+        return f'{_MARKER}{len(self._recording) - 1}{_MARKER}'
+
+    def _get_resolver(self, context):
+        """Return a function which returns the value of a placeholder for the current page."""
+        if self._url_filter is filters.url_filter:
+            # Skip the lookups of the filter in the context for each URL.
+            page, base = context['page'], context['base_url']
+
+            def url(value):
+                return normalize_url(value, page=page, base=base)
+
+        else:
+
+            def url(value):
+                return self._url_filter(context, value)
+
+        def resolve(kind, *args):
+            if kind == 'url':
+                return url(*args)
+            nav_item, text, inactive_text = args
+            return text if nav_item.active else inactive_text
+
+        return resolve
+
+    @pass_context
+    def _url(self, context, value):
+        """The `url` filter, relative to the current page."""
+        if self._recording is not None:
+            return self._placeholder('url', value)
+        return self._url_filter(context, value)
+
+    @pass_context
+    def _nav_active(self, context, nav_item, text, inactive_text=''):
+        """Return `text` if the navigation item is active, and `inactive_text` otherwise."""
+        if self._recording is not None:
+            return self._placeholder('active', nav_item, text, inactive_text)
+        return text if nav_item.active else inactive_text
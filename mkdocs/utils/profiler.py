@@ -0,0 +1,208 @@
+"""
+Measure where the time of a build goes.
+
+A `BuildProfiler` records the wall and CPU time of each phase of the build, of each step of
+the build of each page and of each template, and `EventTimings` records the time spent in
+the methods of each plugin. At the end of the build, they write a JSON report and log summary
+tables.
+"""
+
+import contextlib
+import json
+import logging
+import time
+
+import mkdocs
+
+log = logging.getLogger(__name__)
+
+# The steps of the build of a page, in order.
+PAGE_STEPS = ('read', 'markdown', 'render', 'template', 'write')
+
+
+def _new_timing():
+    return {'wall': 0.0, 'cpu': 0.0}
+
+
+class BuildProfiler:
+    """
+    Record the wall and CPU time spent in the phases, pages and templates of a build.
+
+    The CPU time is the time of the current process, including all of its threads. The time of
+    the steps which run in worker processes (see the `jobs` option) is measured in the worker.
+
+    A disabled profiler records nothing, so that the build can be instrumented unconditionally.
+    """
+
+    def __init__(self, enabled=True, slowest=10):
+        self.enabled = enabled
+        self.slowest = slowest
+        self.phases = {}
+        self.pages = {}
+        self.templates = {}
+        self._start = (time.perf_counter(), time.process_time())
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Record the time spent in the block as the build phase `name`."""
+        with self._timed(self.phases, name):
+            yield
+
+    @contextlib.contextmanager
+    def page_step(self, src_uri, step):
+        """Record the time spent in the block as `step` of the build of the page `src_uri`."""
+        if not self.enabled:
+            yield
+            return
+        with self._timed(self.pages.setdefault(src_uri, {}), step):
+            yield
+
+    @contextlib.contextmanager
+    def template(self, name):
+        """Record the time spent in the block as the build of the template `name`."""
+        with self._timed(self.templates, name):
+            yield
+
+    def add_page_step(self, src_uri, step, wall, cpu):
+        """Record a time which was measured elsewhere, e.g. in a worker process."""
+        if self.enabled:
+            self._add(self.pages.setdefault(src_uri, {}), step, wall, cpu)
+
+    @contextlib.contextmanager
+    def _timed(self, timings, name):
+        if not self.enabled:
+            yield
+            return
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self._add(timings, name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    @staticmethod
+    def _add(timings, name, wall, cpu):
+        timing = timings.setdefault(name, _new_timing())
+        timing['wall'] += wall
+        timing['cpu'] += cpu
+
+    def get_report(self):
+        """Return the recorded times as a JSON-serializable dict."""
+        wall, cpu = self._start
+        pages = {}
+        for src_uri, steps in self.pages.items():
+            total = _new_timing()
+            for timing in steps.values():
+                total['wall'] += timing['wall']
+                total['cpu'] += timing['cpu']
+            pages[src_uri] = {
+                'steps': {step: steps[step] for step in PAGE_STEPS if step in steps},
+                'total': total,
+            }
+        slowest = sorted(pages, key=lambda src_uri: pages[src_uri]['total']['wall'], reverse=True)
+        return {
+            'mkdocs_version': mkdocs.__version__,
+            'total': {'wall': time.perf_counter() - wall, 'cpu': time.process_time() - cpu},
+            'phases': self.phases,
+            'templates': self.templates,
+            'pages': pages,
+            'slowest_pages': [
+                dict(src_uri=src_uri, **pages[src_uri]['total'])
+                for src_uri in slowest[: self.slowest]
+            ],
+        }
+
+    def write_report(self, path, report=None):
+        """Write the report to `path` as JSON."""
+        if report is None:
+            report = self.get_report()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    def log_summary(self, report=None):
+        """Log a table of the time spent in each phase, and the slowest pages."""
+        if report is None:
+            report = self.get_report()
+        total = report['total']['wall'] or 1.0
+        lines = [f"{'Build phase':<24} {'Wall (s)':>10} {'CPU (s)':>10} {'Wall %':>7}"]
+        for name, timing in report['phases'].items():
+            percent = 100 * timing['wall'] / total
+            lines.append(
+                f"{name:<24} {timing['wall']:>10.3f} {timing['cpu']:>10.3f} {percent:>6.1f}%"
+            )
+        lines.append(
+            f"{'total':<24} {report['total']['wall']:>10.3f} {report['total']['cpu']:>10.3f}"
+        )
+        if report['slowest_pages']:
+            lines.append('')
+            lines.append(f"{'Slowest pages':<24} {'Wall (s)':>10} {'CPU (s)':>10}")
+            for page in report['slowest_pages']:
+                lines.append(f"{page['src_uri']:<24} {page['wall']:>10.3f} {page['cpu']:>10.3f}")
+        log.info('Build profile:\n' + '\n'.join(lines))
+
+
+class EventTimings:
+    """
+    Record the time spent in each method of each plugin, for each event.
+
+    Set an instance as the `timings` attribute of a `PluginCollection` to record the time of
+    the methods it runs. For each plugin and event, the number of calls, the total and maximum
+    time, and the time spent for each page (for the events which relate to a page) are
+    recorded.
+    """
+
+    def __init__(self):
+        self.plugins = {}
+
+    def add(self, plugin, event, seconds, page=None):
+        """Record a call to the method of `plugin` for `event` which took `seconds`."""
+        timing = self.plugins.setdefault(plugin, {}).get(event)
+        if timing is None:
+            timing = self.plugins[plugin][event] = {
+                'count': 0,
+                'total': 0.0,
+                'max': 0.0,
+                'pages': {},
+            }
+        timing['count'] += 1
+        timing['total'] += seconds
+        timing['max'] = max(timing['max'], seconds)
+        if page is not None:
+            timing['pages'][page] = timing['pages'].get(page, 0.0) + seconds
+
+    def get_report(self):
+        """
+        Return the recorded times as a JSON-serializable dict, with the times of each plugin
+        method (`plugins`) and of all plugins for each event (`events`).
+        """
+        events = {}
+        for plugin_events in self.plugins.values():
+            for event, timing in plugin_events.items():
+                total = events.setdefault(event, {'count': 0, 'total': 0.0, 'max': 0.0})
+                total['count'] += timing['count']
+                total['total'] += timing['total']
+                total['max'] = max(total['max'], timing['max'])
+        return {'plugins': self.plugins, 'events': events}
+
+    def log_summary(self, report=None, limit=10):
+        """Log a table of the `limit` plugin methods which took the most time."""
+        if report is None:
+            report = self.get_report()
+        methods = [
+            (plugin, event, timing)
+            for plugin, plugin_events in report['plugins'].items()
+            for event, timing in plugin_events.items()
+        ]
+        if not methods:
+            return
+        methods.sort(key=lambda method: method[2]['total'], reverse=True)
+        lines = [
+            f"{'Plugin event':<40} {'Calls':>7} {'Total (s)':>10} {'Max (s)':>10} Slowest page"
+        ]
+        for plugin, event, timing in methods[:limit]:
+            pages = timing['pages']
+            slowest = max(pages, key=pages.get) if pages else ''
+            lines.append(
+                f"{plugin + ' on_' + event:<40} {timing['count']:>7} {timing['total']:>10.3f} "
+                f"{timing['max']:>10.3f} {slowest:<24}".rstrip()
+            )
+        log.info('Plugin events profile:\n' + '\n'.join(lines))
@@ -0,0 +1,114 @@
+"""
+Write the sitemap of a site to disk as it is rendered.
+
+The sitemaps protocol limits a sitemap to `MAX_URLS` URLs. The pages of a larger site are split
+into shards (`sitemap-1.xml`, `sitemap-2.xml`, ...) which are listed by a sitemap index in
+`sitemap.xml`. See https://www.sitemaps.org/protocol.html.
+"""
+
+import contextlib
+import filecmp
+import gzip
+import os
+
+from markupsafe import escape
+
+from mkdocs import utils
+
+# The maximum number of URLs in a sitemap.
+MAX_URLS = 50000
+
+
+def get_shard_names(page_count, max_urls=None):
+    """Return the file names of the shards of the sitemap, or `[]` if it fits in one file."""
+    max_urls = max_urls or MAX_URLS
+    if page_count <= max_urls:
+        return []
+    return [f'sitemap-{i + 1}.xml' for i in range(-(-page_count // max_urls))]
+
+
+def get_shards(pages, max_urls=None):
+    """Return a list of `(name, pages)` for each shard of the sitemap."""
+    max_urls = max_urls or MAX_URLS
+    return [
+        (name, pages[i * max_urls : (i + 1) * max_urls])
+        for i, name in enumerate(get_shard_names(len(pages), max_urls))
+    ]
+
+
+def get_index(shards, site_url):
+    """Yield the sitemap index of `shards`, a list of `(name, pages)`, in chunks."""
+    base_url = site_url or '/'
+    if not base_url.endswith('/'):
+        base_url += '/'
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+    yield '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    for name, pages in shards:
+        yield f'    <sitemap>\n         <loc>{escape(base_url + name)}</loc>\n'
+        lastmod = max((file.page.update_date or '' for file in pages), default='')
+        if lastmod:
+            yield f'         <lastmod>{lastmod}</lastmod>\n'
+        yield '    </sitemap>\n'
+    yield '</sitemapindex>\n'
+
+
+def write(chunks, output_path, compress=True, skip_unchanged=False):
+    """
+    Write the text `chunks` to `output_path` as they are produced, along with a gzipped copy
+    if `compress` is true. Return the paths of the files, or `[]` if the output is blank.
+
+    With `skip_unchanged`, a file which already exists with the same content is not touched.
+    """
+    paths = [output_path]
+    if compress:
+        paths.append(f'{output_path}.gz')
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    blank = True
+    try:
+        with contextlib.ExitStack() as stack:
+            f = stack.enter_context(open(f'{output_path}.tmp', 'wb'))
+            gz_file = None
+            if compress:
+                gz_file = stack.enter_context(
+                    gzip.GzipFile(
+                        filename=paths[1],
+                        mode='wb',
+                        mtime=utils.get_build_timestamp(),
+                        fileobj=stack.enter_context(open(f'{paths[1]}.tmp', 'wb')),
+                    )
+                )
+            for chunk in chunks:
+                blank = blank and not chunk.strip()
+                data = chunk.encode('utf-8')
+                f.write(data)
+                if gz_file is not None:
+                    gz_file.write(data)
+    except BaseException:
+        _remove_temporary_files(paths)
+        raise
+
+    if blank:
+        _remove_temporary_files(paths)
+        return []
+    for path in paths:
+        if skip_unchanged and _is_same_file(f'{path}.tmp', path):
+            os.remove(f'{path}.tmp')
+        else:
+            os.replace(f'{path}.tmp', path)
+    return paths
+
+
+def _remove_temporary_files(paths):
+    for path in paths:
+        try:
+            os.remove(f'{path}.tmp')
+        except OSError:
+            pass
+
+
+def _is_same_file(tmp_path, path):
+    try:
+        return filecmp.cmp(tmp_path, path, shallow=False)
+    except OSError:
+        return False
@@ -0,0 +1,162 @@
+"""
+Write the output files of a build in background threads.
+
+The render loop of the build hands the content of each output file to a `BackgroundWriter`,
+which writes it to disk while the next page is being rendered.
+"""
+
+import filecmp
+import logging
+import os
+import queue
+import threading
+
+from mkdocs import utils
+
+log = logging.getLogger(__name__)
+
+
+class BackgroundWriter:
+    """
+    Write and copy files in `threads` background threads.
+
+    All operations on the same output path are performed by the same thread, in the order in
+    which they were requested, so that a file with a higher precedence still overwrites one
+    with a lower precedence. Each thread has a queue of at most `max_pending` operations:
+    when it is full, the caller blocks until the thread catches up.
+
+    With `threads=0`, all operations are performed synchronously by the caller instead.
+
+    Files are copied in the `copy_mode`, one of `utils.COPY_MODES` (see `utils.copy_file`).
+
+    With `skip_unchanged`, a file which already exists with the same content is not touched,
+    so that its modification time is preserved. The `outputs` attribute holds the normalized
+    paths of all the files which were written, copied or skipped.
+
+    Errors are collected and raised by `close`, which waits for all pending operations to
+    complete. The writer can also be used as a context manager.
+    """
+
+    def __init__(self, threads=4, max_pending=16, skip_unchanged=False, copy_mode='copy'):
+        self.skip_unchanged = skip_unchanged
+        self.copy_mode = copy_mode
+        self.outputs = set()
+        self._queues = [queue.Queue(max_pending) for _ in range(threads)]
+        self._threads = [
+            threading.Thread(target=self._run, args=(q,), name='mkdocs-writer', daemon=True)
+            for q in self._queues
+        ]
+        # The directories which are known to exist, to avoid calling `os.makedirs` for each file.
+        self._dirs = set()
+        self._dirs_lock = threading.Lock()
+        self._closed = False
+        self.errors = []
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Don't hide the error which interrupted the build behind a write error.
+        self.close(raise_errors=exc_type is None)
+
+    def write_file(self, content, output_path):
+        """Write content to output_path, making sure any parent directories exist."""
+        self._submit(output_path, self._write_file, content, output_path)
+
+    def copy_file(self, source_path, output_path):
+        """
+        Copy source_path to output_path, making sure any parent directories exist.
+
+        The output_path may be a directory.
+        """
+        self._submit(output_path, self._copy_file, source_path, output_path)
+
+    def add_output(self, output_path):
+        """Record output_path as an output, for a file which was written without the writer."""
+        self.outputs.add(os.path.normpath(output_path))
+
+    def close(self, raise_errors=True):
+        """Wait for all pending operations to complete and raise the first error, if any."""
+        if not self._closed:
+            self._closed = True
+            for q in self._queues:
+                q.put(None)
+            for thread in self._threads:
+                thread.join()
+        if self.errors:
+            for path, error in self.errors:
+                log.error(f"Error writing '{path}': {error}")
+            error = self.errors[0][1]
+            self.errors = []
+            if raise_errors:
+                raise error
+
+    def _submit(self, output_path, func, *args):
+        if self._closed:
+            raise ValueError("The writer is closed.")
+        output_path = os.path.normpath(output_path)
+        self.outputs.add(output_path)
+        if not self._queues:
+            try:
+                func(*args)
+            except Exception as e:
+                self.errors.append((output_path, e))
+            return
+        q = self._queues[hash(output_path) % len(self._queues)]
+        q.put((output_path, func, args))
+
+    def _run(self, q):
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            output_path, func, args = item
+            try:
+                func(*args)
+            except Exception as e:
+                self.errors.append((output_path, e))
+
+    def _makedirs(self, directory):
+        with self._dirs_lock:
+            if directory in self._dirs:
+                return
+        os.makedirs(directory, exist_ok=True)
+        with self._dirs_lock:
+            self._dirs.add(directory)
+
+    def _write_file(self, content, output_path):
+        if self.skip_unchanged and _has_content(output_path, content):
+            return
+        self._makedirs(os.path.dirname(output_path))
+        utils.unlink_hardlink(output_path)
+        with open(output_path, 'wb') as f:
+            f.write(content)
+
+    def _copy_file(self, source_path, output_path):
+        self._makedirs(os.path.dirname(output_path))
+        if os.path.isdir(output_path):
+            output_path = os.path.join(output_path, os.path.basename(source_path))
+        if self.skip_unchanged and _is_same_file(source_path, output_path):
+            return
+        utils.publish_file(source_path, output_path, self.copy_mode)
+
+
+def _has_content(path, content):
+    """Return True if the file at `path` exists and contains exactly `content`."""
+    try:
+        if os.path.getsize(path) != len(content):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == content
+    except OSError:
+        return False
+
+
+def _is_same_file(source_path, output_path):
+    """Return True if the file at `output_path` exists and has the same content as `source_path`."""
+    try:
+        return filecmp.cmp(source_path, output_path, shallow=False)
+    except OSError:
+        return False